@@ -0,0 +1,499 @@
+import bisect
+import hashlib
+import json
+import math
+import os
+import random
+import re
+import struct
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "demos"))
+
+from shared.cards import deck_commitment
+from shared.loot_table import RARITY_TABLE
+from shared.random_provider import GAME_ADDR
+from shared.simulator import MoveAbort, RandomnessSimulator
+
+# Local stand-in for a Cedra node, for offline benchmarks.
+#
+# Serves the REST routes the providers use: ledger info, gas estimate,
+# accounts, BCS transaction submission, by_hash / wait_by_hash, account
+# transactions, resources (at a ledger version) and view functions.
+# Submitted game transactions are "executed" with the bit-exact simulator,
+# so results, events and resources look like the deployed modules' output.
+# Sequence numbers are enforced like a real mempool: a used one is rejected
+# and one past a gap waits until the gap is filled. Signatures are not checked.
+#
+#   python scripts/bench/mock_node.py --port 8080 --latency 0.005 --commit-latency 0.25
+#   CEDRA_NODE_URL=http://127.0.0.1:8080 INFERENCO_RANDOM_BACKEND=native python scripts/demos/dice_roll.py
+
+CHAIN_ID = 4
+GAS_PRICE = 100
+MAX_BATCH = 256  # game_batches::MAX_BATCH
+E_INVALID_BATCH = 1
+
+_U64 = struct.Struct("<Q")
+
+
+class _Reader:
+    def __init__(self, data):
+        self.data = data
+        self.pos = 0
+
+    def take(self, n):
+        out = self.data[self.pos:self.pos + n]
+        if len(out) != n:
+            raise ValueError("truncated transaction")
+        self.pos += n
+        return out
+
+    def uleb128(self):
+        value = shift = 0
+        while True:
+            byte = self.take(1)[0]
+            value |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                return value
+            shift += 7
+
+    def u64(self):
+        return _U64.unpack(self.take(8))[0]
+
+    def bytes(self):
+        return self.take(self.uleb128())
+
+    def address(self):
+        return "0x" + self.take(32).hex()
+
+
+def decode_entry_function(signed_txn):
+    """`(sender, sequence_number, function_id, args)` of a BCS SignedTransaction.
+
+    `args` are the raw BCS bytes of each argument.
+    """
+    r = _Reader(signed_txn)
+    sender = r.address()
+    sequence_number = r.u64()
+    if r.uleb128() != 2:
+        raise ValueError("only entry-function payloads are supported")
+    address = r.address()
+    module = r.bytes().decode()
+    function = r.bytes().decode()
+    if r.uleb128() != 0:
+        raise ValueError("type arguments are not supported")
+    args = [r.bytes() for _ in range(r.uleb128())]
+    return sender, sequence_number, f"{address}::{module}::{function}", args
+
+
+def _u64_arg(arg):
+    return _U64.unpack(arg[:8])[0]
+
+
+def _attack(seed, min_dmg, max_dmg, crit_chance):
+    damage = min_dmg + (seed // 100) % 100 * (max_dmg - min_dmg) // 100
+    is_crit = seed % 100 < crit_chance
+    return {"damage": str(damage * 2 if is_crit else damage), "is_crit": is_crit}
+
+
+def _loot_item(sim, box_index=None):
+    rarity = RARITY_TABLE.sample(sim)
+    item = {"item_id": str(sim.u64_range(1000, 10000)), "rarity": str(rarity), "power": str(sim.u64_range(10, 101))}
+    if box_index is not None:
+        item["box_index"] = str(box_index)
+    return item
+
+
+# Entry functions: fn(sim, sender, args) -> (events, resources), where events are
+# (type, data) pairs and resources a {resource_type: data} dict written to the sender.
+
+def _roll_dice(sim, sender, args):
+    roll = sim.dice_roll(_u64_arg(args[0]))
+    return [], {f"{GAME_ADDR}::game_examples::DiceGame": {"last_roll": str(roll)}}
+
+
+def _open_loot_box(sim, sender, args):
+    event_type = f"{GAME_ADDR}::game_examples::LootBoxOpened"
+    return [(event_type, dict(_loot_item(sim), player=sender)) for _ in range(_u64_arg(args[0]))], {}
+
+
+def _start_card_game(sim, sender, args):
+    hand = sim.permutation(52)[:2]
+    return [], {f"{GAME_ADDR}::game_examples::CardGame": {"player_hand": [str(c) for c in hand]}}
+
+
+def _start_session(sim, sender, args):
+    deck = sim.permutation(52)
+    commitment = "0x" + deck_commitment(deck).hex()
+    return [(f"{GAME_ADDR}::card_sessions::SessionStarted",
+             {"player": sender, "session_id": "0", "commitment": commitment})], \
+        {f"{GAME_ADDR}::card_sessions::CardSession": {"session_id": "0", "deck": [str(c) for c in deck],
+                                                      "commitment": commitment}}
+
+
+def _roll_dice_batch(sim, sender, args):
+    count, sides = map(_u64_arg, args)
+    rolls = [str(sim.dice_roll(sides)) for _ in range(count)]
+    return [(f"{GAME_ADDR}::game_batches::DiceBatchRolled",
+             {"player": sender, "sides": str(sides), "rolls": rolls})], {}
+
+
+def _attack_batch(sim, sender, args):
+    count, min_dmg, max_dmg, crit_chance = map(_u64_arg, args)
+    outcomes = [_attack(sim.dice_roll(10000), min_dmg, max_dmg, crit_chance) for _ in range(count)]
+    return [(f"{GAME_ADDR}::game_batches::AttackBatchResolved", {"player": sender, "outcomes": outcomes})], {}
+
+
+def _open_loot_boxes(sim, sender, args):
+    boxes, per_box = map(_u64_arg, args)
+    if not (0 < boxes <= MAX_BATCH and 0 < per_box <= MAX_BATCH and boxes * per_box <= MAX_BATCH):
+        raise MoveAbort(E_INVALID_BATCH)
+    items = [_loot_item(sim, box) for box in range(boxes) for _ in range(per_box)]
+    return [(f"{GAME_ADDR}::game_batches::LootBoxesOpened", {"player": sender, "items": items})], {}
+
+
+def _request_bytes(sim, sender, args):
+    data = sim.bytes(_u64_arg(args[0]))
+    return [(f"{GAME_ADDR}::entropy::EntropyBlock", {"requester": sender, "bytes": "0x" + data.hex()})], {}
+
+
+ENTRY_FUNCTIONS = {
+    f"{GAME_ADDR}::game_examples::roll_dice": _roll_dice,
+    f"{GAME_ADDR}::game_examples::open_loot_box": _open_loot_box,
+    f"{GAME_ADDR}::game_examples::start_card_game": _start_card_game,
+    f"{GAME_ADDR}::card_sessions::start_session": _start_session,
+    f"{GAME_ADDR}::game_batches::roll_dice_batch": _roll_dice_batch,
+    f"{GAME_ADDR}::game_batches::attack_batch": _attack_batch,
+    f"{GAME_ADDR}::game_batches::open_loot_boxes": _open_loot_boxes,
+    f"{GAME_ADDR}::entropy::request_bytes": _request_bytes,
+}
+
+
+class Rejected(Exception):
+    """A submission the node turns away before it reaches the mempool."""
+
+    def __init__(self, message, error_code, vm_error_code=None):
+        super().__init__(message)
+        self.error_code = error_code
+        self.vm_error_code = vm_error_code
+
+
+def _session_view(read):
+    def view(node, args, version):
+        resource = node.resource(args[0], f"{GAME_ADDR}::card_sessions::CardSession", version)
+        if resource is None:
+            raise ValueError("Move abort: E_NO_SESSION")
+        return read(resource["data"], args)
+    return view
+
+
+class _Transaction:
+    __slots__ = ("hash", "version", "sender", "sequence_number", "function", "args", "committed_at",
+                 "timestamp_us", "events", "success", "vm_status", "_body")
+
+    def __init__(self, tx_hash, sender, sequence_number, function, args):
+        self.hash = tx_hash
+        self.sender = sender
+        self.sequence_number = sequence_number
+        self.function = function
+        self.args = args
+        # Set once the transaction leaves the mempool and is executed.
+        self.version = None
+        self.committed_at = math.inf
+        self.timestamp_us = None
+        self.events = []
+        self.success = True
+        self.vm_status = "Executed successfully"
+        self._body = None
+
+    def body(self):
+        if self._body is None:
+            self._body = json.dumps({
+                "type": "user_transaction",
+                "hash": self.hash,
+                "version": str(self.version),
+                "sender": self.sender,
+                "sequence_number": str(self.sequence_number),
+                "success": self.success,
+                "vm_status": self.vm_status,
+                "timestamp": str(self.timestamp_us),
+                "payload": {"type": "entry_function_payload", "function": self.function},
+                "events": [
+                    {"guid": {"creation_number": "0", "account_address": "0x0"},
+                     "sequence_number": "0", "type": event_type, "data": data}
+                    for event_type, data in self.events
+                ],
+            }).encode()
+        return self._body
+
+    def pending_body(self):
+        return json.dumps({"type": "pending_transaction", "hash": self.hash, "sender": self.sender,
+                           "sequence_number": str(self.sequence_number)}).encode()
+
+
+class MockNode:
+    """In-memory chain state behind the mock REST API.
+
+    `latency` seconds (plus up to `jitter`) are added to every request, and a
+    submitted transaction commits `commit_latency` seconds after it arrives.
+    """
+
+    def __init__(self, latency=0.0, commit_latency=0.0, jitter=0.0, module_address=GAME_ADDR):
+        self.latency = latency
+        self.commit_latency = commit_latency
+        self.jitter = jitter
+        self.module_address = module_address
+        self.entry_functions = dict(ENTRY_FUNCTIONS)
+        self.views = {
+            "0x1::account::get_sequence_number": lambda node, args, version: [str(node.sequence_number(args[0]))],
+            "0x1::timestamp::now_microseconds": lambda node, args, version: [str(int(time.time() * 1e6))],
+            f"{GAME_ADDR}::card_sessions::deck": _session_view(lambda session, args: [session["deck"]]),
+            f"{GAME_ADDR}::card_sessions::session":
+                _session_view(lambda session, args: [session["session_id"], session["commitment"]]),
+            f"{GAME_ADDR}::card_sessions::cards": _session_view(
+                lambda session, args: [session["deck"][int(args[1]):int(args[1]) + int(args[2])]]),
+        }
+        self.requests = 0
+        # The next `lose` submissions are accepted but dropped before they reach a block.
+        self.lose = 0
+        # The next `stall` submissions never reach the mempool: the request is held for
+        # `stall_seconds` and the connection closed unanswered, like a network timeout.
+        self.stall = 0
+        self.stall_seconds = 2.0
+        self._transactions = {}
+        self._by_sender = {}
+        self._sequence = {}  # next sequence number each account's mempool accepts
+        self._parked = {}    # sender -> {sequence_number: tx} waiting for a gap to fill
+        self._resources = {}
+        self._version = 0
+        self._lock = threading.Lock()
+
+    # Chain state
+
+    def sequence_number(self, address):
+        """The account's committed sequence number, as `/accounts/{address}` reports it."""
+        now = time.monotonic()
+        with self._lock:
+            # Transactions execute in sequence order, so the committed ones are a prefix.
+            return sum(1 for tx in self._by_sender.get(address.lower(), ()) if tx.committed_at <= now)
+
+    def submit(self, signed_txn):
+        """Accept a signed transaction and return it; raises Rejected if it can't go in."""
+        sender, sequence_number, function, args = decode_entry_function(signed_txn)
+        tx_hash = "0x" + hashlib.sha3_256(signed_txn).hexdigest()
+        with self._lock:
+            if tx_hash in self._transactions:
+                return self._transactions[tx_hash]
+            expected = self._sequence.get(sender, 0)
+            if sequence_number < expected:
+                raise Rejected(f"Invalid transaction: Type: Validation Code: SEQUENCE_NUMBER_TOO_OLD "
+                               f"(got {sequence_number}, next is {expected})", "vm_error", 3)
+            tx = _Transaction(tx_hash, sender, sequence_number, function, args)
+            if self.lose:
+                self.lose -= 1
+                return tx
+            self._transactions[tx_hash] = tx
+            parked = self._parked.setdefault(sender, {})
+            parked[sequence_number] = tx
+            while expected in parked:
+                self._execute(parked.pop(expected))
+                expected += 1
+            self._sequence[sender] = expected
+        return tx
+
+    def _execute(self, tx):
+        # Caller holds self._lock. Versions are handed out under it, so each history stays sorted.
+        self._version += 1
+        tx.version = self._version
+        tx.committed_at = time.monotonic() + self.commit_latency
+        tx.timestamp_us = int((time.time() + self.commit_latency) * 1e6)
+        execute = self.entry_functions.get(tx.function)
+        resources = {}
+        if execute is None:
+            tx.success = False
+            tx.vm_status = "FUNCTION_RESOLUTION_FAILURE"
+        else:
+            sim = RandomnessSimulator(tx.hash, tx.timestamp_us, module_address=self.module_address)
+            try:
+                tx.events, resources = execute(sim, tx.sender, tx.args)
+            except Exception as e:
+                tx.success = False
+                tx.vm_status = f"Move abort: {e}"
+        for resource_type, data in resources.items():
+            versions, writes = self._resources.setdefault((tx.sender, resource_type), ([], []))
+            versions.append(tx.version)
+            writes.append((tx, data))
+        self._by_sender.setdefault(tx.sender, []).append(tx)
+
+    def transaction(self, tx_hash):
+        with self._lock:
+            return self._transactions.get(tx_hash)
+
+    def resource(self, address, resource_type, ledger_version=None):
+        now = time.monotonic()
+        with self._lock:
+            history = self._resources.get((address.lower(), resource_type))
+            if history is None:
+                return None
+            versions, writes = history
+            i = bisect.bisect_right(versions, ledger_version if ledger_version is not None else self._version)
+            while i > 0 and writes[i - 1][0].committed_at > now:
+                i -= 1
+            if i == 0:
+                return None
+            return {"type": resource_type, "data": writes[i - 1][1]}
+
+    def account_transactions(self, address, start, limit):
+        now = time.monotonic()
+        with self._lock:
+            txs = [tx for tx in self._by_sender.get(address.lower(), ())
+                   if tx.sequence_number >= start and tx.committed_at <= now]
+        txs.sort(key=lambda tx: tx.sequence_number)
+        return [json.loads(tx.body()) for tx in txs[:limit]]
+
+    def ledger_info(self):
+        with self._lock:
+            version = self._version
+        return {"chain_id": CHAIN_ID, "ledger_version": str(version), "ledger_timestamp": str(int(time.time() * 1e6))}
+
+    # HTTP
+
+    def serve(self, port=0, host="127.0.0.1"):
+        """Start serving from a daemon thread; returns the server (its port is `server.server_port`)."""
+        server = ThreadingHTTPServer((host, port), _handler(self))
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name="mock-node", daemon=True).start()
+        return server
+
+
+_WAIT = re.compile(r"^/transactions/(wait_by_hash|by_hash)/(0x[0-9a-fA-F]+)$")
+_ACCOUNT = re.compile(r"^/accounts/(0x[0-9a-fA-F]+)(/transactions|/resource/(.+))?$")
+
+
+def _handler(node):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _reply(self, status, payload):
+            body = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _not_found(self, error_code, message):
+            self._reply(404, {"message": message, "error_code": error_code})
+
+        def _delay(self):
+            node.requests += 1
+            delay = node.latency + (random.random() * node.jitter if node.jitter else 0.0)
+            if delay > 0:
+                time.sleep(delay)
+
+        def do_GET(self):
+            self._delay()
+            parts = urlsplit(self.path)
+            path, query = parts.path, parse_qs(parts.query)
+            if path == "/":
+                return self._reply(200, node.ledger_info())
+            if path == "/estimate_gas_price":
+                return self._reply(200, {"gas_estimate": GAS_PRICE})
+
+            match = _WAIT.match(path)
+            if match:
+                return self._transaction(match.group(2), wait=match.group(1) == "wait_by_hash")
+
+            match = _ACCOUNT.match(path)
+            if match:
+                address = match.group(1).lower()
+                if match.group(2) is None:
+                    return self._reply(200, {"sequence_number": str(node.sequence_number(address)),
+                                             "authentication_key": address})
+                if match.group(2) == "/transactions":
+                    start = int(query.get("start", ["0"])[0])
+                    limit = int(query.get("limit", ["25"])[0])
+                    return self._reply(200, node.account_transactions(address, start, limit))
+                version = query.get("ledger_version")
+                resource = node.resource(address, match.group(3), int(version[0]) if version else None)
+                if resource is None:
+                    return self._not_found("resource_not_found", f"Resource not found: {match.group(3)}")
+                return self._reply(200, resource)
+
+            self._not_found("web_framework_error", f"No route for {path}")
+
+        def _transaction(self, tx_hash, wait):
+            tx = node.transaction(tx_hash)
+            if tx is None:
+                return self._not_found("transaction_not_found", f"Transaction not found by hash {tx_hash}")
+            deadline = time.monotonic() + 10.0
+            while wait and tx.committed_at > time.monotonic() and time.monotonic() < deadline:
+                # A parked transaction has no commit time until its gap fills; check back.
+                time.sleep(max(min(tx.committed_at, deadline, time.monotonic() + 0.05) - time.monotonic(), 0))
+            self._reply(200, tx.pending_body() if tx.committed_at > time.monotonic() else tx.body())
+
+        def do_POST(self):
+            self._delay()
+            body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            parts = urlsplit(self.path)
+            if parts.path == "/transactions":
+                with node._lock:
+                    stalled = node.stall > 0
+                    node.stall -= stalled
+                if stalled:
+                    time.sleep(node.stall_seconds)
+                    self.close_connection = True
+                    return
+                try:
+                    tx = node.submit(body)
+                except Rejected as e:
+                    return self._reply(400, {"message": str(e), "error_code": e.error_code,
+                                             "vm_error_code": e.vm_error_code})
+                except ValueError as e:
+                    return self._reply(400, {"message": str(e), "error_code": "invalid_input"})
+                return self._reply(202, tx.pending_body())
+            if parts.path == "/view":
+                request = json.loads(body)
+                view = node.views.get(request.get("function"))
+                if view is None:
+                    return self._reply(400, {"message": f"Unknown view function {request.get('function')}",
+                                             "error_code": "invalid_input"})
+                version = parse_qs(parts.query).get("ledger_version")
+                try:
+                    result = view(node, request.get("arguments", []), int(version[0]) if version else None)
+                except ValueError as e:
+                    return self._reply(400, {"message": str(e), "error_code": "invalid_input"})
+                return self._reply(200, result)
+            self._not_found("web_framework_error", f"No route for {parts.path}")
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Offline stand-in for a Cedra node REST API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="up to this many extra seconds per request")
+    parser.add_argument("--commit-latency", type=float, default=0.0, help="seconds from submission to commit")
+    options = parser.parse_args()
+
+    node = MockNode(options.latency, options.commit_latency, options.jitter)
+    server = node.serve(options.port, options.host)
+    print(f"Mock node listening on http://{options.host}:{server.server_port}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
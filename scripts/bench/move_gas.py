@@ -0,0 +1,65 @@
+import argparse
+import os
+import subprocess
+import sys
+
+# Execution cost of randomness::bytes(n) against the original per-block path.
+#
+# Each `bench_*` Move unit test in sources/inferenco_random.move generates n
+# bytes one way. For each, this finds the smallest instruction bound
+# (`cedra move test --instructions N`) the test passes under, by doubling
+# and then bisecting. That is the number of bytecode instructions the path
+# executes, a close proxy for its execution gas (native hashing is charged
+# separately and is the same per 32 bytes on both paths).
+#
+#   python3 scripts/bench/move_gas.py
+#   python3 scripts/bench/move_gas.py --sizes 32,4096 --precision 0.001
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+SIZES = (32, 256, 1024, 4096)
+
+
+def passes(test, instructions):
+    result = subprocess.run(
+        ["cedra", "move", "test", "--named-addresses", "inferenco=0x1",
+         "--filter", f"randomness::{test}", "--instructions", str(instructions)],
+        cwd=PACKAGE_DIR, capture_output=True, text=True,
+    )
+    output = result.stdout + result.stderr
+    if "PASS" not in output and "FAIL" not in output:
+        raise RuntimeError(f"`cedra move test` didn't run {test}:\n{output[-2000:]}")
+    return result.returncode == 0 and "FAIL" not in output
+
+
+def instructions_used(test, precision):
+    """Smallest instruction bound `test` passes under, to within `precision` (relative)."""
+    low, high = 0, 10_000
+    while not passes(test, high):
+        low, high = high, high * 2
+        if high > 10 ** 10:
+            raise RuntimeError(f"{test} doesn't pass under any instruction bound")
+    while high - low > max(1, int(high * precision)):
+        mid = (low + high) // 2
+        if passes(test, mid):
+            high = mid
+        else:
+            low = mid
+    return high
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare randomness::bytes against the original path.")
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)), help="comma-separated, from 32,256,1024,4096")
+    parser.add_argument("--precision", type=float, default=0.005)
+    options = parser.parse_args()
+
+    print(f"{'n':>6}{'counter mode':>16}{'original':>16}{'saving':>10}")
+    for n in (int(size) for size in options.sizes.split(",")):
+        new = instructions_used(f"bench_bytes_{n}", options.precision)
+        old = instructions_used(f"bench_legacy_bytes_{n}", options.precision)
+        print(f"{n:>6}{new:>16}{old:>16}{1 - new / old:>10.0%}")
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,292 @@
+import argparse
+import json
+import multiprocessing
+import os
+import queue
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "demos"))
+
+from shared.metrics import Metrics
+from shared.random_provider import GAME_ADDR
+
+# Offline provider benchmark.
+#
+# Starts a mock node (scripts/bench/mock_node.py) and runs simulated players
+# through the demo game flows from several worker processes. Each worker
+# uses its own signer accounts and a native-submission provider pointed at
+# the mock node. It reports rolls per second plus p50/p99 latency for each
+# provider method and each phase.
+#
+#   python scripts/bench/run_bench.py --processes 4 --players 8 --duration 10
+#   python scripts/bench/run_bench.py --json bench.json
+#   python scripts/bench/run_bench.py --baseline bench.json --max-regression 0.25   # exit 1 on regression
+#
+# "Rolls" are completed randomness requests: one dice roll, loot box, attack
+# or card deal each. A flow that raises is counted as an error for its player,
+# and a worker that crashes or overruns --worker-timeout is reported as failed.
+
+FLOWS = ("dice_roll", "loot_box", "combat_sim", "card_dealer")
+
+
+def _dice_roll(provider):
+    provider.dice_roll(36)
+    return 1
+
+
+def _loot_box(provider):
+    provider.open_loot_box(3)
+    return 1
+
+
+def _combat_sim(provider):
+    # One fight against the Wild Hog: attack until its 100 HP are gone.
+    enemy_hp, attacks = 100, 0
+    while enemy_hp > 0:
+        damage, _ = provider.execute_attack(1, 20, 10)
+        enemy_hp -= max(int(damage), 1)
+        attacks += 1
+    return attacks
+
+
+def _card_dealer(provider):
+    provider.start_card_game()
+    return 1
+
+
+def _card_session(provider):
+    # A blackjack round: one shuffle, then every card dealt from the session.
+    session = provider.start_card_session()
+    session.draw(4)
+    session.draw(2)
+    return 1
+
+
+def _view(provider):
+    provider.view("0x1::account::get_sequence_number", [GAME_ADDR])
+    return 1
+
+
+FLOW_FUNCTIONS = {
+    "dice_roll": _dice_roll,
+    "loot_box": _loot_box,
+    "combat_sim": _combat_sim,
+    "card_dealer": _card_dealer,
+    "card_session": _card_session,
+    "view": _view,
+}
+
+
+def _write_profiles(path, names):
+    """A `.cedra/config.yaml` with a fresh throwaway key per profile."""
+    with open(path, "w") as f:
+        f.write("---\nprofiles:\n")
+        for name in names:
+            f.write(f"  {name}:\n    private_key: \"0x{os.urandom(32).hex()}\"\n")
+
+
+def _worker(index, options, node_url, config_path, results):
+    # Providers announce every request; keep the report readable.
+    sys.stdout = open(os.devnull, "w")
+    os.environ["CEDRA_CONFIG"] = config_path
+    from shared.backends import create_provider
+    from shared.metrics import metrics
+
+    signers = [f"bench{index}_{i}" for i in range(options.signers)]
+    if options.backend == "simulator":
+        provider = create_provider("simulator")
+    else:
+        provider = create_provider("native", profile=signers[0], signers=signers, node_url=node_url,
+                                   max_in_flight=options.max_in_flight, pool_size=options.players)
+
+    flows = [FLOW_FUNCTIONS[name] for name in options.flows]
+    rolls = [0] * options.players
+    errors = [0] * options.players
+    deadline = time.monotonic() + options.duration
+
+    def play(player):
+        i = player
+        while time.monotonic() < deadline:
+            flow = flows[i % len(flows)]
+            i += 1
+            try:
+                rolls[player] += flow(provider)
+            except Exception as e:
+                errors[player] += 1
+                metrics.inc("inferenco_bench_errors_total", flow=flow.__name__.lstrip("_"), error=type(e).__name__)
+
+    threads = [threading.Thread(target=play, args=(p,)) for p in range(options.players)]
+    started = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    results.put({"rolls": sum(rolls), "errors": errors, "elapsed": time.monotonic() - started,
+                 "metrics": metrics.snapshot()})
+
+
+def _collect(workers, results, timeout):
+    """Worker reports, waiting at most `timeout` seconds; crashed workers are not waited for."""
+    reports = []
+    deadline = time.monotonic() + timeout
+    while len(reports) < len(workers):
+        try:
+            reports.append(results.get(timeout=1))
+            continue
+        except queue.Empty:
+            pass
+        crashed = sum(1 for worker in workers if worker.exitcode not in (None, 0))
+        if len(reports) + crashed >= len(workers) or time.monotonic() > deadline:
+            break
+    for worker in workers:
+        worker.join(timeout=5)
+        if worker.is_alive():
+            worker.terminate()
+            worker.join()
+    return reports
+
+
+def _serve_node(options, ports):
+    sys.stdout = open(os.devnull, "w")
+    from mock_node import MockNode
+    node = MockNode(options.latency, options.commit_latency, options.jitter)
+    ports.put(node.serve().server_port)
+    threading.Event().wait()
+
+
+def run(options):
+    """Run the benchmark; returns the report dict."""
+    ctx = multiprocessing.get_context("spawn")
+    node_process = None
+    node_url = options.node_url
+    if node_url is None and options.backend != "simulator":
+        ports = ctx.Queue()
+        node_process = ctx.Process(target=_serve_node, args=(options, ports), daemon=True)
+        node_process.start()
+        node_url = f"http://127.0.0.1:{ports.get(timeout=30)}"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config_path = os.path.join(tmp, "config.yaml")
+        _write_profiles(config_path, [f"bench{p}_{i}" for p in range(options.processes) for i in range(options.signers)])
+        results = ctx.Queue()
+        workers = [ctx.Process(target=_worker, args=(p, options, node_url, config_path, results))
+                   for p in range(options.processes)]
+        for worker in workers:
+            worker.start()
+        reports = _collect(workers, results, options.duration + options.worker_timeout)
+        exitcodes = [worker.exitcode for worker in workers]
+    if node_process is not None:
+        node_process.terminate()
+    if not reports:
+        raise RuntimeError(f"Every benchmark worker failed (exit codes {exitcodes})")
+
+    merged = Metrics()
+    for report in reports:
+        merged.merge(report["metrics"])
+    snapshot = merged.snapshot()
+    rolls = sum(r["rolls"] for r in reports)
+    elapsed = max(r["elapsed"] for r in reports)
+
+    def latencies(metric, label):
+        return {h["labels"][label]: {"count": h["count"], "p50": h["p50"], "p99": h["p99"]}
+                for h in snapshot["histograms"] if h["name"] == metric and "mode" not in h["labels"]}
+
+    return {
+        "config": {k: v for k, v in vars(options).items()
+                   if k not in ("json", "baseline", "max_regression", "worker_timeout")},
+        "rolls": rolls,
+        "elapsed": elapsed,
+        "rolls_per_sec": rolls / elapsed if elapsed else 0.0,
+        "errors": sum(sum(r["errors"]) for r in reports),
+        "player_errors": [n for r in reports for n in r["errors"]],
+        "failed_workers": len(workers) - len(reports),
+        "exitcodes": exitcodes,
+        "methods": latencies("inferenco_call_seconds", "method"),
+        "phases": latencies("inferenco_phase_seconds", "phase"),
+        "counters": {c["name"] + "".join(f"[{k}={v}]" for k, v in sorted(c["labels"].items())): c["value"]
+                     for c in snapshot["counters"]},
+    }
+
+
+def _ms(seconds):
+    return "-" if seconds is None else f"{seconds * 1000:.1f}"
+
+
+def print_report(report):
+    print(f"\n\033[1;34mRolls: {report['rolls']} in {report['elapsed']:.1f}s "
+          f"= {report['rolls_per_sec']:.1f} rolls/s\033[0m\n")
+    if report["errors"]:
+        failing = sum(1 for n in report["player_errors"] if n)
+        print(f"\033[1;31m{report['errors']} failed flows across {failing} player(s)\033[0m\n")
+    if report["failed_workers"]:
+        print(f"\033[1;31m{report['failed_workers']} worker(s) crashed or timed out "
+              f"(exit codes {report['exitcodes']})\033[0m\n")
+    for title, rows in (("Method", report["methods"]), ("Phase", report["phases"])):
+        if not rows:
+            continue
+        print(f"{title:<22}{'count':>8}{'p50 ms':>10}{'p99 ms':>10}")
+        for name, row in sorted(rows.items()):
+            print(f"{name:<22}{row['count']:>8}{_ms(row['p50']):>10}{_ms(row['p99']):>10}")
+        print()
+    for name, value in sorted(report["counters"].items()):
+        print(f"\033[1;33m{name} = {value}\033[0m")
+
+
+def compare(report, baseline, max_regression):
+    """Regressions of `report` against `baseline`, as a list of messages."""
+    problems = []
+    if report.get("failed_workers"):
+        problems.append(f"{report['failed_workers']} worker(s) failed")
+    if report["rolls_per_sec"] < baseline["rolls_per_sec"] * (1 - max_regression):
+        problems.append(f"throughput {report['rolls_per_sec']:.1f} rolls/s < baseline {baseline['rolls_per_sec']:.1f}")
+    for method, row in report["methods"].items():
+        old = baseline["methods"].get(method)
+        if old and old["p99"] and row["p99"] and row["p99"] > old["p99"] * (1 + max_regression):
+            problems.append(f"{method} p99 {_ms(row['p99'])} ms > baseline {_ms(old['p99'])} ms")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline throughput/latency benchmark for RandomProvider.")
+    parser.add_argument("--processes", type=int, default=2)
+    parser.add_argument("--players", type=int, default=8, help="concurrent players per process")
+    parser.add_argument("--signers", type=int, default=4, help="signer accounts per process")
+    parser.add_argument("--max-in-flight", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds to run")
+    parser.add_argument("--worker-timeout", type=float, default=60.0,
+                        help="seconds a worker may overrun --duration before it counts as failed")
+    parser.add_argument("--flows", default=",".join(FLOWS),
+                        help=f"comma-separated, from {', '.join(FLOW_FUNCTIONS)}")
+    parser.add_argument("--backend", choices=("native", "simulator"), default="native")
+    parser.add_argument("--node-url", help="benchmark a running node instead of starting the mock")
+    parser.add_argument("--latency", type=float, default=0.005, help="mock node: seconds added per request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="mock node: extra random seconds per request")
+    parser.add_argument("--commit-latency", type=float, default=0.1, help="mock node: seconds until commit")
+    parser.add_argument("--json", help="write the report to this file")
+    parser.add_argument("--baseline", help="report JSON to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.25)
+    options = parser.parse_args()
+    options.flows = [name.strip() for name in options.flows.split(",")]
+    unknown = [name for name in options.flows if name not in FLOW_FUNCTIONS]
+    if unknown:
+        parser.error(f"unknown flow(s): {', '.join(unknown)}")
+
+    report = run(options)
+    print_report(report)
+    if options.json:
+        with open(options.json, "w") as f:
+            json.dump(report, f, indent=2)
+    if options.baseline:
+        with open(options.baseline) as f:
+            problems = compare(report, json.load(f), options.max_regression)
+        for problem in problems:
+            print(f"\033[1;31m[REGRESSION] {problem}\033[0m")
+        if problems:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -36,7 +36,10 @@ def main():
             print(f"  {get_card_name(card_idx)}", end="")
         print("\n")
         
-        print(f"(Received {len(hand)} cards from chain event)\n")
+        if getattr(hand, "degraded", False):
+            print(f"(Local fallback shuffle of {len(hand)} cards, not from chain)\n")
+        else:
+            print(f"(Received {len(hand)} cards from chain event)\n")
         
     except Exception as e:
         print(f"Error: {e}")
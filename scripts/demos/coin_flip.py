@@ -20,17 +20,22 @@ def main():
             print("\nNon-interactive mode detected. Exiting.")
             break
         
-        # Simple animation
+        # Flip now that the player asked for it; the animation runs while the
+        # transaction commits and keeps going until the flip has landed.
+        # Reusing dice_roll(2) where 1=Heads, 2=Tails if specific coin flip not in provider
+        # Or assume provider has direct support
+        pending = provider.speculate("dice_roll", 2)
+        pending.announced.wait()  # let the provider's status line go out first
         print("Flipping...", end="", flush=True)
-        for _ in range(5):
+        dots = 0
+        while dots < 5 or not pending.done():
+            dots += 1
             sys.stdout.write(".")
             sys.stdout.flush()
             time.sleep(0.2)
         
         try:
-            # Reusing dice_roll(2) where 1=Heads, 2=Tails if specific coin flip not in provider
-            # Or assume provider has direct support
-            result_val = provider.dice_roll(2)
+            result_val = pending.result()
             
             result_str = "HEADS" if result_val == 1 else "TAILS"
             color = "\033[1;32m" if result_val == 1 else "\033[1;31m"
@@ -46,3 +51,5 @@ if __name__ == "__main__":
         main()
     except KeyboardInterrupt:
         print("\nExiting...")
+    finally:
+        provider.close()
@@ -33,6 +33,9 @@ def main():
         if action == 'A':
             # Simulate attack using provider (which would call contract)
             print("Attacking...")
+            # The player has committed to the attack, so start the roll now and let
+            # the animation run while it confirms on chain.
+            attack = provider.speculate("execute_attack", 1, 20, 10) # 1-20 dmg, 10% crit
             time.sleep(0.5)
             
             # Using dice roll to simulate damage calculation if full combat function isn't ready
@@ -41,7 +44,7 @@ def main():
             
             try:
                 # Use provider to calculate damage (simulated or real)
-                damage, is_crit = provider.execute_attack(1, 20, 10) # 1-20 dmg, 10% crit
+                damage, is_crit = attack.result()
                 
                 msg = f"You hit for {damage} damage!"
                 if is_crit:
@@ -67,4 +70,7 @@ def main():
         print("\n\033[1;31mDEFEAT! You have fallen.\033[0m")
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    finally:
+        provider.close()
@@ -36,13 +36,19 @@ def main():
     clear_screen()
     print("\033[1;36m🎲  INFERENCO RANDOMNESS: 2D6 DICE ROLL  🎲\033[0m")
     print("Rolling two dice on-chain...")
+    # Request Randomness now, so the transaction commits while the dice spin
+    # Optimization: Roll 1-36, split into two d6
+    # 0..35 -> divmod(6) -> (0..5, 0..5) -> +1 -> (1..6, 1..6)
+    pending = provider.speculate("dice_roll", 36)
     time.sleep(1)
 
-    # Animation
+    # Animation: at least 15 frames, then keep spinning until the roll is in
     print("\n") # Spacer
     lines_to_clear = 6 # 5 lines of art + 1 newline
 
-    for _ in range(15):
+    frames = 0
+    while frames < 15 or not pending.done():
+        frames += 1
         r1 = random.randint(1, 6)
         r2 = random.randint(1, 6)
         
@@ -55,11 +61,9 @@ def main():
             sys.stdout.write("\033[F") # Header of previous line
             sys.stdout.write("\033[K") # Clear line
 
-    # Request Randomness
-    # Optimization: Roll 1-36, split into two d6
-    # 0..35 -> divmod(6) -> (0..5, 0..5) -> +1 -> (1..6, 1..6)
+    raw_result = None
     try:
-        raw_result = provider.dice_roll(36)
+        raw_result = pending.result()
         
         # Map 1..36 to 0..35
         val_0_35 = raw_result - 1
@@ -73,6 +77,11 @@ def main():
     # Final Draw
     sys.stdout.write(draw_two_dice(d1, d2) + "\n")
     print(f"\n\033[1;32mRESULT: {d1} + {d2} = {d1+d2}\033[0m")
+    if getattr(raw_result, "degraded", False):
+        print("\033[1;33m(Local fallback roll, not from chain)\033[0m")
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    finally:
+        provider.close()
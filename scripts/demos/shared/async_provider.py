@@ -0,0 +1,128 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from shared.entropy_buffer import EntropyExhausted
+from shared.metrics import instrumented_async, metrics
+
+
+class AsyncRandomProvider:
+    """asyncio front end for RandomProvider.
+
+    All calls share the wrapped provider's pooled REST client and signer
+    scheduler, so many players' requests run at once without blocking the
+    event loop. Blocking I/O (CLI spawns, HTTP reads, confirmation polling)
+    runs on worker threads; every method takes an optional `timeout` in
+    seconds and can be cancelled like any other coroutine.
+    """
+
+    def __init__(self, provider=None, max_workers=32, default_timeout=None):
+        if provider is None:
+            from shared.backends import get_provider
+            provider = get_provider()
+        self.provider = provider
+        self.default_timeout = default_timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="inferenco-async")
+
+    def _run(self, fn, *args):
+        return asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+
+    async def _with_deadline(self, coro, timeout):
+        timeout = self.default_timeout if timeout is None else timeout
+        if timeout is None:
+            return await coro
+        return await asyncio.wait_for(coro, timeout)
+
+    async def _execute(self, function_id, args):
+        p = self.provider
+        if p.simulation_mode:
+            return None, None
+        if p.scheduler is not None:
+            if not p._chain_allowed():
+                return None, None
+            started = time.monotonic()
+            future = p.scheduler.submit(function_id, args)
+            try:
+                # Cancelling the wrapper also cancels the job if it hasn't started yet.
+                await asyncio.wrap_future(future)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                pass
+            # The job is done and its confirmation cached, so this doesn't block; it
+            # reports errors and records the outcome exactly as the sync path does.
+            return p._collect(future, started)
+        return await self._run(p._execute, function_id, args)
+
+    async def _dice_roll(self, sides):
+        p = self.provider
+        if p.buffer is not None:
+            try:
+                # Usually instant; only blocks if the buffer ran dry mid-refill.
+                return await self._run(p.buffer.randint, 1, sides)
+            except EntropyExhausted as e:
+                print(f"{e}, rolling on-chain instead.")
+        tx_hash, sender = await self._execute(p.DICE_FUNC, [f"u64:{sides}"])
+        data = await self._run(p._get_resource, p.DICE_RESOURCE, sender, tx_hash) if tx_hash else None
+        return p._roll_from_state(data, sides, tx_hash)
+
+    async def _open_loot_box(self, num_items):
+        p = self.provider
+        tx_hash, _ = await self._execute(p.LOOT_FUNC, [f"u64:{num_items}"])
+        events = await self._run(p._get_events_for_hash, tx_hash, (p.LOOT_EVENT,)) if tx_hash else []
+        return p._loot_from_events(events, num_items, tx_hash)
+
+    async def _start_card_game(self):
+        p = self.provider
+        tx_hash, sender = await self._execute(p.CARD_FUNC, [])
+        data = await self._run(p._get_resource, p.CARD_RESOURCE, sender, tx_hash) if tx_hash else None
+        return p._hand_from_state(data, tx_hash)
+
+    async def _start_card_session(self):
+        p = self.provider
+        tx_hash, sender = await self._execute(p.SESSION_FUNC, [])
+        if not tx_hash:
+            return p._session_from_state(None, None)
+        started = await self._run(p._batch_event, tx_hash, p.SESSION_EVENT)
+        data = await self._run(p._get_resource, p.SESSION_RESOURCE, sender, tx_hash)
+        return p._session_from_state(started, data, tx_hash)
+
+    @instrumented_async
+    async def dice_roll(self, sides, timeout=None):
+        return await self._with_deadline(self._dice_roll(sides), timeout)
+
+    @instrumented_async
+    async def open_loot_box(self, num_items, timeout=None):
+        return await self._with_deadline(self._open_loot_box(num_items), timeout)
+
+    @instrumented_async
+    async def start_card_game(self, timeout=None):
+        return await self._with_deadline(self._start_card_game(), timeout)
+
+    @instrumented_async
+    async def start_card_session(self, timeout=None):
+        return await self._with_deadline(self._start_card_session(), timeout)
+
+    @instrumented_async
+    async def execute_attack(self, min_dmg, max_dmg, crit_chance, timeout=None):
+        combined_seed = await self._with_deadline(self._dice_roll(10000), timeout)
+        return self.provider._attack_from_seed(combined_seed, min_dmg, max_dmg, crit_chance)
+
+    @instrumented_async
+    async def view(self, function_id, args=(), type_args=(), tx_hash=None, timeout=None):
+        return await self._with_deadline(self._run(self.provider.view, function_id, args, type_args, tx_hash), timeout)
+
+    def speculate(self, method, *args, **kwargs):
+        """Start coroutine `method(*args)` as a task now and return it; await it when needed.
+
+        Start it once the player has committed to the action, as with
+        RandomProvider.speculate. Cancelling the task abandons the result, but
+        a transaction that was already submitted still commits.
+        """
+        if method.startswith("_") or not asyncio.iscoroutinefunction(getattr(type(self), method, None)):
+            raise ValueError(f"Can't speculate on {method!r}")
+        metrics.inc("inferenco_speculative_total", method=method)
+        return asyncio.get_running_loop().create_task(getattr(self, method)(*args, **kwargs))
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
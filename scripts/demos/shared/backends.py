@@ -0,0 +1,108 @@
+import os
+import threading
+
+# Registry of randomness backends.
+#
+# Nothing is created (and no CLI is probed) until a provider is first used.
+# Pick the backend with INFERENCO_RANDOM_BACKEND or get_provider(name):
+#
+#   cli        `cedra move run` per transaction (default)
+#   native     in-process signing and REST submission (alias: rest)
+#   simulator  bit-exact local model of inferenco::randomness, no network
+#   replay     answers from a recorded cassette (INFERENCO_CASSETTE), no network
+
+_factories = {}
+_providers = {}
+_lock = threading.Lock()
+
+
+def register_backend(name, factory):
+    """Make `factory(**kwargs)` available as backend `name`."""
+    _factories[name] = factory
+
+
+def available_backends():
+    return sorted(_factories)
+
+
+def default_backend():
+    name = os.environ.get("INFERENCO_RANDOM_BACKEND")
+    if name:
+        return name
+    return "native" if os.environ.get("INFERENCO_NATIVE_SUBMIT") == "1" else "cli"
+
+
+def create_provider(name=None, **kwargs):
+    """A new provider from backend `name` (default: `default_backend()`)."""
+    name = name or default_backend()
+    try:
+        factory = _factories[name]
+    except KeyError:
+        raise ValueError(f"Unknown randomness backend {name!r}; choose from {', '.join(available_backends())}") from None
+    return factory(**kwargs)
+
+
+def get_provider(name=None, **kwargs):
+    """The shared provider for backend `name`, created on first call.
+
+    `kwargs` are passed to the backend only when the provider is created.
+    """
+    name = name or default_backend()
+    with _lock:
+        provider = _providers.get(name)
+        if provider is None:
+            provider = _providers[name] = create_provider(name, **kwargs)
+        return provider
+
+
+class LazyProvider:
+    """Stands in for a shared provider and creates it on first attribute access."""
+
+    def __init__(self, name=None):
+        self._name = name
+
+    def _resolve(self):
+        return get_provider(self._name)
+
+    def __getattr__(self, attr):
+        return getattr(self._resolve(), attr)
+
+    def close(self):
+        """Close the shared provider if it was ever created; doesn't create one."""
+        with _lock:
+            provider = _providers.get(self._name or default_backend())
+        if provider is not None:
+            provider.close()
+
+    def __repr__(self):
+        return f"LazyProvider({self._name or default_backend()!r})"
+
+
+def _cli(**kwargs):
+    from shared.random_provider import RandomProvider
+    return RandomProvider(native=False, **kwargs)
+
+
+def _native(**kwargs):
+    from shared.random_provider import RandomProvider
+    return RandomProvider(native=True, **kwargs)
+
+
+def _simulator(**kwargs):
+    from shared.random_provider import RandomProvider
+    return RandomProvider(simulate=True, **kwargs)
+
+
+def _replay(cassette=None, **kwargs):
+    from shared.random_provider import RandomProvider
+    cassette = cassette or os.environ.get("INFERENCO_CASSETTE")
+    if not cassette:
+        raise ValueError("The replay backend needs a cassette path (INFERENCO_CASSETTE)")
+    return RandomProvider(replay=cassette, **kwargs)
+
+
+register_backend("cli", _cli)
+register_backend("native", _native)
+register_backend("rest", _native)
+register_backend("simulator", _simulator)
+register_backend("replay", _replay)
@@ -0,0 +1,80 @@
+import struct
+
+# Minimal BCS (Binary Canonical Serialization) encoder covering the types
+# needed to build entry-function transactions.
+
+
+def uleb128(value):
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def parse_address(address):
+    """Return the 32-byte form of a hex account address ("0x1", "0xffc8...")."""
+    text = address[2:] if address.startswith("0x") else address
+    if not text or len(text) > 64:
+        raise ValueError(f"Invalid account address: {address}")
+    return bytes.fromhex(text.rjust(64, "0"))
+
+
+class Serializer:
+    def __init__(self):
+        self._buf = bytearray()
+
+    def output(self):
+        return bytes(self._buf)
+
+    def bool(self, value):
+        self._buf.append(1 if value else 0)
+
+    def u8(self, value):
+        self._buf.append(value)
+
+    def u16(self, value):
+        self._buf += struct.pack("<H", value)
+
+    def u32(self, value):
+        self._buf += struct.pack("<I", value)
+
+    def u64(self, value):
+        self._buf += struct.pack("<Q", value)
+
+    def u128(self, value):
+        self._buf += value.to_bytes(16, "little")
+
+    def u256(self, value):
+        self._buf += value.to_bytes(32, "little")
+
+    def uleb128(self, value):
+        self._buf += uleb128(value)
+
+    def fixed_bytes(self, value):
+        self._buf += value
+
+    def bytes(self, value):
+        self._buf += uleb128(len(value))
+        self._buf += value
+
+    def str(self, value):
+        self.bytes(value.encode("utf-8"))
+
+    def address(self, value):
+        self._buf += parse_address(value) if isinstance(value, str) else value
+
+    def sequence(self, values, encode):
+        self._buf += uleb128(len(values))
+        for value in values:
+            encode(self, value)
+
+
+def to_bytes(encode, value):
+    ser = Serializer()
+    encode(ser, value)
+    return ser.output()
@@ -0,0 +1,62 @@
+import hashlib
+
+from shared import bcs
+from shared.results import RandomSequence
+
+DECK_SIZE = 52
+
+
+class CommitmentMismatch(ValueError):
+    """The deck read from chain doesn't hash to the commitment its transaction emitted."""
+
+
+def deck_commitment(deck):
+    """`sha3_256(bcs(vector<u64>))` of a deck, as `card_sessions` computes it."""
+    ser = bcs.Serializer()
+    ser.sequence(list(deck), bcs.Serializer.u64)
+    return hashlib.sha3_256(ser.output()).digest()
+
+
+class CardSession:
+    """A deck shuffled once on chain (`card_sessions::start_session`), dealt locally.
+
+    The deck is checked against `commitment` when the session is created,
+    so every card `draw` hands out comes from the committed shuffle without
+    another transaction or read. `source`/`tx_hash` carry the provenance of
+    the shuffle, like RandomValue.
+    """
+
+    def __init__(self, deck, commitment, session_id=None, tx_hash=None, source="chain"):
+        deck = [int(card) for card in deck]
+        if deck_commitment(deck) != commitment:
+            raise CommitmentMismatch(f"Deck of session {session_id} doesn't match commitment 0x{commitment.hex()}")
+        self.deck = deck
+        self.commitment = commitment
+        self.session_id = session_id
+        self.tx_hash = tx_hash
+        self.source = source
+        self.position = 0
+
+    @property
+    def degraded(self):
+        return self.source == "fallback"
+
+    @property
+    def remaining(self):
+        return len(self.deck) - self.position
+
+    @property
+    def dealt(self):
+        return RandomSequence(self.deck[:self.position], source=self.source, tx_hash=self.tx_hash)
+
+    def draw(self, count=1):
+        """The next `count` cards of the deck (card index 0-51, as in card_dealer.py)."""
+        if count > self.remaining:
+            raise ValueError(f"Only {self.remaining} cards left in the deck")
+        cards = self.deck[self.position:self.position + count]
+        self.position += count
+        return RandomSequence(cards, source=self.source, tx_hash=self.tx_hash)
+
+    def __repr__(self):
+        return (f"CardSession(session_id={self.session_id}, remaining={self.remaining}, "
+                f"source={self.source!r}, tx_hash={self.tx_hash!r})")
@@ -0,0 +1,160 @@
+import random
+import threading
+import time
+
+from shared.events import EventScanner
+from shared.rest_client import RestError
+
+# Top-level fields of a transaction kept on its Confirmation.
+HEADER_FIELDS = ("type", "sender", "timestamp", "version", "success", "vm_status")
+
+
+def backoff_delays(initial=0.05, maximum=1.0, factor=2.0, jitter=0.5):
+    """Yield jittered exponential delays: ~initial, ~2*initial, ... capped at maximum."""
+    delay = initial
+    while True:
+        yield delay * (1 - jitter * random.random())
+        delay = min(delay * factor, maximum)
+
+
+class PhaseTimings:
+    """Seconds from the start of a request to each confirmation phase.
+
+    `submitted`: the node accepted the transaction (0 if we didn't submit it).
+    `committed`: block timestamp of the transaction, relative to our clock.
+    `indexed`: we could read the committed transaction back from the node.
+    """
+
+    __slots__ = ("submitted", "committed", "indexed")
+
+    def __init__(self, submitted=None, committed=None, indexed=None):
+        self.submitted = submitted
+        self.committed = committed
+        self.indexed = indexed
+
+    def as_dict(self):
+        return {"submitted": self.submitted, "committed": self.committed, "indexed": self.indexed}
+
+    def __repr__(self):
+        parts = ", ".join(f"{k}={v * 1000:.0f}ms" for k, v in self.as_dict().items() if v is not None)
+        return f"PhaseTimings({parts})"
+
+
+class Confirmation:
+    """A committed transaction. `success` is False if it aborted; `vm_status` says why.
+
+    The body is decoded while it streams in, so only the header `fields` and
+    the events are kept, never the whole document.
+    """
+
+    __slots__ = ("tx_hash", "fields", "timings", "version", "success", "vm_status", "_events")
+
+    def __init__(self, tx_hash, fields, events, timings, version=None, success=True, vm_status=None):
+        self.tx_hash = tx_hash
+        self.fields = fields
+        self.timings = timings
+        self.version = version  # ledger version the transaction committed at
+        self.success = success
+        self.vm_status = vm_status
+        self._events = events
+
+    @property
+    def sender(self):
+        return self.fields.get("sender")
+
+    def events(self, types=None):
+        """Events of the given fully qualified types (all events if None)."""
+        if types is None:
+            return list(self._events)
+        return [event for event in self._events if event.type in types]
+
+
+class ConfirmationWaiter:
+    """Waits for a transaction to commit as soon as the node knows about it.
+
+    Uses the node's `wait_by_hash` long-poll endpoint when it exists, and
+    otherwise polls `by_hash` with jittered exponential backoff starting at
+    `initial_delay`. Gives up after `timeout` seconds.
+
+    A long-poll holds one of the REST client's pooled connections until the
+    transaction commits, so at most `max_long_polls` run at once (by default
+    one less than the pool size, leaving a connection for submissions and
+    reads); other waiters poll `by_hash` meanwhile.
+    """
+
+    def __init__(self, rest, timeout=30.0, initial_delay=0.05, max_delay=1.0, long_poll=True,
+                 max_long_polls=None):
+        self.rest = rest
+        self.timeout = timeout
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.long_poll = long_poll
+        if max_long_polls is None:
+            max_long_polls = max(getattr(rest, "pool_size", 4) - 1, 0)
+        self._long_polls = threading.BoundedSemaphore(max_long_polls) if max_long_polls else None
+
+    def _read(self, path, remaining):
+        """Stream one transaction read through an EventScanner; returns `(fields, events)`."""
+        scanner = EventScanner(None, HEADER_FIELDS)
+        events = []
+        for chunk in self.rest.stream("GET", path, timeout=max(remaining, 0.1)):
+            events.extend(scanner.feed(chunk))
+        return scanner.fields, events
+
+    def _fetch(self, tx_hash, remaining):
+        """`(fields, events)` of the transaction, or None if the node doesn't know it yet."""
+        if self.long_poll and self._long_polls is not None and self._long_polls.acquire(blocking=False):
+            try:
+                return self._read(f"/transactions/wait_by_hash/{tx_hash}", remaining)
+            except RestError as e:
+                if e.status != 404:
+                    raise
+                if isinstance(e.body, dict) and e.body.get("error_code") == "transaction_not_found":
+                    return None
+                # Node doesn't serve the long-poll route; fall back to plain polling.
+                self.long_poll = False
+            finally:
+                self._long_polls.release()
+        try:
+            return self._read(f"/transactions/by_hash/{tx_hash}", remaining)
+        except RestError as e:
+            if e.status == 404:
+                return None
+            raise
+
+    def wait(self, tx_hash, timeout=None, started=None, submitted=None):
+        """Return a Confirmation once `tx_hash` is committed, or None on timeout.
+
+        A transaction that committed but aborted is returned too, with
+        `success` False; its writes and events never happened.
+
+        `started`/`submitted` are `time.monotonic()` readings taken before and
+        after submission, so timings cover the whole request.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        now = time.monotonic()
+        started = now if started is None else started
+        wall_start = time.time() - (now - started)
+        deadline = now + timeout
+        delays = backoff_delays(self.initial_delay, self.max_delay)
+
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            read = self._fetch(tx_hash, remaining)
+            if read is not None:
+                tx, events = read
+                if tx.get("type") != "pending_transaction":
+                    indexed = time.monotonic() - started
+                    timings = PhaseTimings(
+                        submitted=(submitted - started) if submitted is not None else 0.0,
+                        indexed=indexed,
+                    )
+                    if "timestamp" in tx:
+                        committed = int(tx["timestamp"]) / 1e6 - wall_start
+                        timings.committed = min(max(committed, timings.submitted), indexed)
+                    version = int(tx["version"]) if "version" in tx else None
+                    return Confirmation(tx_hash, tx, events, timings, version,
+                                        success=tx.get("success", True) is not False, vm_status=tx.get("vm_status"))
+            time.sleep(min(next(delays), max(deadline - time.monotonic(), 0)))
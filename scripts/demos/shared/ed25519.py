@@ -0,0 +1,80 @@
+import hashlib
+
+# Pure-Python Ed25519 signing (RFC 8032, section 6 reference algorithm).
+# Used only when PyNaCl is not installed; it is correct but slow, so
+# install PyNaCl for anything beyond demos and offline tests.
+
+_P = 2 ** 255 - 19
+_Q = 2 ** 252 + 27742317777372353535851937790883648493
+_D = -121665 * pow(121666, _P - 2, _P) % _P
+_SQRT_M1 = pow(2, (_P - 1) // 4, _P)
+
+
+def _sha512_modq(data):
+    return int.from_bytes(hashlib.sha512(data).digest(), "little") % _Q
+
+
+def _point_add(a, b):
+    x = (a[1] - a[0]) * (b[1] - b[0]) % _P
+    y = (a[1] + a[0]) * (b[1] + b[0]) % _P
+    c = 2 * a[3] * b[3] * _D % _P
+    d = 2 * a[2] * b[2] % _P
+    e, f, g, h = y - x, d - c, d + c, y + x
+    return (e * f, g * h, f * g, e * h)
+
+
+def _point_mul(scalar, point):
+    result = (0, 1, 1, 0)
+    while scalar > 0:
+        if scalar & 1:
+            result = _point_add(result, point)
+        point = _point_add(point, point)
+        scalar >>= 1
+    return result
+
+
+def _recover_x(y, sign):
+    x2 = (y * y - 1) * pow(_D * y * y + 1, _P - 2, _P)
+    if x2 == 0:
+        return 0
+    x = pow(x2, (_P + 3) // 8, _P)
+    if (x * x - x2) % _P != 0:
+        x = x * _SQRT_M1 % _P
+    if (x & 1) != sign:
+        x = _P - x
+    return x
+
+
+_GY = 4 * pow(5, _P - 2, _P) % _P
+_GX = _recover_x(_GY, 0)
+_G = (_GX, _GY, 1, _GX * _GY % _P)
+
+
+def _compress(point):
+    zinv = pow(point[2], _P - 2, _P)
+    x = point[0] * zinv % _P
+    y = point[1] * zinv % _P
+    return (y | ((x & 1) << 255)).to_bytes(32, "little")
+
+
+def _expand(seed):
+    h = hashlib.sha512(seed).digest()
+    a = int.from_bytes(h[:32], "little")
+    a &= (1 << 254) - 8
+    a |= 1 << 254
+    return a, h[32:]
+
+
+def public_key(seed):
+    a, _ = _expand(seed)
+    return _compress(_point_mul(a, _G))
+
+
+def sign(seed, message, pub=None):
+    a, prefix = _expand(seed)
+    pub = pub or _compress(_point_mul(a, _G))
+    r = _sha512_modq(prefix + message)
+    r_enc = _compress(_point_mul(r, _G))
+    h = _sha512_modq(r_enc + pub + message)
+    s = (r + h * a) % _Q
+    return r_enc + s.to_bytes(32, "little")
@@ -0,0 +1,120 @@
+import threading
+from collections import deque
+
+from shared.results import RandomValue
+
+
+class EntropyExhausted(Exception):
+    """The buffer is empty and a refill from the chain failed."""
+
+
+class _Block:
+    __slots__ = ("tx_hash", "data", "pos")
+
+    def __init__(self, tx_hash, data):
+        self.tx_hash = tx_hash
+        self.data = data
+        self.pos = 0
+
+    @property
+    def remaining(self):
+        return len(self.data) - self.pos
+
+
+class EntropyBuffer:
+    """Serves small random draws from blocks of on-chain random bytes.
+
+    `fetch()` must return `(tx_hash, data)` for one freshly generated block,
+    or None on failure. Draws use rejection sampling, so `randbelow(n)` is
+    exactly uniform, and each value keeps the hash of the transaction whose
+    bytes it consumed. Once fewer than `low_water` bytes remain, a refill is
+    started on a background thread; callers only block if the buffer runs dry.
+
+    A draw never spans two blocks, so it can use at most `block_size` bytes.
+    The bytes are public in the block's `EntropyBlock` event as soon as the
+    transaction commits: anyone watching can predict every draw served from
+    them, so buffered values are only fit for non-adversarial uses.
+    """
+
+    def __init__(self, fetch, low_water=256, block_size=1024):
+        self._fetch = fetch
+        self.low_water = low_water
+        self.block_size = block_size
+        self._blocks = deque()
+        self._available = 0
+        self._refilling = False
+        self._cond = threading.Condition()
+
+    @property
+    def available(self):
+        return self._available
+
+    def _refill(self):
+        try:
+            block = self._fetch()
+        except Exception as e:
+            print(f"Error fetching entropy block: {e}")
+            block = None
+        with self._cond:
+            if block and block[1]:
+                self._blocks.append(_Block(*block))
+                self._available += len(block[1])
+            self._refilling = False
+            self._cond.notify_all()
+
+    def _start_refill(self):
+        # Caller holds self._cond.
+        if not self._refilling:
+            self._refilling = True
+            threading.Thread(target=self._refill, name="inferenco-entropy", daemon=True).start()
+
+    def prefetch(self):
+        """Start a refill now if none is running, e.g. before a session starts."""
+        with self._cond:
+            self._start_refill()
+
+    def _take(self, k):
+        """Return `(tx_hash, offset, bytes)` for k bytes from a single block."""
+        if k > self.block_size:
+            # No block could ever hold it; waiting would fetch (and pay for) blocks forever.
+            raise ValueError(f"A draw of {k} bytes doesn't fit in a {self.block_size}-byte entropy block")
+        with self._cond:
+            while True:
+                while self._blocks and self._blocks[0].remaining < k:
+                    # Don't stitch draws across blocks: provenance stays one tx per value.
+                    self._available -= self._blocks.popleft().remaining
+                if self._blocks:
+                    break
+                if not self._refilling:
+                    self._start_refill()
+                    self._cond.wait()
+                    if not self._blocks and not self._refilling:
+                        raise EntropyExhausted("Could not fetch on-chain entropy")
+                else:
+                    self._cond.wait()
+
+            block = self._blocks[0]
+            offset = block.pos
+            block.pos += k
+            self._available -= k
+            if self._available < self.low_water:
+                self._start_refill()
+            return block.tx_hash, offset, block.data[offset:offset + k]
+
+    def randbelow(self, n):
+        """Uniform RandomValue in [0, n) with buffer provenance."""
+        if n <= 0:
+            raise ValueError("n must be positive")
+        k = max(1, ((n - 1).bit_length() + 7) // 8)
+        space = 1 << (8 * k)
+        limit = space - space % n
+        while True:
+            tx_hash, offset, chunk = self._take(k)
+            value = int.from_bytes(chunk, "little")
+            if value < limit:
+                return RandomValue(value % n, source="buffer", tx_hash=tx_hash, offset=offset)
+
+    def randint(self, a, b):
+        """Uniform RandomValue in [a, b], like random.randint."""
+        value = self.randbelow(b - a + 1)
+        return RandomValue(a + value, source="buffer", tx_hash=value.tx_hash, offset=value.offset)
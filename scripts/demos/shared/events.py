@@ -0,0 +1,193 @@
+import codecs
+import json
+import re
+from array import array
+
+# Incremental decoder for transaction JSON.
+#
+# The scanner walks the document chunk by chunk, tracking only nesting depth
+# and the current top-level key. Each element of the top-level `events` array
+# is parsed on its own, and only events of the requested fully qualified types
+# are kept, so a transaction is decoded in one pass over its bytes without
+# materializing the whole document as text or nested dicts.
+
+CHUNK_SIZE = 64 * 1024
+
+# A complete string, a structural character, a bare literal (true/false/null),
+# or a lone quote opening a string that continues in the next chunk.
+_TOP_LEVEL = re.compile(r'"(?:[^"\\]|\\.)*"|[{}\[\]:,]|[a-z]+|"')
+_NESTED = re.compile(r'"(?:[^"\\]|\\.)*"|[{}\[\]]|"')
+_ELEMENT = re.compile(r'[{\]]')
+
+
+class Event:
+    __slots__ = ("type", "data", "sequence_number")
+
+    def __init__(self, type, data, sequence_number=None):
+        self.type = type
+        self.data = data
+        self.sequence_number = sequence_number
+
+    def __repr__(self):
+        return f"Event({self.type!r}, {self.data!r})"
+
+
+class LootItem:
+    __slots__ = ("item_id", "rarity", "power", "box_index")
+
+    def __init__(self, item_id, rarity, power, box_index=0):
+        self.item_id = item_id
+        self.rarity = rarity
+        self.power = power
+        self.box_index = box_index
+
+    def as_dict(self):
+        return {'item_id': self.item_id, 'rarity': self.rarity, 'power': self.power}
+
+    def __repr__(self):
+        return f"LootItem(item_id={self.item_id}, rarity={self.rarity}, power={self.power})"
+
+
+class EventScanner:
+    """Feed transaction JSON in chunks; collects matching events and top-level scalars.
+
+    `types` is the set of event types to keep (None keeps every event, an
+    empty collection skips event decoding). Top-level string and boolean
+    fields named in `fields` (e.g. "type", "success") end up in `self.fields`.
+    """
+
+    def __init__(self, types=None, fields=()):
+        self.types = None if types is None else frozenset(types)
+        self.want = frozenset(fields)
+        self.fields = {}
+        self.depth = 0
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._tail = ""         # incomplete string or event carried into the next chunk
+        self._key = None        # last top-level key, until the next ','
+        self._in_events = False
+
+    def feed(self, chunk):
+        """Consume one chunk, returning the Events completed in it."""
+        text = self._tail + self._utf8.decode(bytes(chunk))
+        self._tail = ""
+        n = len(text)
+        pos = 0
+        out = []
+
+        while pos < n:
+            if self._in_events and self.depth == 2:
+                m = _ELEMENT.search(text, pos)
+                if m is None:
+                    break
+                if m.group() == "]":
+                    self.depth = 1
+                    self._in_events = False
+                    pos = m.end()
+                    continue
+                # Each event is small and bounded; parse it whole in C.
+                try:
+                    event, pos = self._json.raw_decode(text, m.start())
+                except ValueError:
+                    self._tail = text[m.start():]
+                    break
+                if self.types is None or event.get("type") in self.types:
+                    out.append(Event(event.get("type"), event.get("data"), event.get("sequence_number")))
+                continue
+
+            m = (_TOP_LEVEL if self.depth <= 1 else _NESTED).search(text, pos)
+            if m is None:
+                break
+            token = m.group()
+            pos = m.end()
+            c = token[0]
+            if c == '"':
+                if len(token) == 1:  # string runs past the end of this chunk
+                    self._tail = text[m.start():]
+                    break
+                if self.depth == 1:
+                    self._top_level_string(json.loads(token))
+            elif c.isalpha():
+                if m.end() == n:  # literal may continue in the next chunk
+                    self._tail = text[m.start():]
+                    break
+                if self.depth == 1 and self._key in self.want:
+                    self.fields[self._key] = json.loads(token)
+            elif c == "{" or c == "[":
+                wanted = self.depth == 1 and c == "[" and self._key == "events" and \
+                    (self.types is None or self.types)
+                if self.depth >= 1 and not wanted:
+                    # Skip values that end within this chunk in one C call; only
+                    # ones straddling the chunk boundary are walked bracket by bracket.
+                    try:
+                        _, pos = self._json.raw_decode(text, m.start())
+                        continue
+                    except ValueError:
+                        pass
+                self.depth += 1
+                if self.depth == 1:
+                    self._key = None
+                elif wanted:
+                    self._in_events = True
+            elif c == "}" or c == "]":
+                self.depth -= 1
+            elif c == "," and self.depth == 1:
+                self._key = None
+        return out
+
+    def _top_level_string(self, value):
+        if self._key is None:
+            self._key = value
+        elif self._key in self.want:
+            self.fields[self._key] = value
+
+
+def iter_chunks(data, size=CHUNK_SIZE):
+    view = memoryview(data.encode() if isinstance(data, str) else data)
+    for start in range(0, len(view), size):
+        yield view[start:start + size]
+
+
+def _chunks_of(source):
+    if isinstance(source, (bytes, bytearray, memoryview, str)):
+        return iter_chunks(source)
+    return source
+
+
+def iter_events(source, types=None):
+    """Yield Events of `types` from transaction JSON (bytes, str or an iterable of chunks)."""
+    scanner = EventScanner(types)
+    for chunk in _chunks_of(source):
+        yield from scanner.feed(chunk)
+
+
+def scan_fields(source, fields):
+    """Top-level string and boolean fields of a transaction, skipping over everything nested."""
+    scanner = EventScanner((), fields)
+    for chunk in _chunks_of(source):
+        scanner.feed(chunk)
+    return scanner.fields
+
+
+# Typed views of the game events
+
+def loot_items(data):
+    """LootItems from a loot event: a flat item or an `items` vector of them."""
+    if "items" in data:
+        return [LootItem(int(item["item_id"]), int(item["rarity"]), int(item["power"]),
+                         int(item.get("box_index", 0))) for item in data["items"]]
+    if "item_id" in data:
+        return [LootItem(int(data["item_id"]), int(data["rarity"]), int(data["power"]))]
+    return []
+
+
+def dice_rolls(data):
+    return array("Q", map(int, data["rolls"]))
+
+
+def attack_outcomes(data):
+    """(damages, crits) as parallel arrays from an AttackBatchResolved event."""
+    outcomes = data["outcomes"]
+    damages = array("Q", (int(o["damage"]) for o in outcomes))
+    crits = array("B", (bool(o["is_crit"]) for o in outcomes))
+    return damages, crits
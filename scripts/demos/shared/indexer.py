@@ -0,0 +1,177 @@
+import json
+import sqlite3
+import threading
+
+from shared.events import Event
+
+# Local SQLite index of game events.
+#
+# A background thread pages through the transactions sent by the watched
+# accounts (`/accounts/{address}/transactions`) and stores the events of the
+# game modules, so results, player history and analytics queries are answered
+# from disk instead of re-fetching transactions from the node.
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS transactions (
+    hash TEXT PRIMARY KEY,
+    version INTEGER,
+    sender TEXT,
+    timestamp INTEGER
+);
+CREATE TABLE IF NOT EXISTS events (
+    tx_hash TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    type TEXT NOT NULL,
+    player TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (tx_hash, idx)
+);
+CREATE INDEX IF NOT EXISTS events_player ON events (player, type);
+CREATE INDEX IF NOT EXISTS events_type ON events (type);
+CREATE TABLE IF NOT EXISTS cursors (
+    address TEXT PRIMARY KEY,
+    next_sequence INTEGER NOT NULL
+);
+"""
+
+
+class EventIndexer:
+    """SQLite store of game events, optionally kept up to date by a poller thread.
+
+    `modules` are the `address::module` prefixes whose events are kept.
+    Events are stored with the player they belong to (the event's `player`
+    field, else the transaction sender).
+    """
+
+    def __init__(self, rest, db_path, addresses, modules, page_size=100, poll_interval=2.0):
+        self.rest = rest
+        self.addresses = [a.lower() for a in addresses]
+        self.prefixes = tuple(m + "::" for m in modules)
+        self.page_size = page_size
+        self.poll_interval = poll_interval
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    # Writing
+
+    def _store(self, tx_hash, version, sender, timestamp, events):
+        rows = []
+        for idx, event in enumerate(events):
+            if not event.type.startswith(self.prefixes):
+                continue
+            player = event.data.get("player") if isinstance(event.data, dict) else None
+            rows.append((tx_hash, idx, event.type, (player or sender or "").lower(), json.dumps(event.data)))
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO transactions VALUES (?, ?, ?, ?)",
+                (tx_hash, version, sender, timestamp),
+            )
+            self._db.executemany("INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?, ?)", rows)
+
+    def record_transaction(self, tx):
+        """Index one committed transaction dict from the REST API."""
+        events = [Event(e.get("type", ""), e.get("data"), e.get("sequence_number")) for e in tx.get("events", [])]
+        self._store(tx["hash"], int(tx.get("version", 0)), tx.get("sender"), int(tx.get("timestamp", 0)), events)
+
+    def record_confirmation(self, confirmation):
+        """Index a transaction we just waited for, from what its read already decoded."""
+        self._store(confirmation.tx_hash, confirmation.version, confirmation.sender,
+                    int(confirmation.fields.get("timestamp", 0)), confirmation.events())
+
+    def sync(self):
+        """Page through every watched account once; returns the number of new transactions."""
+        total = 0
+        for address in self.addresses:
+            while not self._stop.is_set():
+                with self._lock:
+                    row = self._db.execute(
+                        "SELECT next_sequence FROM cursors WHERE address = ?", (address,)
+                    ).fetchone()
+                start = row[0] if row else 0
+                page = self.rest.get_json(
+                    f"/accounts/{address}/transactions", params={"start": start, "limit": self.page_size}
+                ) or []
+                for tx in page:
+                    self.record_transaction(tx)
+                    start = max(start, int(tx["sequence_number"]) + 1)
+                with self._lock, self._db:
+                    self._db.execute("INSERT OR REPLACE INTO cursors VALUES (?, ?)", (address, start))
+                total += len(page)
+                if len(page) < self.page_size:
+                    break
+        return total
+
+    def _poll(self):
+        while not self._stop.is_set():
+            try:
+                self.sync()
+            except Exception as e:
+                print(f"Indexer sync failed: {e}")
+            self._stop.wait(self.poll_interval)
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._poll, name="inferenco-indexer", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    # Queries
+
+    def events_for(self, tx_hash, types=None):
+        """Indexed game events of `tx_hash`, or None if the transaction isn't indexed yet."""
+        with self._lock:
+            if self._db.execute("SELECT 1 FROM transactions WHERE hash = ?", (tx_hash,)).fetchone() is None:
+                return None
+            rows = self._db.execute(
+                "SELECT type, data FROM events WHERE tx_hash = ? ORDER BY idx", (tx_hash,)
+            ).fetchall()
+        return [Event(t, json.loads(d)) for t, d in rows if types is None or t in types]
+
+    def history(self, player, event_type=None, limit=50):
+        """A player's most recent events as `(tx_hash, version, type, data)`, newest first."""
+        sql = ("SELECT e.tx_hash, t.version, e.type, e.data FROM events e "
+               "JOIN transactions t ON t.hash = e.tx_hash WHERE e.player = ?")
+        params = [player.lower()]
+        if event_type is not None:
+            sql += " AND e.type = ?"
+            params.append(event_type)
+        sql += " ORDER BY t.version DESC, e.idx DESC LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self._db.execute(sql, params).fetchall()
+        return [(h, v, t, json.loads(d)) for h, v, t, d in rows]
+
+    def event_counts(self, player=None):
+        """Number of indexed events per type, optionally for one player."""
+        sql = "SELECT type, COUNT(*) FROM events"
+        params = ()
+        if player is not None:
+            sql += " WHERE player = ?"
+            params = (player.lower(),)
+        with self._lock:
+            return dict(self._db.execute(sql + " GROUP BY type", params).fetchall())
+
+    def query(self, sql, params=()):
+        """Run a read-only SQL query against the index, for ad-hoc analytics.
+
+        Statements that would write raise sqlite3.OperationalError.
+        """
+        with self._lock:
+            self._db.execute("PRAGMA query_only = ON")
+            try:
+                return self._db.execute(sql, params).fetchall()
+            finally:
+                self._db.execute("PRAGMA query_only = OFF")
+
+    def close(self):
+        self.stop()
+        with self._lock:
+            self._db.close()
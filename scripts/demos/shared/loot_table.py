@@ -0,0 +1,46 @@
+from bisect import bisect_right
+from itertools import accumulate
+
+# Weights of the example games' loot rarities (common .. legendary).
+RARITY_WEIGHTS = (50, 30, 15, 4, 1)
+
+
+class LootTable:
+    """Prefix sums of a weight list, built once and sampled by binary search.
+
+    Matches `inferenco::loot_tables`: `index_for(value)` is the first entry
+    whose running total exceeds `value`, which is also the index
+    `randomness::weighted_choice` picks, so `sample(sim)` returns the same
+    index as the contract for the same entropy.
+    """
+
+    __slots__ = ("prefix", "total")
+
+    def __init__(self, weights):
+        self.prefix = list(accumulate(weights))
+        if not self.prefix:
+            raise ValueError("Loot table needs at least one entry")
+        self.total = self.prefix[-1]
+        if self.total <= 0:
+            raise ValueError("Loot table weights must sum to more than zero")
+
+    @classmethod
+    def from_prefix(cls, prefix):
+        """A table from prefix sums as returned by the `loot_tables::table` view."""
+        table = cls.__new__(cls)
+        table.prefix = [int(p) for p in prefix]
+        table.total = table.prefix[-1]
+        return table
+
+    def __len__(self):
+        return len(self.prefix)
+
+    def index_for(self, value):
+        return bisect_right(self.prefix, value)
+
+    def sample(self, sim):
+        """One draw, consuming the same entropy as `weighted_choice` (one u64_range)."""
+        return bisect_right(self.prefix, sim.u64_range(0, self.total))
+
+
+RARITY_TABLE = LootTable(RARITY_WEIGHTS)
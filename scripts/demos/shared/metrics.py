@@ -0,0 +1,304 @@
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from itertools import count
+
+# Low-overhead latency histograms, counters and optional trace spans.
+#
+# Every RandomProvider call records into the shared `metrics` registry:
+#
+#   inferenco_call_seconds{method}        public provider methods, end to end
+#   inferenco_phase_seconds{phase}        cli_run, sign, submit, commit, index,
+#                                         events_read, resource_read, view
+#   inferenco_errors_total{method}        calls that raised
+#   inferenco_fallbacks_total{kind}       results produced locally, not on chain
+#   inferenco_parse_failures_total{kind}  chain replies that couldn't be decoded
+#
+# Recording is a perf_counter() pair, a dict lookup and a few additions under
+# a lock. Trace spans (INFERENCO_TRACE=1) are kept in a bounded ring buffer.
+
+# Upper bounds in seconds, from 1 ms to 60 s.
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class Histogram:
+    __slots__ = ("buckets", "counts", "count", "sum")
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        i = 0
+        for bound in self.buckets:
+            if value <= bound:
+                break
+            i += 1
+        self.counts[i] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q):
+        """Estimate of the q-th quantile, interpolated within its bucket (None if empty)."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        lower = 0.0
+        for bound, n in zip(self.buckets, self.counts):
+            if n and seen + n >= rank:
+                return lower + (bound - lower) * (rank - seen) / n
+            seen += n
+            lower = bound
+        return float("inf")
+
+    def merge(self, counts, total):
+        for i, n in enumerate(counts):
+            self.counts[i] += n
+        self.count += sum(counts)
+        self.sum += total
+
+
+class Span:
+    __slots__ = ("name", "labels", "trace_id", "span_id", "parent_id", "start", "duration", "error")
+
+    def __init__(self, name, labels, trace_id, span_id, parent_id):
+        self.name = name
+        self.labels = labels
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.start = time.time()
+        self.duration = None
+        self.error = None
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data):
+        span = cls.__new__(cls)
+        for name in cls.__slots__:
+            setattr(span, name, data[name])
+        return span
+
+
+def _key(name, labels):
+    return name, tuple(sorted(labels.items()))
+
+
+def _label_text(labels, extra=()):
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{v}"' for k, v in pairs) + "}"
+
+
+class Metrics:
+    def __init__(self, tracing=False, max_spans=1000):
+        self.tracing = tracing
+        self._histograms = {}
+        self._counters = {}
+        self._spans = deque(maxlen=max_spans)
+        self._ids = count(1)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def observe(self, name, seconds, **labels):
+        key = _key(name, labels)
+        with self._lock:
+            hist = self._histograms.get(key)
+            if hist is None:
+                hist = self._histograms[key] = Histogram()
+            hist.observe(seconds)
+
+    def inc(self, name, amount=1, **labels):
+        key = _key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def span(self, metric, **labels):
+        """Context manager timing a block into histogram `metric` (and a trace span)."""
+        return _Timer(self, metric, labels)
+
+    def _start_span(self, name, labels):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        parent = stack[-1] if stack else None
+        span_id = next(self._ids)
+        span = Span(name, labels, parent.trace_id if parent else span_id, span_id,
+                    parent.span_id if parent else None)
+        stack.append(span)
+        return span
+
+    def _end_span(self, span, duration, error):
+        self._local.stack.pop()
+        span.duration = duration
+        span.error = error
+        self._spans.append(span)
+
+    def spans(self):
+        """Finished trace spans, oldest first."""
+        return [span.as_dict() for span in list(self._spans)]
+
+    def merge(self, snapshot):
+        """Add the counts of another registry's `snapshot()`, e.g. from a worker process."""
+        with self._lock:
+            for h in snapshot["histograms"]:
+                key = _key(h["name"], h["labels"])
+                hist = self._histograms.get(key)
+                if hist is None:
+                    hist = self._histograms[key] = Histogram()
+                hist.merge(h["buckets"], h["sum"])
+            for c in snapshot["counters"]:
+                key = _key(c["name"], c["labels"])
+                self._counters[key] = self._counters.get(key, 0) + c["value"]
+        for span in snapshot.get("spans", ()):
+            self._spans.append(Span.from_dict(span))
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+        self._spans.clear()
+
+    # Export
+
+    def snapshot(self):
+        """JSON-friendly view of every metric, with p50/p99 estimates per histogram."""
+        with self._lock:
+            histograms = [
+                {"name": name, "labels": dict(labels), "count": h.count, "sum": h.sum,
+                 "p50": h.quantile(0.5), "p99": h.quantile(0.99), "buckets": list(h.counts)}
+                for (name, labels), h in sorted(self._histograms.items())
+            ]
+            counters = [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(self._counters.items())
+            ]
+        snap = {"histograms": histograms, "counters": counters}
+        if self.tracing:
+            snap["spans"] = self.spans()
+        return snap
+
+    def to_json(self):
+        return json.dumps(self.snapshot())
+
+    def prometheus_text(self):
+        """Metrics in the Prometheus text exposition format."""
+        lines = []
+        typed = set()
+        with self._lock:
+            for (name, labels), h in sorted(self._histograms.items()):
+                if name not in typed:
+                    lines.append(f"# TYPE {name} histogram")
+                    typed.add(name)
+                cumulative = 0
+                for bound, n in zip(h.buckets + ("+Inf",), h.counts):
+                    cumulative += n
+                    lines.append(f"{name}_bucket{_label_text(labels, [('le', bound)])} {cumulative}")
+                lines.append(f"{name}_sum{_label_text(labels)} {h.sum}")
+                lines.append(f"{name}_count{_label_text(labels)} {h.count}")
+            for (name, labels), value in sorted(self._counters.items()):
+                if name not in typed:
+                    lines.append(f"# TYPE {name} counter")
+                    typed.add(name)
+                lines.append(f"{name}{_label_text(labels)} {value}")
+        return "\n".join(lines) + "\n"
+
+    def serve(self, port=9464, host="127.0.0.1"):
+        """Serve `/metrics` (Prometheus text) and `/metrics.json` from a daemon thread."""
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == "/metrics":
+                    body, content_type = registry.prometheus_text().encode(), "text/plain; version=0.0.4"
+                elif self.path == "/metrics.json":
+                    body, content_type = registry.to_json().encode(), "application/json"
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=server.serve_forever, name="inferenco-metrics", daemon=True).start()
+        return server
+
+
+class _Timer:
+    __slots__ = ("metrics", "metric", "labels", "started", "span")
+
+    def __init__(self, metrics, metric, labels):
+        self.metrics = metrics
+        self.metric = metric
+        self.labels = labels
+
+    def __enter__(self):
+        self.span = self.metrics._start_span(self.metric, self.labels) if self.metrics.tracing else None
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        duration = time.perf_counter() - self.started
+        self.metrics.observe(self.metric, duration, **self.labels)
+        if self.span is not None:
+            self.metrics._end_span(self.span, duration, exc_type.__name__ if exc_type else None)
+        return False
+
+
+metrics = Metrics(tracing=os.environ.get("INFERENCO_TRACE") == "1")
+
+
+def phase(name):
+    """Time a block as `inferenco_phase_seconds{phase=name}`."""
+    return metrics.span("inferenco_phase_seconds", phase=name)
+
+
+def instrumented(method):
+    """Decorator recording a public provider method's latency and errors."""
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        try:
+            with metrics.span("inferenco_call_seconds", method=name):
+                return method(*args, **kwargs)
+        except Exception:
+            metrics.inc("inferenco_errors_total", method=name)
+            raise
+
+    return wrapper
+
+
+def instrumented_async(method):
+    """`instrumented` for coroutines; records latency and errors but no trace spans."""
+    name = method.__name__
+
+    @functools.wraps(method)
+    async def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return await method(*args, **kwargs)
+        except Exception:
+            metrics.inc("inferenco_errors_total", method=name)
+            raise
+        finally:
+            metrics.observe("inferenco_call_seconds", time.perf_counter() - started, method=name, mode="async")
+
+    return wrapper
@@ -0,0 +1,204 @@
+import math
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError("shared.montecarlo needs NumPy (pip install numpy)") from e
+
+from shared.loot_table import RARITY_WEIGHTS
+
+# Vectorized models of inferenco::randomness outcome mapping for balance checks.
+#
+# Every function takes an array of raw entropy words, one u64 per on-chain
+# draw (what `u64_integer()` would have returned), and applies the contract's
+# mapping to all of them at once. Words can come from the bit-exact simulator
+# (`simulated_words`), from real chain bytes (`words_from_bytes`) or from a
+# fast PRNG (`synthetic_words`) for tens of millions of trials.
+
+LOOT_WEIGHTS = RARITY_WEIGHTS
+
+
+def _u64(value):
+    return np.uint64(value)
+
+
+def words_from_bytes(data):
+    """Little-endian u64 words from raw random bytes (e.g. an EntropyBlock)."""
+    usable = len(data) - len(data) % 8
+    return np.frombuffer(bytes(data[:usable]), dtype="<u8").astype(np.uint64)
+
+
+def simulated_words(count, simulator=None):
+    """`count` exact u64_integer() draws from a RandomnessSimulator."""
+    if simulator is None:
+        from shared.simulator import RandomnessSimulator
+        simulator = RandomnessSimulator.random_context()
+    return np.array(simulator.u64_words(count), dtype=np.uint64)
+
+
+def synthetic_words(count, seed=None):
+    """Uniform u64 words from NumPy's PCG64, for very large trial counts."""
+    return np.random.default_rng(seed).bit_generator.random_raw(count).astype(np.uint64)
+
+
+# Range mapping (same modulo reduction as the contract)
+
+def u64_range(words, lo, hi):
+    if not hi > lo:
+        raise ValueError("max must be greater than min")
+    return _u64(lo) + words % _u64(hi - lo)
+
+
+def u8_range(words, lo, hi):
+    """u8_range uses only the first entropy byte, i.e. the low byte of the word."""
+    if not hi > lo:
+        raise ValueError("max must be greater than min")
+    return (words & _u64(0xFF)) % _u64(hi - lo) + _u64(lo)
+
+
+def boolean(words, probability):
+    return u8_range(words, 0, 100) < _u64(probability)
+
+
+def dice_roll(words, sides):
+    return u64_range(words, 1, sides + 1)
+
+
+def weighted_choice(words, weights):
+    """Bucket index per word, identical to the contract's linear cumulative scan."""
+    cumulative = np.cumsum(np.asarray(weights, dtype=np.uint64))
+    total = int(cumulative[-1])
+    if total == 0:
+        raise ValueError("weights must sum to > 0")
+    values = words % _u64(total)
+    return np.searchsorted(cumulative, values, side="right")
+
+
+def execute_attack(words, min_dmg, max_dmg, crit_chance):
+    """Vectorized RandomProvider.execute_attack: one d10000 seed per attack.
+
+    Damage luck is applied in integers as `luck * range / 100`, like the
+    provider and `game_batches::attack_batch`.
+    """
+    seeds = dice_roll(words, 10000).astype(np.int64)
+    crit_roll = seeds % 100
+    luck_roll = (seeds // 100) % 100
+    added = luck_roll * (max_dmg - min_dmg) // 100
+    is_crit = crit_roll < crit_chance
+    damage = min_dmg + added
+    return np.where(is_crit, damage * 2, damage), is_crit
+
+
+def loot_items(words, weights=LOOT_WEIGHTS):
+    """Loot items from consecutive word triples (rarity, item_id, power draws)."""
+    triples = words[:len(words) - len(words) % 3].reshape(-1, 3)
+    rarity = weighted_choice(triples[:, 0], weights)
+    item_id = u64_range(triples[:, 1], 1000, 10000)
+    power = u64_range(triples[:, 2], 10, 101)
+    return rarity, item_id, power
+
+
+# Reports
+
+def _gammaincc(a, x):
+    """Regularized upper incomplete gamma Q(a, x) (Numerical Recipes gammq)."""
+    if x <= 0:
+        return 1.0
+    if x < a + 1:
+        term = total = 1.0 / a
+        n = a
+        for _ in range(1000):
+            n += 1
+            term *= x / n
+            total += term
+            if abs(term) < abs(total) * 1e-15:
+                break
+        return 1.0 - total * math.exp(-x + a * math.log(x) - math.lgamma(a))
+    b = x + 1 - a
+    c = 1e300
+    d = 1 / b
+    h = d
+    for i in range(1, 1000):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        d = 1e-300 if abs(d) < 1e-300 else d
+        c = b + an / c
+        c = 1e-300 if abs(c) < 1e-300 else c
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < 1e-15:
+            break
+    return math.exp(-x + a * math.log(x) - math.lgamma(a)) * h
+
+
+def chi_square(outcomes, expected_probs):
+    """Pearson chi-square test of integer outcomes 0..k-1 against `expected_probs`."""
+    probs = np.asarray(expected_probs, dtype=np.float64)
+    probs = probs / probs.sum()
+    observed = np.bincount(np.asarray(outcomes, dtype=np.int64), minlength=len(probs))[:len(probs)]
+    n = int(observed.sum())
+    expected = probs * n
+    mask = expected > 0
+    statistic = float((((observed - expected) ** 2)[mask] / expected[mask]).sum())
+    dof = int(mask.sum()) - 1
+    return {
+        "trials": n,
+        "observed": (observed / n).tolist(),
+        "expected": probs.tolist(),
+        "statistic": statistic,
+        "dof": dof,
+        "p_value": _gammaincc(dof / 2.0, statistic / 2.0) if dof > 0 else 1.0,
+    }
+
+
+def modulo_bias(range_size, bits=64):
+    """Exact skew of `random % range_size` for a uniform `bits`-bit random value.
+
+    The first `space % range_size` outcomes get one extra preimage each.
+    `bits=8` models u8_range (and so `boolean`), which is badly skewed for
+    ranges that don't divide 256.
+    """
+    space = 1 << bits
+    q, r = divmod(space, range_size)
+    p_high = (q + 1) / space
+    p_low = q / space
+    ideal = 1.0 / range_size
+    return {
+        "range": range_size,
+        "bits": bits,
+        "overrepresented": r,
+        "p_high": p_high,
+        "p_low": p_low,
+        "max_relative_bias": (p_high / ideal - 1.0) if r else 0.0,
+        "total_variation": r * (p_high - ideal) if r else 0.0,
+    }
+
+
+def boolean_bias(probability):
+    """True probability of `boolean(probability)` versus the nominal percentage."""
+    hits = sum(3 if v < 56 else 2 for v in range(probability))  # 256 = 2 * 100 + 56
+    return {"nominal": probability / 100.0, "actual": hits / 256.0}
+
+
+def attack_distribution(min_dmg, max_dmg, crit_chance):
+    """Exact damage/crit distribution of execute_attack over all 10000 seeds.
+
+    Reports the crit rate and how far non-crit damage is from a uniform
+    spread over [min_dmg, max_dmg] (e.g. max_dmg itself is unreachable).
+    """
+    seeds = np.arange(1, 10001, dtype=np.uint64) - _u64(1)
+    damage, is_crit = execute_attack(seeds, min_dmg, max_dmg, crit_chance)
+    base = np.where(is_crit, damage // 2, damage)
+    counts = np.bincount(base - min_dmg, minlength=max_dmg - min_dmg + 1)
+    probs = counts / counts.sum()
+    ideal = 1.0 / len(probs)
+    return {
+        "crit_rate": float(is_crit.mean()),
+        "nominal_crit_rate": crit_chance / 100.0,
+        "mean_damage": float(damage.mean()),
+        "base_damage_probs": probs.tolist(),
+        "unreachable": [min_dmg + i for i, c in enumerate(counts) if c == 0],
+        "total_variation": float(np.abs(probs - ideal).sum() / 2),
+    }
@@ -0,0 +1,166 @@
+import threading
+import time
+
+from shared.rest_client import RestClient
+
+
+class CircuitOpen(Exception):
+    """The dependency failed too often recently; the call wasn't attempted."""
+
+
+class CircuitBreaker:
+    """Stops calling a dependency after repeated failures or slow calls.
+
+    After `failure_threshold` consecutive failures (a call slower than
+    `slow_call` seconds counts as one) the circuit opens and `allow()` is
+    False for `reset_after` seconds. Then a single trial call is let
+    through: success closes the circuit, failure opens it again.
+    """
+
+    def __init__(self, name, failure_threshold=3, slow_call=None, reset_after=30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.slow_call = slow_call
+        self.reset_after = reset_after
+        self._failures = 0
+        self._opened_at = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if time.monotonic() - self._opened_at >= self.reset_after:
+                return "half-open"
+            return "open"
+
+    def allow(self):
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at < self.reset_after or self._trial:
+                return False
+            self._trial = True
+            return True
+
+    def record(self, ok, elapsed=0.0):
+        if ok and self.slow_call is not None and elapsed > self.slow_call:
+            ok = False
+        with self._lock:
+            self._trial = False
+            if ok:
+                self._failures = 0
+                self._opened_at = None
+                return
+            self._failures += 1
+            if self._opened_at is not None or self._failures >= self.failure_threshold:
+                if self._opened_at is None:
+                    print(f"\033[1;33m[WARN] {self.name}: {self._failures} failed/slow calls in a row, "
+                          f"pausing calls for {self.reset_after:.0f}s.\033[0m")
+                self._opened_at = time.monotonic()
+
+    def call(self, fn, *args, **kwargs):
+        if not self.allow():
+            raise CircuitOpen(f"{self.name} circuit is open")
+        started = time.monotonic()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception:
+            self.record(False)
+            raise
+        self.record(True, time.monotonic() - started)
+        return result
+
+
+class HedgedRestClient(RestClient):
+    """RestClient that spreads reads over several node endpoints.
+
+    Idempotent reads go to the first healthy endpoint; if it hasn't answered
+    within `hedge_after` seconds the same read is sent to the next one, and
+    the first good answer wins. Each endpoint has its own CircuitBreaker, so
+    a node that keeps failing or stalling is skipped until it recovers.
+    Submissions and long-polls are never duplicated.
+    """
+
+    def __init__(self, base_urls, hedge_after=0.3, pool_size=4, timeout=10.0,
+                 failure_threshold=3, reset_after=30.0):
+        from concurrent.futures import ThreadPoolExecutor
+        super().__init__(base_urls[0], pool_size=pool_size, timeout=timeout)
+        self.hedge_after = hedge_after
+        self.endpoints = [self] + [RestClient(url, pool_size=pool_size, timeout=timeout) for url in base_urls[1:]]
+        self.breakers = [
+            CircuitBreaker(f"node {url}", failure_threshold=failure_threshold, slow_call=timeout,
+                           reset_after=reset_after)
+            for url in base_urls
+        ]
+        self._executor = ThreadPoolExecutor(
+            max_workers=pool_size * len(self.endpoints), thread_name_prefix="inferenco-hedge",
+        )
+
+    def _hedgeable(self, method, path):
+        if "wait_by_hash" in path:
+            return False
+        return method == "GET" or (method == "POST" and path.startswith("/view"))
+
+    def _send(self, i, *args):
+        started = time.monotonic()
+        try:
+            status, data = RestClient.request(self.endpoints[i], *args)
+        except Exception:
+            self.breakers[i].record(False)
+            raise
+        self.breakers[i].record(status < 500, time.monotonic() - started)
+        return status, data
+
+    def request(self, method, path, body=None, headers=None, params=None, timeout=None):
+        from concurrent.futures import FIRST_COMPLETED, wait
+        args = (method, path, body, headers, params, timeout)
+        order = [i for i, breaker in enumerate(self.breakers) if breaker.state != "open"]
+        if not order:
+            raise CircuitOpen("every node endpoint is failing")
+        if len(order) == 1 or not self._hedgeable(method, path):
+            return self._send(order[0], *args)
+
+        timeout = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        pending = {self._executor.submit(self._send, order.pop(0), *args)}
+        error = last_response = None
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                if last_response is not None:
+                    return last_response
+                raise error or TimeoutError(f"No node answered {method} {path} within {timeout}s")
+            done, pending = wait(pending, timeout=min(self.hedge_after, remaining) if order else remaining,
+                                 return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    status, data = future.result()
+                except Exception as e:
+                    error = e
+                    continue
+                if status < 500:
+                    return status, data
+                last_response = status, data
+            if order:
+                # Slow or failed so far: race the next endpoint.
+                pending.add(self._executor.submit(self._send, order.pop(0), *args))
+            elif not pending:
+                if last_response is not None:
+                    return last_response
+                raise error
+
+    def stream(self, method, path, params=None, timeout=None, chunk_size=64 * 1024):
+        # A stream is consumed as it arrives, so it isn't raced; it goes to the first healthy node.
+        order = [i for i, breaker in enumerate(self.breakers) if breaker.state != "open"]
+        if not order:
+            raise CircuitOpen("every node endpoint is failing")
+        return RestClient.stream(self.endpoints[order[0]], method, path, params, timeout, chunk_size)
+
+    def close(self):
+        for endpoint in self.endpoints[1:]:
+            endpoint.close()
+        super().close()
+        self._executor.shutdown(wait=False)
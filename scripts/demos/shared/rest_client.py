@@ -0,0 +1,214 @@
+import json
+import queue
+import threading
+from urllib.parse import urlencode, urlsplit
+
+DEFAULT_NODE_URL = "https://testnet.cedra.dev"
+
+
+class RestError(Exception):
+    """Non-2xx response from the node REST API."""
+
+    def __init__(self, status, message, body=None):
+        super().__init__(f"HTTP {status}: {message}")
+        self.status = status
+        self.message = message
+        self.body = body
+
+
+class RestClient:
+    """Pooled keep-alive client for the node REST API.
+
+    Up to `pool_size` connections are opened on demand and reused across
+    calls, so a poll or a resource read costs one request on an already
+    open (and already TLS-negotiated) socket instead of a curl/CLI spawn.
+    The client is safe to share between threads.
+    """
+
+    def __init__(self, base_url=DEFAULT_NODE_URL, pool_size=4, timeout=10.0):
+        parts = urlsplit(base_url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"Unsupported node URL: {base_url}")
+        self.base_url = base_url.rstrip("/")
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self._scheme = parts.scheme
+        self._host = parts.hostname
+        self._port = parts.port
+        self._prefix = parts.path.rstrip("/")
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(pool_size)
+
+    def _new_connection(self, timeout):
+        import http.client
+        if self._scheme == "https":
+            return http.client.HTTPSConnection(self._host, self._port, timeout=timeout)
+        return http.client.HTTPConnection(self._host, self._port, timeout=timeout)
+
+    def _checkout(self, timeout):
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            return self._new_connection(timeout), False
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn, True
+
+    def request(self, method, path, body=None, headers=None, params=None, timeout=None):
+        """Send one request and return `(status, body_bytes)`."""
+        import http.client  # deferred: costs more at import time than the rest of the client
+        timeout = self.timeout if timeout is None else timeout
+        url = self._prefix + path
+        if params:
+            url += "?" + urlencode(params)
+        send_headers = {"Accept": "application/json", "Connection": "keep-alive"}
+        if headers:
+            send_headers.update(headers)
+
+        if not self._slots.acquire(timeout=timeout):
+            raise TimeoutError(f"No free connection to {self.base_url} within {timeout}s")
+        try:
+            conn, reused = self._checkout(timeout)
+            while True:
+                try:
+                    conn.request(method, url, body=body, headers=send_headers)
+                    resp = conn.getresponse()
+                    data = resp.read()
+                except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                    conn.close()
+                    if not reused:
+                        raise
+                    # Server dropped an idle keep-alive socket; retry once on a fresh one.
+                    conn, reused = self._new_connection(timeout), False
+                    continue
+                except Exception:
+                    conn.close()
+                    raise
+                break
+
+            if resp.will_close:
+                conn.close()
+            else:
+                self._idle.put(conn)
+            return resp.status, data
+        finally:
+            self._slots.release()
+
+    def stream(self, method, path, params=None, timeout=None, chunk_size=64 * 1024):
+        """Yield the response body in chunks as it arrives, for large transactions.
+
+        Raises RestError for non-2xx responses. The connection goes back to the
+        pool once the body is fully read; abandoning the iterator closes it.
+        """
+        import http.client
+        timeout = self.timeout if timeout is None else timeout
+        url = self._prefix + path
+        if params:
+            url += "?" + urlencode(params)
+        headers = {"Accept": "application/json", "Connection": "keep-alive"}
+
+        if not self._slots.acquire(timeout=timeout):
+            raise TimeoutError(f"No free connection to {self.base_url} within {timeout}s")
+        conn = None
+        try:
+            conn, reused = self._checkout(timeout)
+            try:
+                conn.request(method, url, headers=headers)
+                resp = conn.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                if not reused:
+                    raise
+                conn = self._new_connection(timeout)
+                conn.request(method, url, headers=headers)
+                resp = conn.getresponse()
+            if resp.status >= 300:
+                self._decode(resp.status, resp.read())
+            while True:
+                chunk = resp.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+            if resp.will_close:
+                conn.close()
+            else:
+                self._idle.put(conn)
+            conn = None
+        finally:
+            if conn is not None:
+                conn.close()
+            self._slots.release()
+
+    def _decode(self, status, data):
+        try:
+            payload = json.loads(data) if data else None
+        except ValueError:
+            payload = None
+        if status >= 400:
+            message = payload.get("message") if isinstance(payload, dict) else None
+            raise RestError(status, message or data[:200].decode("utf-8", "replace"), payload)
+        return payload
+
+    def get_json(self, path, params=None, timeout=None):
+        status, data = self.request("GET", path, params=params, timeout=timeout)
+        return self._decode(status, data)
+
+    def post_json(self, path, payload, params=None, timeout=None):
+        body = json.dumps(payload).encode()
+        status, data = self.request(
+            "POST", path, body=body, params=params, timeout=timeout,
+            headers={"Content-Type": "application/json"},
+        )
+        return self._decode(status, data)
+
+    def post_bcs(self, path, body, content_type, timeout=None):
+        status, data = self.request(
+            "POST", path, body=body, timeout=timeout,
+            headers={"Content-Type": content_type},
+        )
+        return self._decode(status, data)
+
+    def get_ledger_info(self):
+        return self.get_json("/")
+
+    def get_transaction_by_hash(self, tx_hash):
+        """Return the transaction dict, or None if the node doesn't know it yet."""
+        try:
+            return self.get_json(f"/transactions/by_hash/{tx_hash}")
+        except RestError as e:
+            if e.status == 404:
+                return None
+            raise
+
+    def get_account(self, address):
+        return self.get_json(f"/accounts/{address}")
+
+    def estimate_gas_price(self):
+        return self.get_json("/estimate_gas_price")
+
+    def get_account_resources(self, address):
+        return self.get_json(f"/accounts/{address}/resources")
+
+    def get_account_resource(self, address, resource_type, ledger_version=None):
+        """Return one resource dict, or None if the account doesn't hold it (at that version)."""
+        params = {"ledger_version": ledger_version} if ledger_version is not None else None
+        try:
+            return self.get_json(f"/accounts/{address}/resource/{resource_type}", params=params)
+        except RestError as e:
+            if e.status == 404:
+                return None
+            raise
+
+    def view(self, function_id, args=(), type_args=(), ledger_version=None):
+        """Call a `#[view]` function; returns its list of return values."""
+        payload = {"function": function_id, "type_arguments": list(type_args), "arguments": list(args)}
+        params = {"ledger_version": ledger_version} if ledger_version is not None else None
+        return self.post_json("/view", payload, params=params)
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
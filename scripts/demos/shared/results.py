@@ -0,0 +1,46 @@
+class RandomValue(int):
+    """An int that remembers where it came from.
+
+    `source` is "chain" (read back from a game transaction), "buffer" (drawn
+    from a prefetched on-chain entropy block), "fallback" (generated locally
+    because the chain call failed, timed out or was skipped; not verifiable)
+    or "simulator" (the simulator backend was chosen on purpose).
+    `tx_hash` is the transaction that produced the randomness and `offset`
+    the byte offset of a buffered draw within that transaction's entropy block.
+    """
+
+    def __new__(cls, value, source="chain", tx_hash=None, offset=None):
+        obj = super().__new__(cls, value)
+        obj.source = source
+        obj.tx_hash = tx_hash
+        obj.offset = offset
+        return obj
+
+    @property
+    def degraded(self):
+        return self.source == "fallback"
+
+    def __repr__(self):
+        return f"RandomValue({int(self)}, source={self.source!r}, tx_hash={self.tx_hash!r})"
+
+    # Printed and formatted like the plain number; only repr() shows provenance.
+    __str__ = int.__repr__
+    __format__ = int.__format__
+
+
+class RandomSequence(list):
+    """A list of random values (e.g. a dealt hand) with the same provenance fields."""
+
+    def __init__(self, values=(), source="chain", tx_hash=None):
+        super().__init__(values)
+        self.source = source
+        self.tx_hash = tx_hash
+
+    @property
+    def degraded(self):
+        return self.source == "fallback"
+
+    def __repr__(self):
+        return f"RandomSequence({list.__repr__(self)}, source={self.source!r}, tx_hash={self.tx_hash!r})"
+
+    __str__ = list.__repr__
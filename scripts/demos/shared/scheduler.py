@@ -0,0 +1,134 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from shared.transactions import SubmissionError
+
+# Rejections that mean our local sequence number drifted from the chain (or the
+# mempool pushed back) rather than that the transaction itself is bad.
+RESYNC_MARKERS = (
+    "SEQUENCE_NUMBER_TOO_OLD",
+    "SEQUENCE_NUMBER_TOO_NEW",
+    "mempool_is_full",
+    "MEMPOOL_IS_FULL",
+    "already_in_mempool",
+)
+RESYNC_VM_STATUSES = (3, 4)  # SEQUENCE_NUMBER_TOO_OLD, SEQUENCE_NUMBER_TOO_NEW
+
+
+def needs_resync(error):
+    if error.vm_status in RESYNC_VM_STATUSES:
+        return True
+    text = f"{error} {error.error_code or ''}"
+    return any(marker in text for marker in RESYNC_MARKERS)
+
+
+class _Signer:
+    def __init__(self, submitter):
+        self.submitter = submitter
+        self.in_flight = 0
+        self.stale = False  # sequence number drifted; resync once in_flight drops to 0
+
+
+class SubmissionScheduler:
+    """Pipelines entry-function transactions across a pool of signer accounts.
+
+    Each account keeps up to `max_in_flight` unconfirmed transactions, with
+    sequence numbers handed out locally by its TransactionSubmitter. New work
+    goes to the least-loaded account, so throughput grows with the pool size.
+    An account whose numbers may have drifted from the chain (a sequence
+    rejection, a POST lost in transit, a transaction that never landed)
+    takes no new work until its in-flight transactions have settled, and is
+    then resynced.
+    `confirm(tx_hash, started, submitted)` blocks until the transaction is
+    committed and returns its Confirmation, or returns None if it never
+    showed up; `started`/`submitted` are monotonic times around the submission.
+    """
+
+    def __init__(self, submitters, confirm, max_in_flight=16, max_retries=3, retry_delay=0.2):
+        if not submitters:
+            raise ValueError("SubmissionScheduler needs at least one signer")
+        self._signers = [_Signer(s) for s in submitters]
+        self._confirm = confirm
+        self.max_in_flight = max_in_flight
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self._cond = threading.Condition()
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(submitters) * max_in_flight,
+            thread_name_prefix="inferenco-submit",
+        )
+
+    @property
+    def addresses(self):
+        return [s.submitter.account.address for s in self._signers]
+
+    def _acquire(self):
+        with self._cond:
+            while True:
+                ready = [s for s in self._signers if not s.stale and s.in_flight < self.max_in_flight]
+                if ready:
+                    signer = min(ready, key=lambda s: s.in_flight)
+                    signer.in_flight += 1
+                    return signer
+                self._cond.wait()
+
+    def _release(self, signer, stale=False):
+        with self._cond:
+            signer.in_flight -= 1
+            signer.stale = signer.stale or stale
+            if signer.stale and signer.in_flight == 0:
+                # Nothing of this account's is in flight any more, so the chain's
+                # sequence number is the one to continue from.
+                signer.submitter.resync()
+                signer.stale = False
+            self._cond.notify_all()
+
+    def _run(self, function_id, args):
+        started = time.monotonic()
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                time.sleep(self.retry_delay * attempt)
+            signer = self._acquire()
+            stale = False
+            try:
+                submitter = signer.submitter
+                try:
+                    tx_hash = submitter.submit(function_id, args)
+                except SubmissionError as e:
+                    # The account is resynced once its other transactions have settled;
+                    # the retry may go out on another account meanwhile.
+                    stale = needs_resync(e)
+                    if stale and attempt < self.max_retries:
+                        continue
+                    raise
+                except Exception:
+                    # A timeout or dropped connection: the node may or may not have the
+                    # transaction, and its sequence number is spent either way. Resync once
+                    # the account's other transactions settle, so a gap can't stall the rest.
+                    stale = True
+                    raise
+
+                confirmation = self._confirm(tx_hash, started, time.monotonic())
+                if not confirmation:
+                    # A transaction that never landed leaves a gap that stalls every
+                    # later sequence number on this account.
+                    stale = True
+                    return None, submitter.account.address
+                if not confirmation.success:
+                    # Aborted: it used its sequence number but wrote nothing.
+                    return None, submitter.account.address
+                return tx_hash, submitter.account.address
+            finally:
+                self._release(signer, stale)
+
+    def submit(self, function_id, args):
+        """Queue `function_id(args)`; returns a Future of `(tx_hash, sender)`.
+
+        `tx_hash` is None if the transaction was accepted but never confirmed,
+        or committed and aborted.
+        """
+        return self._executor.submit(self._run, function_id, list(args))
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait)
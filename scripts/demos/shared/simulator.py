@@ -0,0 +1,253 @@
+import hashlib
+import os
+import struct
+import time
+
+from shared.bcs import parse_address
+
+# Bit-exact Python model of `inferenco::randomness`.
+#
+# Given the same transaction context it returns exactly what the module
+# returns on chain, so game logic can be tested and replayed offline.
+#
+# next_bytes() = sha3_256(tx_hash || bcs(timestamp_us) || bcs(@inferenco)
+#                         || bcs(unique) || script_hash)
+#
+# where `unique` is the AUID from transaction_context::generate_auid_address()
+# (sha3_256(tx_hash || le_u64(n) || 0xFB) for the n-th AUID of the transaction,
+# n starting at 1) or, for deployments predating the AUID change, the u64
+# value of the global RandomnessCounter after incrementing it.
+
+DEFAULT_MODULE_ADDR = "0xffc8b7e8ba733db4e66a992570a9531e80b92b4303cca0bb93f2fba987def403"
+
+E_INVALID_RANGE = 1
+E_EMPTY_VECTOR = 3
+
+_U64 = struct.Struct("<Q")
+_AUID_SCHEME = b"\xfb"
+_MAX_U64 = (1 << 64) - 1
+
+
+class MoveAbort(Exception):
+    """Raised where the Move code would abort, carrying the abort code."""
+
+    def __init__(self, code, message=""):
+        super().__init__(f"abort {code}" + (f": {message}" if message else ""))
+        self.code = code
+
+
+def _hex_bytes(value):
+    if isinstance(value, str):
+        return bytes.fromhex(value[2:] if value.startswith("0x") else value)
+    return bytes(value)
+
+
+def bytes_to_u64(data, offset=0):
+    if offset + 8 > len(data):
+        offset = 0
+    return int.from_bytes(data[offset:offset + 8], "little")
+
+
+def bytes_to_u128(data, offset=0):
+    if offset + 16 > len(data):
+        offset = 0
+    return int.from_bytes(data[offset:offset + 16], "little")
+
+
+def bytes_to_u256(data):
+    return int.from_bytes(data[:32], "little")
+
+
+class RandomnessSimulator:
+    """Reproduces one transaction's randomness stream.
+
+    `tx_hash` is the 32-byte value `transaction_context::get_transaction_hash()`
+    returns, `timestamp_us` the block timestamp, `script_hash` the value of
+    `get_script_hash()` (empty for entry-function transactions). `auid_counter`
+    is the number of AUIDs the transaction generated before the first draw.
+    Pass `legacy_counter` (the RandomnessCounter value before the transaction)
+    to model the original global-counter version of the module instead.
+    """
+
+    def __init__(self, tx_hash, timestamp_us, module_address=DEFAULT_MODULE_ADDR,
+                 script_hash=b"", auid_counter=0, legacy_counter=None):
+        self.tx_hash = _hex_bytes(tx_hash)
+        self.timestamp_us = timestamp_us
+        self.module_address = module_address
+        self.script_hash = _hex_bytes(script_hash)
+        self.auid_counter = auid_counter
+        self.legacy_counter = legacy_counter
+        # Everything before the per-call component is fixed for the transaction,
+        # so hash it once and copy the hasher state per draw.
+        self._prefix = hashlib.sha3_256(self.tx_hash + _U64.pack(timestamp_us) + parse_address(module_address))
+        self._auid_prefix = hashlib.sha3_256(self.tx_hash)
+
+    @classmethod
+    def random_context(cls, **kwargs):
+        """A simulator for a synthetic transaction (random hash, current time)."""
+        return cls(os.urandom(32), int(time.time() * 1e6), **kwargs)
+
+    def next_auid(self):
+        self.auid_counter += 1
+        h = self._auid_prefix.copy()
+        h.update(_U64.pack(self.auid_counter) + _AUID_SCHEME)
+        return h.digest()
+
+    def next_bytes(self):
+        if self.legacy_counter is None:
+            unique = self.next_auid()
+        else:
+            self.legacy_counter += 1
+            unique = _U64.pack(self.legacy_counter)
+        h = self._prefix.copy()
+        h.update(unique)
+        h.update(self.script_hash)
+        return h.digest()
+
+    # Integer generators
+
+    def u8_integer(self):
+        return self.next_bytes()[0]
+
+    def u16_integer(self):
+        return int.from_bytes(self.next_bytes()[:2], "little")
+
+    def u32_integer(self):
+        return int.from_bytes(self.next_bytes()[:4], "little")
+
+    def u64_integer(self):
+        return int.from_bytes(self.next_bytes()[:8], "little")
+
+    def u128_integer(self):
+        return int.from_bytes(self.next_bytes()[:16], "little")
+
+    def u256_integer(self):
+        return int.from_bytes(self.next_bytes(), "little")
+
+    def u64_words(self, count):
+        """The next `count` u64_integer() values, with the per-draw loop inlined."""
+        prefix_copy = self._prefix.copy
+        auid_copy = self._auid_prefix.copy
+        pack = _U64.pack
+        from_bytes = int.from_bytes
+        script_hash = self.script_hash
+        legacy = self.legacy_counter is not None
+        counter = self.legacy_counter if legacy else self.auid_counter
+        words = []
+        append = words.append
+        for _ in range(count):
+            counter += 1
+            if legacy:
+                unique = pack(counter)
+            else:
+                a = auid_copy()
+                a.update(pack(counter) + _AUID_SCHEME)
+                unique = a.digest()
+            h = prefix_copy()
+            h.update(unique + script_hash)
+            append(from_bytes(h.digest()[:8], "little"))
+        if legacy:
+            self.legacy_counter = counter
+        else:
+            self.auid_counter = counter
+        return words
+
+    # Range generators, [min, max)
+
+    def _range(self, lo, hi, draw):
+        if not hi > lo:
+            raise MoveAbort(E_INVALID_RANGE, "max must be greater than min")
+        return lo + draw() % (hi - lo)
+
+    def u8_range(self, lo, hi):
+        return self._range(lo, hi, self.u8_integer)
+
+    def u16_range(self, lo, hi):
+        return self._range(lo, hi, self.u16_integer)
+
+    def u32_range(self, lo, hi):
+        return self._range(lo, hi, self.u32_integer)
+
+    def u64_range(self, lo, hi):
+        return self._range(lo, hi, self.u64_integer)
+
+    def u128_range(self, lo, hi):
+        return self._range(lo, hi, self.u128_integer)
+
+    def u256_range(self, lo, hi):
+        return self._range(lo, hi, self.u256_integer)
+
+    # Utilities
+
+    def bytes(self, n):
+        """Counter mode: block 0 is one next_bytes() seed, block i is sha3_256(seed || le_u64(i))."""
+        if n == 0:
+            return b""
+        seed = self.next_bytes()
+        out = bytearray(seed)
+        counter = 1
+        while len(out) < n:
+            out += hashlib.sha3_256(seed + _U64.pack(counter)).digest()
+            counter += 1
+        return bytes(out[:n])
+
+    def legacy_bytes(self, n):
+        """bytes(n) of deployments predating counter mode: one next_bytes() per 32 bytes."""
+        out = bytearray()
+        while len(out) < n:
+            out += self.next_bytes()[:n - len(out)]
+        return bytes(out)
+
+    def permutation(self, n):
+        if n == 0:
+            raise MoveAbort(0, "arithmetic underflow in permutation(0)")
+        result = list(range(n))
+        for i in range(n - 1, 0, -1):
+            j = self.u64_range(0, i + 1)
+            result[i], result[j] = result[j], result[i]
+        return result
+
+    def shuffle(self, items):
+        for i in range(len(items) - 1, 0, -1):
+            j = self.u64_range(0, i + 1)
+            items[i], items[j] = items[j], items[i]
+
+    def pick(self, items):
+        if not items:
+            raise MoveAbort(E_EMPTY_VECTOR)
+        return items[self.u64_range(0, len(items))]
+
+    def weighted_choice(self, weights):
+        if not weights:
+            raise MoveAbort(E_EMPTY_VECTOR)
+        total = sum(weights)
+        if total > _MAX_U64:
+            raise MoveAbort(0, "arithmetic overflow summing weights")
+        if total == 0:
+            raise MoveAbort(E_INVALID_RANGE)
+        value = self.u64_range(0, total)
+        cumulative = 0
+        for i, weight in enumerate(weights):
+            cumulative += weight
+            if value < cumulative:
+                return i
+        return len(weights) - 1
+
+    def boolean(self, probability):
+        if probability > 100:
+            raise MoveAbort(E_INVALID_RANGE)
+        return self.u8_range(0, 100) < probability
+
+    # Game helpers
+
+    def dice_roll(self, sides):
+        return self.u64_range(1, sides + 1)
+
+    def dice_roll_sum(self, num_dice, sides):
+        return sum(self.dice_roll(sides) for _ in range(num_dice))
+
+    def coin_flip(self):
+        return self.u64_range(0, 2) == 0
+
+    def critical_hit(self, crit_chance_percent):
+        return self.boolean(crit_chance_percent)
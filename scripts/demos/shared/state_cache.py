@@ -0,0 +1,67 @@
+import threading
+from collections import OrderedDict
+
+
+class StateCache:
+    """Version-pinned resource and view reads with LRU eviction.
+
+    State at a given ledger version never changes, so reads that name a
+    version are cached under `(address, resource_type, version)` (or the
+    view function and its arguments) and served without touching the
+    network. Reads without a version go to the latest ledger state and are
+    never cached.
+    """
+
+    _MISSING = object()
+
+    def __init__(self, rest, max_entries=1024):
+        self.rest = rest
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _lookup(self, key):
+        with self._lock:
+            value = self._entries.get(key, self._MISSING)
+            if value is not self._MISSING:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+            return value
+
+    def _store(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def resource(self, address, resource_type, ledger_version=None):
+        """The resource's `data`, or None if the account doesn't hold it."""
+        if ledger_version is None:
+            res = self.rest.get_account_resource(address, resource_type)
+            return res.get("data") if res else None
+        key = ("resource", address.lower(), resource_type, int(ledger_version))
+        data = self._lookup(key)
+        if data is self._MISSING:
+            res = self.rest.get_account_resource(address, resource_type, ledger_version)
+            data = res.get("data") if res else None
+            self._store(key, data)
+        return data
+
+    def view(self, function_id, args=(), type_args=(), ledger_version=None):
+        if ledger_version is None:
+            return self.rest.view(function_id, args, type_args)
+        key = ("view", function_id, tuple(map(str, args)), tuple(type_args), int(ledger_version))
+        result = self._lookup(key)
+        if result is self._MISSING:
+            result = self.rest.view(function_id, args, type_args, ledger_version)
+            self._store(key, result)
+        return result
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,259 @@
+import hashlib
+import os
+import threading
+import time
+
+from shared import bcs
+from shared.metrics import phase
+from shared.rest_client import RestError
+
+# Domain separator prepended to the BCS raw transaction before signing, and
+# the content type for BCS submissions. Both must match the node build.
+RAW_TXN_SALT = b"CEDRA::RawTransaction"
+SIGNED_TXN_CONTENT_TYPE = "application/x.cedra.signed_transaction+bcs"
+
+DEFAULT_MAX_GAS_AMOUNT = 20000
+DEFAULT_EXPIRATION_SECS = 60
+
+
+class SubmissionError(Exception):
+    """The node rejected a transaction before it reached the chain."""
+
+    def __init__(self, message, vm_status=None, error_code=None):
+        super().__init__(message)
+        self.vm_status = vm_status
+        self.error_code = error_code
+
+
+def _signing_backend(seed):
+    try:
+        from nacl.signing import SigningKey
+    except ImportError:
+        from shared import ed25519
+        pub = ed25519.public_key(seed)
+        return pub, lambda message: ed25519.sign(seed, message, pub)
+    key = SigningKey(seed)
+    return key.verify_key.encode(), lambda message: key.sign(message).signature
+
+
+def _find_config(config_path=None):
+    candidates = [config_path] if config_path else [
+        os.environ.get("CEDRA_CONFIG"),
+        os.path.join(os.getcwd(), ".cedra", "config.yaml"),
+        os.path.join(os.path.expanduser("~"), ".cedra", "config.yaml"),
+    ]
+    for path in candidates:
+        if path and os.path.exists(path):
+            return path
+    return None
+
+
+def _read_profiles(path):
+    with open(path) as f:
+        text = f.read()
+    try:
+        import yaml
+    except ImportError:
+        yaml = None
+    if yaml is not None:
+        return (yaml.safe_load(text) or {}).get("profiles", {})
+
+    # The CLI writes a flat two-level layout, so a line scanner is enough without PyYAML.
+    profiles, current = {}, None
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#") or ":" not in stripped:
+            continue
+        indent = len(line) - len(line.lstrip())
+        key, _, value = stripped.partition(":")
+        value = value.strip().strip('"').strip("'")
+        if indent == 2 and not value:
+            current = profiles.setdefault(key, {})
+        elif indent >= 4 and current is not None:
+            current[key] = value
+    return profiles
+
+
+class Account:
+    """An ed25519 signing account."""
+
+    def __init__(self, private_key, address=None):
+        if isinstance(private_key, str):
+            text = private_key.split("-priv-")[-1]
+            private_key = bytes.fromhex(text[2:] if text.startswith("0x") else text)
+        if len(private_key) != 32:
+            raise ValueError("ed25519 private key must be 32 bytes")
+        self.private_key = private_key
+        self.public_key, self._sign = _signing_backend(private_key)
+        if address is None:
+            address = "0x" + hashlib.sha3_256(self.public_key + b"\x00").hexdigest()
+        elif not address.startswith("0x"):
+            address = "0x" + address
+        self.address = address
+
+    @classmethod
+    def from_profile(cls, profile, config_path=None):
+        """Load the key and account address of a `cedra init` profile."""
+        path = _find_config(config_path)
+        if path is None:
+            raise FileNotFoundError("No .cedra/config.yaml found")
+        profiles = _read_profiles(path)
+        if profile not in profiles or not profiles[profile].get("private_key"):
+            raise KeyError(f"Profile {profile} not found or has no private key in {path}")
+        entry = profiles[profile]
+        return cls(entry["private_key"], entry.get("account"))
+
+    def sign(self, message):
+        return self._sign(message)
+
+
+def encode_arg(arg):
+    """BCS-encode a CLI-style typed argument such as "u64:6" or "address:0x1"."""
+    kind, sep, value = str(arg).partition(":")
+    if not sep:
+        raise ValueError(f"Argument {arg!r} must be typed, e.g. 'u64:6'")
+    ser = bcs.Serializer()
+    if kind in ("u8", "u16", "u32", "u64", "u128", "u256"):
+        getattr(ser, kind)(int(value, 0))
+    elif kind == "bool":
+        ser.bool(value.lower() == "true")
+    elif kind == "address":
+        ser.address(value)
+    elif kind == "string":
+        ser.str(value)
+    elif kind == "hex":
+        ser.bytes(bytes.fromhex(value[2:] if value.startswith("0x") else value))
+    else:
+        raise ValueError(f"Unsupported argument type: {kind}")
+    return ser.output()
+
+
+def entry_function_payload(function_id, args):
+    """BCS TransactionPayload::EntryFunction for `0xaddr::module::function`."""
+    address, module, function = function_id.split("::")
+    ser = bcs.Serializer()
+    ser.uleb128(2)  # TransactionPayload::EntryFunction
+    ser.address(address)
+    ser.str(module)
+    ser.str(function)
+    ser.uleb128(0)  # no type arguments
+    ser.sequence([encode_arg(a) for a in args], bcs.Serializer.bytes)
+    return ser.output()
+
+
+def raw_transaction(sender, sequence_number, payload, max_gas_amount, gas_unit_price,
+                    expiration_timestamp_secs, chain_id):
+    ser = bcs.Serializer()
+    ser.address(sender)
+    ser.u64(sequence_number)
+    ser.fixed_bytes(payload)
+    ser.u64(max_gas_amount)
+    ser.u64(gas_unit_price)
+    ser.u64(expiration_timestamp_secs)
+    ser.u8(chain_id)
+    return ser.output()
+
+
+def sign_transaction(account, raw_txn):
+    """Return the BCS SignedTransaction for a raw transaction."""
+    signature = account.sign(hashlib.sha3_256(RAW_TXN_SALT).digest() + raw_txn)
+    ser = bcs.Serializer()
+    ser.fixed_bytes(raw_txn)
+    ser.uleb128(0)  # TransactionAuthenticator::Ed25519
+    ser.bytes(account.public_key)
+    ser.bytes(signature)
+    return ser.output()
+
+
+class TransactionSubmitter:
+    """Builds, signs and posts entry-function transactions in-process.
+
+    Chain ID and gas price are fetched once; the sequence number is fetched
+    once and then advanced locally, so a submission is a single POST.
+    """
+
+    def __init__(self, rest, account, max_gas_amount=DEFAULT_MAX_GAS_AMOUNT,
+                 expiration_secs=DEFAULT_EXPIRATION_SECS, gas_unit_price=None):
+        self.rest = rest
+        self.account = account
+        self.max_gas_amount = max_gas_amount
+        self.expiration_secs = expiration_secs
+        self._gas_unit_price = gas_unit_price
+        self._chain_id = None
+        self._sequence_number = None
+        self._lock = threading.Lock()
+
+    @property
+    def chain_id(self):
+        if self._chain_id is None:
+            self._chain_id = int(self.rest.get_ledger_info()["chain_id"])
+        return self._chain_id
+
+    @property
+    def gas_unit_price(self):
+        if self._gas_unit_price is None:
+            self._gas_unit_price = int(self.rest.estimate_gas_price()["gas_estimate"])
+        return self._gas_unit_price
+
+    def fetch_sequence_number(self):
+        return int(self.rest.get_account(self.account.address)["sequence_number"])
+
+    def resync(self):
+        """Drop the cached sequence number; the next submission refetches it.
+
+        Only safe once none of this account's transactions are in flight, or
+        their sequence numbers would be handed out again.
+        """
+        with self._lock:
+            self._sequence_number = None
+
+    def _return_sequence_number(self, number):
+        # Reuse a number the node never accepted, unless a later one is already out.
+        with self._lock:
+            if self._sequence_number == number + 1:
+                self._sequence_number = number
+
+    def _next_sequence_number(self):
+        with self._lock:
+            if self._sequence_number is None:
+                self._sequence_number = self.fetch_sequence_number()
+            number = self._sequence_number
+            self._sequence_number += 1
+            return number
+
+    def build(self, function_id, args, sequence_number):
+        raw = raw_transaction(
+            self.account.address,
+            sequence_number,
+            entry_function_payload(function_id, args),
+            self.max_gas_amount,
+            self.gas_unit_price,
+            int(time.time()) + self.expiration_secs,
+            self.chain_id,
+        )
+        return sign_transaction(self.account, raw)
+
+    def post(self, signed_txn):
+        """Post a signed transaction and return its hash."""
+        try:
+            return self.rest.post_bcs("/transactions", signed_txn, SIGNED_TXN_CONTENT_TYPE)["hash"]
+        except RestError as e:
+            body = e.body if isinstance(e.body, dict) else {}
+            raise SubmissionError(str(e), body.get("vm_error_code"), body.get("error_code")) from e
+
+    def submit(self, function_id, args):
+        """Submit `function_id(args)` and return the pending transaction hash.
+
+        A rejected transaction gives its sequence number back. After a transport
+        error the number stays used, since the node may have accepted it; the
+        caller resyncs once nothing else is in flight.
+        """
+        sequence_number = self._next_sequence_number()
+        with phase("sign"):
+            signed = self.build(function_id, args, sequence_number)
+        try:
+            with phase("submit"):
+                return self.post(signed)
+        except SubmissionError:
+            self._return_sequence_number(sequence_number)
+            raise
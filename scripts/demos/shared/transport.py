@@ -0,0 +1,236 @@
+import atexit
+import base64
+import gzip
+import hashlib
+import json
+import threading
+import time
+from collections import deque
+from urllib.parse import urlencode
+
+from shared.rest_client import RestClient
+
+# Transports under RandomProvider, and record/replay of them.
+#
+# Every CLI run and HTTP exchange the provider makes goes through a
+# CliTransport or a RestClient. Recording wraps both and appends each
+# exchange to a gzipped JSON-lines cassette. Replaying answers every
+# exchange from the cassette, at full speed or with its original latency,
+# so the Python side (parsing, fallbacks, demo flows) can be profiled and
+# slow sessions reproduced without network variance.
+#
+#   INFERENCO_RECORD=session.cassette python3 scripts/demos/dice_roll.py
+#   INFERENCO_RANDOM_BACKEND=replay INFERENCO_CASSETTE=session.cassette python3 scripts/demos/dice_roll.py
+
+
+class CassetteMiss(LookupError):
+    """Replay was asked for an exchange the cassette doesn't contain."""
+
+
+class CliTransport:
+    """Runs CLI commands; `run` returns stdout and raises like `subprocess.run(check=True)`."""
+
+    def run(self, cmd, timeout):
+        import subprocess
+        return subprocess.run(cmd, capture_output=True, text=True, check=True, timeout=timeout).stdout
+
+
+# A SignedTransaction is the BCS RawTransaction (sender, sequence number,
+# payload, then 25 bytes of gas, expiration and chain id) followed by an
+# ed25519 authenticator (variant, public key, signature).
+_RAW_TXN_TAIL = 8 + 8 + 8 + 1
+_AUTHENTICATOR_SIZE = 1 + 1 + 32 + 1 + 64
+
+
+def _http_key(method, path, params, body):
+    url = path + ("?" + urlencode(params) if params else "")
+    if method == "POST" and path == "/transactions" and body is not None:
+        # Signed transactions embed an expiration time and differ on every run, so
+        # submissions are matched by sender, sequence number and payload instead.
+        payload = body[40:-(_RAW_TXN_TAIL + _AUTHENTICATOR_SIZE)]
+        sequence_number = int.from_bytes(body[32:40], "little")
+        return f"{method} {url} 0x{body[:32].hex()} {sequence_number} {hashlib.sha256(payload).hexdigest()[:16]}"
+    if body is None:
+        return f"{method} {url}"
+    return f"{method} {url} {hashlib.sha256(body).hexdigest()[:16]}"
+
+
+def _cli_key(cmd):
+    return "cli " + " ".join(cmd)
+
+
+class Cassette:
+    """Exchanges recorded from one session.
+
+    Opened with mode "record" it appends entries to `path` as they happen;
+    with mode "replay" it loads them and hands them out per request key in
+    recorded order. `timing` is "fast" (no delays) or "original" (each
+    replayed exchange takes as long as it did when recorded).
+    """
+
+    def __init__(self, path, mode="replay", timing="fast"):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        if timing not in ("fast", "original"):
+            raise ValueError(f"Unknown replay timing: {timing}")
+        self.path = path
+        self.mode = mode
+        self.timing = timing
+        self.meta = {}
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._started = time.monotonic()
+        self._file = None
+        if mode == "record":
+            self._file = gzip.open(path, "wt", encoding="utf-8")
+            atexit.register(self.close)
+        else:
+            self._load()
+
+    def _load(self):
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            for line in f:
+                entry = json.loads(line)
+                if entry["kind"] == "meta":
+                    self.meta[entry["key"]] = entry["value"]
+                else:
+                    self._entries.setdefault(entry["key"], deque()).append(entry)
+
+    def _write(self, entry):
+        line = json.dumps(entry, separators=(",", ":")) + "\n"
+        with self._lock:
+            if self._file is not None:
+                self._file.write(line)
+
+    def set_meta(self, key, value):
+        self.meta[key] = value
+        if self.mode == "record":
+            self._write({"kind": "meta", "key": key, "value": value})
+
+    def record(self, kind, key, started, elapsed, **fields):
+        self._write(dict(fields, kind=kind, key=key, at=round(started - self._started, 6), elapsed=round(elapsed, 6)))
+
+    def take(self, key, repeat_last=False):
+        """The next recorded entry for `key`; with `repeat_last` the final one is served again and again."""
+        with self._lock:
+            queue = self._entries.get(key)
+            if not queue:
+                raise CassetteMiss(f"No recorded exchange for {key}")
+            entry = queue[0] if repeat_last and len(queue) == 1 else queue.popleft()
+        if self.timing == "original":
+            time.sleep(entry["elapsed"])
+        return entry
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def _encode_body(data):
+    try:
+        return {"body": data.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"body_b64": base64.b64encode(data).decode()}
+
+
+def _decode_body(entry):
+    if "body_b64" in entry:
+        return base64.b64decode(entry["body_b64"])
+    return entry["body"].encode("utf-8")
+
+
+def _recorded_error(entry):
+    """The transport exception an entry recorded; types we can't rebuild come back as OSError."""
+    import builtins
+    import http.client
+    cls = getattr(builtins, entry["error"], None) or getattr(http.client, entry["error"], None)
+    if not (isinstance(cls, type) and issubclass(cls, Exception)):
+        cls = OSError
+    return cls(entry["message"])
+
+
+class _CassetteRestClient(RestClient):
+    def stream(self, method, path, params=None, timeout=None, chunk_size=64 * 1024):
+        # Bodies are kept whole on the cassette; hand them back in chunks.
+        status, data = self.request(method, path, params=params, timeout=timeout)
+        if status >= 300:
+            self._decode(status, data)
+        for start in range(0, len(data), chunk_size):
+            yield data[start:start + chunk_size]
+
+
+class RecordingRestClient(_CassetteRestClient):
+    """Sends requests through `inner` and records each response to `cassette`."""
+
+    def __init__(self, inner, cassette):
+        super().__init__(inner.base_url, pool_size=inner.pool_size, timeout=inner.timeout)
+        self.inner = inner
+        self.cassette = cassette
+
+    def request(self, method, path, body=None, headers=None, params=None, timeout=None):
+        key = _http_key(method, path, params, body)
+        started = time.monotonic()
+        try:
+            status, data = self.inner.request(method, path, body, headers, params, timeout)
+        except Exception as e:
+            self.cassette.record("http", key, started, time.monotonic() - started,
+                                 error=type(e).__name__, message=str(e))
+            raise
+        self.cassette.record("http", key, started, time.monotonic() - started, status=status, **_encode_body(data))
+        return status, data
+
+    def close(self):
+        self.inner.close()
+        self.cassette.close()
+
+
+class ReplayRestClient(_CassetteRestClient):
+    """Answers every request from `cassette`; never touches the network."""
+
+    def __init__(self, cassette, timeout=10.0):
+        super().__init__(cassette.meta.get("node_url", "http://replay.invalid"), timeout=timeout)
+        self.cassette = cassette
+
+    def request(self, method, path, body=None, headers=None, params=None, timeout=None):
+        entry = self.cassette.take(_http_key(method, path, params, body), repeat_last=method == "GET")
+        if "error" in entry:
+            raise _recorded_error(entry)
+        return entry["status"], _decode_body(entry)
+
+
+class RecordingCliTransport(CliTransport):
+    def __init__(self, inner, cassette):
+        self.inner = inner
+        self.cassette = cassette
+
+    def run(self, cmd, timeout):
+        import subprocess
+        started = time.monotonic()
+        try:
+            stdout = self.inner.run(cmd, timeout)
+        except subprocess.TimeoutExpired:
+            self.cassette.record("cli", _cli_key(cmd), started, time.monotonic() - started, timeout=True)
+            raise
+        except subprocess.CalledProcessError as e:
+            self.cassette.record("cli", _cli_key(cmd), started, time.monotonic() - started,
+                                 returncode=e.returncode, stdout=e.stdout or "", stderr=e.stderr or "")
+            raise
+        self.cassette.record("cli", _cli_key(cmd), started, time.monotonic() - started,
+                             returncode=0, stdout=stdout, stderr="")
+        return stdout
+
+
+class ReplayCliTransport(CliTransport):
+    def __init__(self, cassette):
+        self.cassette = cassette
+
+    def run(self, cmd, timeout):
+        import subprocess
+        entry = self.cassette.take(_cli_key(cmd))
+        if entry.get("timeout"):
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        if entry["returncode"]:
+            raise subprocess.CalledProcessError(entry["returncode"], cmd, entry["stdout"], entry["stderr"])
+        return entry["stdout"]
@@ -0,0 +1,79 @@
+import os
+import socket
+import sys
+
+import pytest
+
+# The demos import their helpers as `shared.*`, and the mock node lives next to
+# the benchmark; make both importable the way the scripts themselves do.
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(SCRIPTS_DIR, "demos"))
+sys.path.insert(0, os.path.join(SCRIPTS_DIR, "bench"))
+
+from mock_node import MockNode  # noqa: E402
+from shared.metrics import metrics  # noqa: E402
+
+PROFILES = ("player", "player2", "player3")
+
+
+def counter(name, **labels):
+    """Current value of a counter in the shared metrics registry."""
+    for c in metrics.snapshot()["counters"]:
+        if c["name"] == name and c["labels"] == labels:
+            return c["value"]
+    return 0
+
+
+@pytest.fixture(autouse=True)
+def clean_environment(monkeypatch):
+    for name in list(os.environ):
+        if name.startswith("INFERENCO_") or name.startswith("CEDRA_"):
+            monkeypatch.delenv(name)
+    metrics.reset()
+
+
+@pytest.fixture
+def node():
+    """A mock node serving on a free local port; `node.url` is its base URL."""
+    node = MockNode()
+    server = node.serve()
+    node.url = f"http://127.0.0.1:{server.server_port}"
+    yield node
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def dead_url():
+    """A local URL nothing listens on; connections to it are refused."""
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return f"http://127.0.0.1:{s.getsockname()[1]}"
+
+
+@pytest.fixture
+def profiles(tmp_path, monkeypatch):
+    """A `.cedra/config.yaml` with a throwaway key for each of PROFILES."""
+    path = tmp_path / "config.yaml"
+    path.write_text("---\nprofiles:\n" + "".join(
+        f"  {name}:\n    private_key: \"0x{os.urandom(32).hex()}\"\n" for name in PROFILES))
+    monkeypatch.setenv("CEDRA_CONFIG", str(path))
+    return path
+
+
+@pytest.fixture
+def make_provider(node, profiles):
+    """Native-submission providers pointed at the mock node."""
+    from shared.random_provider import RandomProvider
+    created = []
+
+    def make(**kwargs):
+        kwargs.setdefault("signers", ["player"])
+        provider = RandomProvider(native=True, profile="player", node_url=node.url, **kwargs)
+        created.append(provider)
+        return provider
+
+    yield make
+    for provider in created:
+        if provider.scheduler is not None:
+            provider.scheduler.shutdown(wait=False)
@@ -0,0 +1,93 @@
+import asyncio
+import time
+
+import pytest
+
+from conftest import counter
+from shared.async_provider import AsyncRandomProvider
+from shared.entropy_buffer import EntropyBuffer
+from shared.metrics import metrics
+
+
+def _phase_count(name):
+    return sum(h["count"] for h in metrics.snapshot()["histograms"]
+               if h["name"] == "inferenco_phase_seconds" and h["labels"].get("phase") == name)
+
+
+def test_async_rolls_go_through_the_confirm_path(node, make_provider):
+    provider = make_provider()
+    front = AsyncRandomProvider(provider)
+
+    async def play():
+        return await asyncio.gather(*(front.dice_roll(6) for _ in range(4)))
+
+    try:
+        rolls = asyncio.run(play())
+    finally:
+        front.close()
+    assert all(roll.source == "chain" and 1 <= roll <= 6 for roll in rolls)
+    assert _phase_count("commit") == 4 and _phase_count("index") == 4
+    assert len(provider._confirmed) == 4
+
+
+def test_async_abort_and_exhaustion_are_reported(node, make_provider, capsys):
+    provider = make_provider()
+    provider.buffer = EntropyBuffer(lambda: None)
+    del node.entry_functions[provider.DICE_FUNC]
+    front = AsyncRandomProvider(provider)
+    try:
+        roll = asyncio.run(front.dice_roll(6))
+    finally:
+        front.close()
+    output = capsys.readouterr().out
+    assert "Could not fetch on-chain entropy, rolling on-chain instead." in output
+    assert "failed on chain" in output
+    assert roll.source == "fallback"
+    assert counter("inferenco_failed_transactions_total") == 1
+
+
+def test_timeout_against_a_slow_node(node, make_provider):
+    node.commit_latency = 2.0
+    provider = make_provider(confirm_timeout=10)
+    front = AsyncRandomProvider(provider)
+
+    async def play():
+        started = time.monotonic()
+        with pytest.raises(asyncio.TimeoutError):
+            await front.dice_roll(6, timeout=0.3)
+        return time.monotonic() - started
+
+    try:
+        assert asyncio.run(play()) < 1.0
+        # default_timeout applies when a call doesn't pass its own
+        front.default_timeout = 0.3
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(front.execute_attack(1, 20, 10))
+    finally:
+        front.close()
+
+
+def test_cancelling_a_queued_call_cancels_its_job(node, make_provider):
+    node.commit_latency = 1.0
+    # One signer with one slot: the second roll waits in the scheduler's queue.
+    provider = make_provider(max_in_flight=1, confirm_timeout=10)
+    front = AsyncRandomProvider(provider)
+
+    async def play():
+        first = asyncio.create_task(front.dice_roll(6))
+        queued = asyncio.create_task(front.dice_roll(6))
+        while not node._transactions:
+            await asyncio.sleep(0.01)
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        return await first, await front.dice_roll(6)
+
+    try:
+        first, later = asyncio.run(play())
+    finally:
+        front.close()
+    assert first.source == later.source == "chain"
+    # The cancelled roll never reached the node, so it left no sequence gap.
+    assert len(node._transactions) == 2
+    assert [tx.sequence_number for tx in node._transactions.values()] == [0, 1]
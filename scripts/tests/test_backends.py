@@ -0,0 +1,98 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from shared import backends
+from shared.backends import LazyProvider, create_provider, get_provider, register_backend
+from shared.random_provider import RandomProvider
+
+
+@pytest.fixture(autouse=True)
+def registry(monkeypatch):
+    """Fresh backend and provider registries, so tests don't share providers."""
+    monkeypatch.setattr(backends, "_factories", dict(backends._factories))
+    monkeypatch.setattr(backends, "_providers", {})
+
+
+class FakeProvider:
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.closed = False
+
+    def dice_roll(self, sides):
+        return sides
+
+    def close(self):
+        self.closed = True
+
+
+def _register_fake(name="fake"):
+    built = []
+
+    def factory(**kwargs):
+        built.append(FakeProvider(**kwargs))
+        return built[-1]
+
+    register_backend(name, factory)
+    return built
+
+
+def test_lazy_provider_builds_on_first_attribute_access():
+    built = _register_fake()
+    lazy = LazyProvider("fake")
+    assert repr(lazy) == "LazyProvider('fake')"
+    lazy.close()  # closing a provider that was never created doesn't create one
+    assert built == [] and backends._providers == {}
+
+    assert lazy.dice_roll(6) == 6
+    assert len(built) == 1 and backends._providers == {"fake": built[0]}
+    lazy.dice_roll(20)
+    assert LazyProvider("fake").dice_roll(4) == 4
+    assert len(built) == 1  # one shared provider per backend
+
+    lazy.close()
+    assert built[0].closed
+
+
+def test_importing_the_provider_module_builds_nothing():
+    demos = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "demos")
+    code = ("import shared.random_provider as rp, shared.backends as b; "
+            "assert type(rp.provider).__name__ == 'LazyProvider' and b._providers == {}")
+    subprocess.run([sys.executable, "-c", code], cwd=demos, check=True, timeout=30)
+
+
+def test_backend_selected_by_environment(monkeypatch):
+    assert backends.default_backend() == "cli"
+    monkeypatch.setenv("INFERENCO_NATIVE_SUBMIT", "1")
+    assert backends.default_backend() == "native"
+
+    monkeypatch.setenv("INFERENCO_RANDOM_BACKEND", "simulator")
+    assert repr(LazyProvider()) == "LazyProvider('simulator')"
+    provider = get_provider()
+    assert isinstance(provider, RandomProvider) and provider.fallback_source == "simulator"
+    assert 1 <= LazyProvider().dice_roll(6) <= 6
+    assert backends._providers == {"simulator": provider}
+
+
+def test_unknown_backend():
+    name = "no-such-backend"
+    with pytest.raises(ValueError, match="no-such-backend.*simulator"):
+        create_provider(name)
+    with pytest.raises(ValueError):
+        LazyProvider(name).dice_roll
+    assert backends._providers == {}
+
+
+def test_custom_backend():
+    built = _register_fake("custom")
+    assert "custom" in backends.available_backends()
+
+    provider = get_provider("custom", profile="p2")
+    assert provider is built[0] and provider.kwargs == {"profile": "p2"}
+    # Options only apply when the shared provider is first created
+    assert get_provider("custom", profile="other") is provider
+    # create_provider always builds a new one
+    assert create_provider("custom", profile="p3").kwargs == {"profile": "p3"}
+    assert len(built) == 2
@@ -0,0 +1,44 @@
+import pytest
+
+from mock_node import _attack
+from shared.results import RandomValue
+
+
+def test_local_attacks_match_chain_formula(make_provider):
+    provider = make_provider()
+    for min_dmg, max_dmg in ((0, 100), (10, 20), (5, 1005)):
+        for seed in range(1, 10001):
+            damage, is_crit = provider._attack_from_seed(RandomValue(seed), min_dmg, max_dmg, 25)
+            expected = _attack(seed, min_dmg, max_dmg, 25)
+            assert (int(damage), is_crit) == (int(expected["damage"]), expected["is_crit"]), seed
+
+
+def test_attack_batch_from_chain(node, make_provider):
+    attacks = make_provider().execute_attack_batch(300, 10, 20, 50)
+    assert len(attacks) == 300
+    assert {damage.source for damage, _ in attacks} == {"chain"}
+    assert all(10 <= damage <= 40 for damage, _ in attacks)
+
+
+@pytest.mark.parametrize("items_per_box", [0, 257])
+def test_loot_boxes_reject_bad_box_size(node, make_provider, items_per_box):
+    with pytest.raises(ValueError):
+        make_provider().open_loot_boxes(3, items_per_box)
+    assert not node._by_sender
+
+
+def test_loot_boxes_split_across_transactions(node, make_provider):
+    boxes = make_provider().open_loot_boxes(70, 4)
+    assert len(boxes) == 70
+    assert all(len(box) == 4 and box[0]["source"] == "chain" for box in boxes)
+    assert len({box[0]["tx_hash"] for box in boxes}) == 2
+
+
+@pytest.mark.parametrize("boxes, items_per_box", [(100, 3), (1 << 32, 1 << 32)])
+def test_oversized_loot_batch_aborts(node, make_provider, boxes, items_per_box):
+    provider = make_provider()
+    # Straight to the entry function, past the client-side chunking
+    tx_hash, _ = provider._execute(provider.BATCH_LOOT_FUNC, [f"u64:{boxes}", f"u64:{items_per_box}"])
+    assert tx_hash is None
+    [tx] = node._transactions.values()
+    assert not tx.success and tx.vm_status.startswith("Move abort: abort 1")
@@ -0,0 +1,45 @@
+import pytest
+
+from shared.cards import DECK_SIZE, CardSession, CommitmentMismatch, deck_commitment
+
+
+def test_session_deals_the_committed_deck(node, make_provider):
+    provider = make_provider()
+    session = provider.start_card_session()
+    assert session.source == "chain" and session.tx_hash
+    assert sorted(session.deck) == list(range(DECK_SIZE))
+    assert session.commitment == deck_commitment(session.deck)
+
+    hand = session.draw(2)
+    assert list(hand) == session.deck[:2] and hand.tx_hash == session.tx_hash
+    session.draw(DECK_SIZE - 2)
+    assert session.remaining == 0 and list(session.dealt) == session.deck
+    with pytest.raises(ValueError):
+        session.draw()
+
+
+def test_session_matches_chain_views(node, make_provider):
+    provider = make_provider()
+    session = provider.start_card_session()
+    address = provider.scheduler.addresses[0]
+    version = provider._version_of(session.tx_hash)
+    [deck] = provider.rest.view(f"{provider.SESSION_FUNC.rsplit('::', 1)[0]}::deck", [address], ledger_version=version)
+    assert [int(card) for card in deck] == session.deck
+
+
+def test_tampered_deck_is_rejected():
+    deck = list(range(DECK_SIZE))
+    commitment = deck_commitment(deck)
+    deck[0], deck[1] = deck[1], deck[0]
+    with pytest.raises(CommitmentMismatch):
+        CardSession(deck, commitment)
+
+
+def test_session_without_chain_falls_back(make_provider):
+    provider = make_provider()
+    provider.breaker.record(False)
+    provider.breaker.record(False)
+    provider.breaker.record(False)
+    session = provider.start_card_session()
+    assert session.degraded and session.tx_hash is None
+    assert sorted(session.deck) == list(range(DECK_SIZE))
@@ -0,0 +1,80 @@
+import asyncio
+import time
+
+from conftest import counter
+from shared.async_provider import AsyncRandomProvider
+from shared.events import scan_fields
+from shared.random_provider import GAME_ADDR
+
+
+def test_scan_fields_reads_booleans_split_across_chunks():
+    body = b'{"type":"user_transaction","success":false,"events":[],"vm_status":"Move abort"}'
+    split = body.index(b"fal") + 2
+    fields = scan_fields([body[:split], body[split:]], ("type", "success", "vm_status"))
+    assert fields == {"type": "user_transaction", "success": False, "vm_status": "Move abort"}
+
+
+def test_confirmation_reports_abort(node, make_provider):
+    provider = make_provider()
+    del node.entry_functions[f"{GAME_ADDR}::game_examples::roll_dice"]
+    submitter = provider.scheduler._signers[0].submitter
+    tx_hash = submitter.submit(provider.DICE_FUNC, ["u64:6"])
+
+    confirmation = provider.waiter.wait(tx_hash)
+    assert confirmation.success is False
+    assert confirmation.vm_status == "FUNCTION_RESOLUTION_FAILURE"
+
+
+def test_aborted_roll_is_not_read_as_chain_result(node, make_provider):
+    provider = make_provider()
+    first = provider.dice_roll(36)
+    assert first.source == "chain"
+
+    del node.entry_functions[f"{GAME_ADDR}::game_examples::roll_dice"]
+    second = provider.dice_roll(36)
+
+    # Reading DiceGame at the aborted transaction's version would return `first` again.
+    assert second.source == "fallback"
+    assert second.tx_hash is None
+    assert counter("inferenco_failed_transactions_total") == 1
+    assert counter("inferenco_fallbacks_total", kind="roll") == 1
+
+
+def test_batch_events_decoded_from_stream(node, make_provider):
+    provider = make_provider()
+    rolls = provider.dice_roll_batch(provider.MAX_BATCH, 6)
+    assert len(rolls) == provider.MAX_BATCH
+    assert all(roll.source == "chain" and 1 <= roll <= 6 for roll in rolls)
+
+    confirmation = provider._confirm_transaction(rolls[0].tx_hash)
+    assert confirmation.sender == provider.scheduler.addresses[0]
+    assert [event.type for event in confirmation.events()] == [provider.BATCH_DICE_EVENT]
+    assert not hasattr(confirmation, "body")
+
+
+def test_waiter_falls_back_to_polling_without_long_poll(node, make_provider):
+    provider = make_provider()
+    tx_hash = provider.scheduler._signers[0].submitter.submit(provider.DICE_FUNC, ["u64:6"])
+    provider.waiter.long_poll = False
+    confirmation = provider.waiter.wait(tx_hash)
+    assert confirmation.success and confirmation.version is not None
+
+
+def test_more_waiters_than_pool_slots(node, make_provider):
+    # Commits take longer than a request may wait for a pooled connection.
+    node.commit_latency = 2.5
+    provider = make_provider(pool_size=4, timeout=2, confirm_timeout=10)
+    front = AsyncRandomProvider(provider)
+
+    async def play():
+        return await asyncio.gather(*(front.dice_roll(6) for _ in range(9)))
+
+    started = time.monotonic()
+    try:
+        rolls = asyncio.run(play())
+    finally:
+        front.close()
+    # Long-polls can't take every pooled connection, so submissions never starve.
+    assert [roll.source for roll in rolls] == ["chain"] * 9
+    assert time.monotonic() - started < 8
+    assert provider.breaker.state == "closed"
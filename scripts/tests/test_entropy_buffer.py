@@ -0,0 +1,50 @@
+import pytest
+
+from shared.entropy_buffer import EntropyBuffer, EntropyExhausted
+
+
+def _blocks(data):
+    fetched = []
+
+    def fetch():
+        fetched.append(len(fetched))
+        return f"0x{len(fetched):02x}", data
+
+    return fetch, fetched
+
+
+def test_draws_keep_block_provenance():
+    fetch, fetched = _blocks(bytes(range(256)) * 4)
+    buffer = EntropyBuffer(fetch, low_water=0, block_size=1024)
+    values = [buffer.randbelow(6) for _ in range(50)]
+    assert all(0 <= v < 6 and v.source == "buffer" and v.tx_hash == "0x01" for v in values)
+    assert fetched == [0]
+
+
+def test_draw_larger_than_a_block_fails_without_fetching():
+    fetch, fetched = _blocks(bytes(4))
+    buffer = EntropyBuffer(fetch, block_size=4)
+    with pytest.raises(ValueError):
+        buffer.randbelow(1 << 40)
+    assert fetched == []
+
+
+def test_failed_refill_raises():
+    buffer = EntropyBuffer(lambda: None)
+    with pytest.raises(EntropyExhausted):
+        buffer.randint(1, 6)
+
+
+@pytest.mark.parametrize("buffer_size", [0, 4097])
+def test_provider_rejects_block_sizes_the_module_would_abort(node, make_provider, buffer_size):
+    with pytest.raises(ValueError, match="4096"):
+        make_provider(buffered=True, buffer_size=buffer_size)
+    assert node.requests == 0
+
+
+def test_provider_buffers_the_largest_block(node, make_provider):
+    provider = make_provider(buffered=True, buffer_size=4096, low_water=0)
+    roll = provider.dice_roll(6)
+    assert roll.source == "buffer" and 1 <= roll <= 6
+    assert 4000 < provider.buffer.available < 4096  # one full 4096-byte block, one draw taken
+    assert len(node._transactions) == 1
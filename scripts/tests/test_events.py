@@ -0,0 +1,81 @@
+import json
+
+import pytest
+
+from shared.events import EventScanner, attack_outcomes, dice_rolls, iter_events, loot_items, scan_fields
+from shared.random_provider import GAME_ADDR
+
+DICE = f"{GAME_ADDR}::game_batches::DiceBatchRolled"
+LOOT = f"{GAME_ADDR}::game_examples::LootBoxOpened"
+
+TRANSACTION = json.dumps({
+    "type": "user_transaction",
+    "hash": "0xabc",
+    "success": True,
+    "vm_status": "Executed successfully",
+    "payload": {"function": "x::y::z", "arguments": ["6", {"nested": ["]", "}"]}]},
+    "events": [
+        {"type": DICE, "sequence_number": "0", "data": {"player": "0x1", "sides": "6", "rolls": ["1", "6", "3"]}},
+        {"type": "0x1::coin::Deposit", "data": {"note": "brackets ] } [ { and \"quotes\""}},
+        {"type": LOOT, "data": {"item_id": "1234", "rarity": "2", "power": "57"}},
+    ],
+    "timestamp": "1700000000",
+}).encode()
+
+
+def _split_everywhere(types=None, fields=()):
+    for cut in range(1, len(TRANSACTION)):
+        scanner = EventScanner(types, fields)
+        events = scanner.feed(TRANSACTION[:cut]) + scanner.feed(TRANSACTION[cut:])
+        yield cut, events, scanner.fields
+
+
+def test_events_survive_any_chunk_boundary():
+    for cut, events, fields in _split_everywhere((DICE, LOOT), ("type", "success", "timestamp")):
+        assert [e.type for e in events] == [DICE, LOOT], cut
+        assert fields == {"type": "user_transaction", "success": True, "timestamp": "1700000000"}, cut
+
+
+def test_multibyte_text_split_inside_a_character():
+    data = json.dumps({"events": [{"type": DICE, "data": {"name": "dé ✓"}}]}, ensure_ascii=False).encode()
+    cut = data.index("✓".encode()) + 1
+    scanner = EventScanner()
+    events = scanner.feed(data[:cut]) + scanner.feed(data[cut:])
+    assert events[0].data["name"] == "dé ✓"
+
+
+def test_filters_and_field_only_scans():
+    assert [e.type for e in iter_events(TRANSACTION)] == [DICE, "0x1::coin::Deposit", LOOT]
+    assert list(iter_events(TRANSACTION, types=())) == []
+    assert scan_fields(TRANSACTION, ("hash", "vm_status")) == {"hash": "0xabc", "vm_status": "Executed successfully"}
+
+
+def test_typed_views():
+    dice, loot = iter_events(TRANSACTION, (DICE, LOOT))
+    assert list(dice_rolls(dice.data)) == [1, 6, 3]
+    [item] = loot_items(loot.data)
+    assert (item.item_id, item.rarity, item.power, item.box_index) == (1234, 2, 57, 0)
+    damages, crits = attack_outcomes({"outcomes": [{"damage": "12", "is_crit": False},
+                                                   {"damage": "40", "is_crit": True}]})
+    assert list(damages) == [12, 40] and list(crits) == [0, 1]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_chain_transaction_decodes_in_chunks(node, make_provider, chunk_size):
+    provider = make_provider()
+    roll = provider.dice_roll_batch(50, 20)[0]
+    _, body = provider.rest.request("GET", f"/transactions/by_hash/{roll.tx_hash}")
+    chunks = [body[i:i + chunk_size] for i in range(0, len(body), chunk_size)]
+    [event] = iter_events(chunks, (provider.BATCH_DICE_EVENT,))
+    assert list(dice_rolls(event.data)) == [int(r) for r in json.loads(body)["events"][0]["data"]["rolls"]]
+
+
+def test_loot_event_override_is_read_when_the_provider_is_created(node, make_provider, monkeypatch):
+    items = make_provider().open_loot_box(3)
+    assert [item["source"] for item in items] == ["chain"] * 3
+
+    monkeypatch.setenv("INFERENCO_LOOT_EVENT", f"{GAME_ADDR}::my_game::LootDropped")
+    provider = make_provider()
+    assert provider.LOOT_EVENT == f"{GAME_ADDR}::my_game::LootDropped"
+    # The mock node emits game_examples::LootBoxOpened, which this provider now ignores
+    assert [item["source"] for item in provider.open_loot_box(3)] == ["fallback"] * 3
@@ -0,0 +1,60 @@
+import sqlite3
+
+import pytest
+
+from shared.indexer import EventIndexer
+from shared.random_provider import GAME_ADDR
+
+
+def test_query_is_read_only(tmp_path):
+    indexer = EventIndexer(None, str(tmp_path / "index.db"), [], [f"{GAME_ADDR}::game_batches"])
+    try:
+        assert indexer.query("SELECT COUNT(*) FROM events") == [(0,)]
+        with pytest.raises(sqlite3.OperationalError):
+            indexer.query("DELETE FROM events")
+        with pytest.raises(sqlite3.OperationalError):
+            indexer.query("DROP TABLE transactions")
+        # The index itself still writes afterwards.
+        indexer.record_transaction({"hash": "0x1", "version": "7", "sender": "0xa", "timestamp": "1", "events": [
+            {"type": f"{GAME_ADDR}::game_batches::DiceBatchRolled", "data": {"player": "0xA", "rolls": ["3"]}},
+        ]})
+        assert indexer.query("SELECT player, type FROM events") == [
+            ("0xa", f"{GAME_ADDR}::game_batches::DiceBatchRolled")]
+    finally:
+        indexer.close()
+
+
+def test_sync_pages_through_account_transactions(node, make_provider, tmp_path):
+    provider = make_provider()
+    rolls = provider.dice_roll_batch(600, 6)
+    provider.open_loot_box(2)
+    address = provider.scheduler.addresses[0]
+    modules = [f"{GAME_ADDR}::game_batches", f"{GAME_ADDR}::game_examples"]
+    indexer = EventIndexer(provider.rest, str(tmp_path / "index.db"), [address], modules, page_size=2)
+    try:
+        assert indexer.sync() == 4
+        assert indexer.sync() == 0
+        assert indexer.event_counts(address) == {provider.BATCH_DICE_EVENT: 3, provider.LOOT_EVENT: 2}
+
+        [event] = indexer.events_for(rolls[0].tx_hash)
+        assert [int(r) for r in event.data["rolls"]] == [int(r) for r in rolls[:256]]
+        assert indexer.events_for("0x" + "00" * 32) is None
+
+        history = indexer.history(address, limit=3)
+        assert [t for _, _, t, _ in history] == [provider.LOOT_EVENT] * 2 + [provider.BATCH_DICE_EVENT]
+        assert history[0][1] > history[-1][1]
+
+        provider.dice_roll(6)
+        assert indexer.sync() == 1
+    finally:
+        indexer.close()
+
+
+def test_provider_reads_results_through_the_index(node, make_provider, tmp_path):
+    provider = make_provider(index_db=str(tmp_path / "index.db"))
+    try:
+        items = provider.open_loot_box(3)
+        assert [item["source"] for item in items] == ["chain"] * 3
+        assert provider.indexer.query("SELECT COUNT(*) FROM events WHERE type = ?", (provider.LOOT_EVENT,)) == [(3,)]
+    finally:
+        provider.indexer.close()
@@ -0,0 +1,44 @@
+import pytest
+
+from shared.loot_table import RARITY_TABLE, RARITY_WEIGHTS, LootTable
+from shared.simulator import RandomnessSimulator
+
+
+def _sim(i):
+    return RandomnessSimulator(i.to_bytes(32, "big"), 1_700_000_000_000_000 + i)
+
+
+@pytest.mark.parametrize("weights", [RARITY_WEIGHTS, (1,), (0, 5, 0, 1), (10 ** 18, 1, 10 ** 18)])
+def test_sample_matches_weighted_choice(weights):
+    table = LootTable(weights)
+    for i in range(300):
+        index = table.sample(_sim(i))
+        assert index == _sim(i).weighted_choice(list(weights))
+        assert weights[index] > 0
+
+
+def test_index_boundaries_and_prefix_view():
+    table = LootTable((3, 0, 2))
+    assert table.prefix == [3, 3, 5] and table.total == 5 and len(table) == 3
+    assert [table.index_for(v) for v in range(5)] == [0, 0, 0, 2, 2]
+    view = LootTable.from_prefix(["3", "3", "5"])
+    assert (view.prefix, view.total) == (table.prefix, table.total)
+
+
+@pytest.mark.parametrize("weights", [(), (0, 0)])
+def test_rejects_empty_tables(weights):
+    with pytest.raises(ValueError):
+        LootTable(weights)
+
+
+def test_rarity_table_odds():
+    counts = [0] * len(RARITY_WEIGHTS)
+    for i in range(2000):
+        counts[RARITY_TABLE.sample(_sim(i))] += 1
+    assert counts[0] > counts[1] > counts[2] > counts[4]
+
+
+def test_chain_loot_uses_the_rarity_table(node, make_provider):
+    items = make_provider().open_loot_box(20)
+    assert len(items) == 20
+    assert all(item["source"] == "chain" and 0 <= item["rarity"] < len(RARITY_WEIGHTS) for item in items)
@@ -0,0 +1,62 @@
+import pytest
+
+from conftest import counter
+from shared.metrics import Metrics, metrics
+
+
+def _histogram(name, **labels):
+    for h in metrics.snapshot()["histograms"]:
+        if h["name"] == name and h["labels"] == labels:
+            return h["count"]
+    return 0
+
+
+def test_nested_roll_is_timed_once(node, make_provider):
+    provider = make_provider()
+    provider.execute_attack(1, 20, 10)
+    provider.dice_roll(6)
+    assert _histogram("inferenco_call_seconds", method="execute_attack") == 1
+    assert _histogram("inferenco_call_seconds", method="dice_roll") == 1
+
+
+def test_histogram_quantiles_and_merge():
+    a, b = Metrics(), Metrics()
+    for seconds in (0.002,) * 98 + (0.4, 0.4):
+        a.observe("latency", seconds, method="roll")
+    b.observe("latency", 0.002, method="roll")
+    b.inc("calls", 3, method="roll")
+    a.merge(b.snapshot())
+    [h] = a.snapshot()["histograms"]
+    assert h["count"] == 101 and h["p50"] <= 0.0025 and 0.25 < h["p99"] <= 0.5
+    assert a.snapshot()["counters"] == [{"name": "calls", "labels": {"method": "roll"}, "value": 3}]
+
+
+def test_prometheus_text():
+    registry = Metrics()
+    registry.observe("inferenco_call_seconds", 0.003, method="dice_roll")
+    registry.inc("inferenco_errors_total", method="dice_roll")
+    text = registry.prometheus_text()
+    assert "# TYPE inferenco_call_seconds histogram" in text
+    assert 'inferenco_call_seconds_bucket{method="dice_roll",le="0.005"} 1' in text
+    assert 'inferenco_call_seconds_count{method="dice_roll"} 1' in text
+    assert 'inferenco_errors_total{method="dice_roll"} 1' in text
+
+
+def test_spans_nest_under_their_caller():
+    registry = Metrics(tracing=True)
+    with registry.span("outer", method="attack"):
+        with registry.span("inner", phase="submit"):
+            pass
+    inner, outer = registry.spans()
+    assert inner["trace_id"] == outer["trace_id"] == outer["span_id"]
+    assert inner["parent_id"] == outer["span_id"]
+    assert registry.snapshot()["spans"] == [inner, outer]
+
+
+def test_errors_are_counted(node, make_provider):
+    provider = make_provider()
+    with pytest.raises(ValueError):
+        provider.open_loot_boxes(1, 0)
+    assert counter("inferenco_errors_total", method="open_loot_boxes") == 1
+    metrics.reset()
+    assert metrics.snapshot() == {"histograms": [], "counters": []}
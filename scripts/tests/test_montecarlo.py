@@ -0,0 +1,47 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+from shared import montecarlo as mc  # noqa: E402
+from shared.results import RandomValue  # noqa: E402
+from shared.simulator import RandomnessSimulator  # noqa: E402
+
+
+def _sim():
+    return RandomnessSimulator(bytes(range(32)), 1_700_000_000_000_000)
+
+
+@pytest.mark.parametrize("dmg_range", [(0, 100), (1, 20), (10, 1010)])
+def test_attacks_match_the_provider(make_provider, dmg_range):
+    provider = make_provider()
+    seeds = range(1, 10001, 7)
+    damage, is_crit = mc.execute_attack(mc.np.array([s - 1 for s in seeds], dtype=mc.np.uint64), *dmg_range, 30)
+    for seed, d, c in zip(seeds, damage, is_crit):
+        assert (int(d), bool(c)) == tuple(map(int, provider._attack_from_seed(RandomValue(seed), *dmg_range, 30))), seed
+
+
+def test_word_mappings_match_the_simulator():
+    words = mc.simulated_words(300, _sim())
+    sim = _sim()
+    assert mc.dice_roll(words[:100], 6).tolist() == [sim.dice_roll(6) for _ in range(100)]
+    assert mc.weighted_choice(words[100:200], mc.LOOT_WEIGHTS).tolist() == [
+        sim.weighted_choice(list(mc.LOOT_WEIGHTS)) for _ in range(100)]
+    assert mc.u64_range(words[200:], 5, 1000).tolist() == [sim.u64_range(5, 1000) for _ in range(100)]
+
+
+def test_words_from_bytes_are_little_endian():
+    words = mc.words_from_bytes(bytes([1] + [0] * 7 + [0] * 7 + [1] + [9] * 3))
+    assert words.tolist() == [1, 1 << 56]
+
+
+def test_attack_distribution_and_bias_reports():
+    report = mc.attack_distribution(10, 20, 10)
+    assert report["crit_rate"] == pytest.approx(0.10)
+    assert report["unreachable"] == [20]
+    assert mc.boolean_bias(50)["actual"] == pytest.approx(150 / 256)
+    assert mc.modulo_bias(6, bits=8)["overrepresented"] == 4
+
+
+def test_chi_square_accepts_uniform_rolls():
+    rolls = mc.dice_roll(mc.synthetic_words(60_000, seed=1), 6)
+    assert mc.chi_square(rolls - 1, [1] * 6)["p_value"] > 0.001
@@ -0,0 +1,65 @@
+import pytest
+
+from shared.resilience import CircuitBreaker, CircuitOpen, HedgedRestClient
+
+
+def test_breaker_opens_then_lets_one_trial_through(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("shared.resilience.time.monotonic", lambda: now[0])
+    breaker = CircuitBreaker("test", failure_threshold=2, reset_after=10)
+    breaker.record(False)
+    assert breaker.state == "closed" and breaker.allow()
+    breaker.record(False)
+    assert breaker.state == "open" and not breaker.allow()
+
+    now[0] += 10
+    assert breaker.state == "half-open"
+    assert breaker.allow() and not breaker.allow()
+    breaker.record(False)
+    assert breaker.state == "open"
+
+    now[0] += 10
+    assert breaker.allow()
+    breaker.record(True)
+    assert breaker.state == "closed" and breaker.allow()
+
+
+def test_slow_calls_count_as_failures():
+    breaker = CircuitBreaker("test", failure_threshold=1, slow_call=0.5)
+    breaker.record(True, elapsed=0.1)
+    assert breaker.state == "closed"
+    breaker.record(True, elapsed=0.6)
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpen):
+        breaker.call(lambda: None)
+
+
+def test_call_records_exceptions():
+    breaker = CircuitBreaker("test", failure_threshold=1)
+    with pytest.raises(ZeroDivisionError):
+        breaker.call(lambda: 1 / 0)
+    assert breaker.state == "open"
+
+
+def test_hedged_reads_skip_a_dead_endpoint(node, dead_url):
+    rest = HedgedRestClient([dead_url, node.url], hedge_after=0.05, failure_threshold=1, timeout=2)
+    try:
+        assert rest.get_ledger_info()["chain_id"]
+        assert rest.breakers[0].state == "open"
+        before = node.requests
+        assert rest.get_ledger_info()["chain_id"]
+        assert node.requests == before + 1
+        assert b"chain_id" in b"".join(rest.stream("GET", "/"))
+    finally:
+        rest.close()
+
+
+def test_hedged_stream_fails_fast_when_every_endpoint_is_open(dead_url):
+    rest = HedgedRestClient([dead_url], failure_threshold=1, timeout=1)
+    try:
+        with pytest.raises(OSError):
+            rest.get_ledger_info()
+        with pytest.raises(CircuitOpen):
+            next(rest.stream("GET", "/"))
+    finally:
+        rest.close()
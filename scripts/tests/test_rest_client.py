@@ -0,0 +1,49 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from shared.random_provider import GAME_ADDR
+from shared.rest_client import RestClient, RestError
+
+
+@pytest.fixture
+def rest(node):
+    client = RestClient(node.url, pool_size=2, timeout=5)
+    yield client
+    client.close()
+
+
+def test_reads(rest, make_provider):
+    provider = make_provider()
+    roll = provider.dice_roll(6)
+    address = provider.scheduler.addresses[0]
+
+    assert int(rest.get_ledger_info()["chain_id"]) > 0
+    assert rest.get_account(address)["sequence_number"] == "1"
+    resource = rest.get_account_resource(address, provider.DICE_RESOURCE)
+    assert int(resource["data"]["last_roll"]) == int(roll)
+    assert rest.get_account_resource(address, f"{GAME_ADDR}::game_examples::CardGame") is None
+    assert rest.view("0x1::account::get_sequence_number", [address]) == ["1"]
+    assert rest.get_transaction_by_hash(roll.tx_hash)["success"] is True
+    assert rest.get_transaction_by_hash("0x" + "00" * 32) is None
+
+
+def test_errors_carry_status_and_payload(rest):
+    with pytest.raises(RestError) as e:
+        rest.view(f"{GAME_ADDR}::missing::view")
+    assert e.value.status == 400
+
+
+def test_stream_matches_request(rest, make_provider):
+    roll = make_provider().dice_roll_batch(256, 6)[0]
+    path = f"/transactions/by_hash/{roll.tx_hash}"
+    chunks = list(rest.stream("GET", path, chunk_size=1024))
+    assert len(chunks) > 1
+    assert b"".join(chunks) == rest.request("GET", path)[1]
+
+
+def test_pool_is_shared_across_threads(rest):
+    with ThreadPoolExecutor(8) as pool:
+        infos = list(pool.map(lambda _: rest.get_ledger_info(), range(32)))
+    assert len(infos) == 32
+    assert 0 < rest._idle.qsize() <= rest.pool_size
@@ -0,0 +1,20 @@
+from shared.results import RandomSequence, RandomValue
+
+
+def test_values_print_as_plain_numbers():
+    value = RandomValue(12, source="simulator")
+    assert f"{value}" == str(value) == str(int(value)) == "12"
+    assert f"You hit for {value} damage!" == "You hit for 12 damage!"
+    assert f"{value:>4}|{value:03d}|{value:x}" == "  12|012|c"
+    assert repr(value) == "RandomValue(12, source='simulator', tx_hash=None)"
+
+
+def test_sequences_print_as_plain_lists():
+    hand = RandomSequence([3, 51], source="chain", tx_hash="0xab")
+    assert f"{hand}" == str(hand) == "[3, 51]"
+    assert repr(hand).startswith("RandomSequence([3, 51]")
+
+
+def test_provider_results_format_cleanly(make_provider):
+    damage, _ = make_provider().execute_attack(1, 20, 10)
+    assert f"{damage}" == str(int(damage))
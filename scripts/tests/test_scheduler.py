@@ -0,0 +1,85 @@
+import time
+
+from mock_node import Rejected
+
+
+def _sequence_numbers(node, address):
+    return sorted(tx.sequence_number for tx in node._by_sender.get(address, ()))
+
+
+def test_mempool_pushback_waits_for_in_flight_transactions(node, make_provider):
+    node.commit_latency = 1.5
+    provider = make_provider(confirm_timeout=5)
+    address = provider.scheduler.addresses[0]
+
+    submit = node.submit
+    calls = []
+
+    def full_on_third(signed_txn):
+        calls.append(signed_txn)
+        if len(calls) == 3:
+            raise Rejected("Mempool is full", "mempool_is_full")
+        return submit(signed_txn)
+
+    node.submit = full_on_third
+    futures = []
+    for _ in range(3):
+        futures.append(provider.scheduler.submit(provider.DICE_FUNC, ["u64:6"]))
+        time.sleep(0.1)
+    results = [future.result(timeout=15) for future in futures]
+
+    # Resyncing while the first two were still pending would have handed out 0 again.
+    assert all(tx_hash for tx_hash, _ in results)
+    assert _sequence_numbers(node, address) == [0, 1, 2]
+
+
+def test_lost_transaction_is_followed_by_resync(node, make_provider):
+    provider = make_provider(confirm_timeout=1)
+    address = provider.scheduler.addresses[0]
+    node.lose = 1
+
+    lost = provider.scheduler.submit(provider.DICE_FUNC, ["u64:6"])
+    time.sleep(0.1)
+    parked = provider.scheduler.submit(provider.DICE_FUNC, ["u64:6"])
+    assert lost.result(timeout=10)[0] is None
+    assert parked.result(timeout=10)[0] is None
+
+    # Both settled, so the account continues from the chain's number and fills the gap.
+    roll = provider.dice_roll(6)
+    assert roll.source == "chain"
+    assert 0 in _sequence_numbers(node, address)
+
+
+def test_pushback_on_idle_signer_resyncs_at_once(node, make_provider):
+    node.commit_latency = 1.0
+    provider = make_provider(signers=["player", "player2"], confirm_timeout=5)
+    submit = node.submit
+    calls = []
+
+    def full_once(signed_txn):
+        calls.append(signed_txn)
+        if len(calls) == 2:
+            raise Rejected("Mempool is full", "mempool_is_full")
+        return submit(signed_txn)
+
+    node.submit = full_once
+    first = provider.scheduler.submit(provider.DICE_FUNC, ["u64:6"])
+    time.sleep(0.1)
+    second = provider.scheduler.submit(provider.DICE_FUNC, ["u64:6"])
+    started = time.monotonic()
+    assert first.result(timeout=10)[0] and second.result(timeout=10)[0]
+    # The rejected account had nothing else in flight, so it was resynced and retried at once.
+    assert time.monotonic() - started < 2.5
+
+
+def test_post_timeout_resyncs_instead_of_leaving_a_gap(node, make_provider):
+    provider = make_provider(timeout=0.5, confirm_timeout=3)
+    address = provider.scheduler.addresses[0]
+    node.stall, node.stall_seconds = 1, 1.0
+
+    started = time.monotonic()
+    sources = [provider.dice_roll(6).source for _ in range(3)]
+    # Without a resync the second roll would sit behind the missing number until it timed out.
+    assert sources == ["fallback", "chain", "chain"]
+    assert time.monotonic() - started < 3
+    assert _sequence_numbers(node, address) == [0, 1]
@@ -0,0 +1,130 @@
+import hashlib
+import struct
+
+import pytest
+
+from shared.bcs import parse_address
+from shared.simulator import (
+    DEFAULT_MODULE_ADDR, MoveAbort, RandomnessSimulator, bytes_to_u128, bytes_to_u256, bytes_to_u64,
+)
+
+TX_HASH = bytes(range(32))
+TIMESTAMP_US = 1_700_000_000_000_000
+
+
+def _sim(**kwargs):
+    return RandomnessSimulator(TX_HASH, TIMESTAMP_US, **kwargs)
+
+
+def _sha3(data):
+    return hashlib.sha3_256(data).digest()
+
+
+def _le_u64(n):
+    return struct.pack("<Q", n)
+
+
+# Written straight from sources/inferenco_random.move and the framework's AUID
+# derivation, without the simulator's shared-prefix shortcuts.
+
+def _auid(n):
+    return _sha3(TX_HASH + _le_u64(n) + b"\xfb")
+
+
+def _next_bytes(unique, script_hash=b""):
+    return _sha3(TX_HASH + _le_u64(TIMESTAMP_US) + parse_address(DEFAULT_MODULE_ADDR) + unique + script_hash)
+
+
+def test_converters_match_the_move_test():
+    # test_converters in inferenco_random.move
+    data = bytes.fromhex("0102030405060708090a0b0c0d0e0f101112131415161718191a1b1c1d1e1f20")
+    assert bytes_to_u64(data, 0) == 0x0807060504030201
+    assert bytes_to_u64(data, 8) == 0x100f0e0d0c0b0a09
+    assert bytes_to_u64(data, 30) == 0x0807060504030201
+    assert bytes_to_u128(data, 16) == 0x201f1e1d1c1b1a191817161514131211
+    assert bytes_to_u256(data) == 0x201f1e1d1c1b1a191817161514131211100f0e0d0c0b0a090807060504030201
+
+
+def test_auid_derivation():
+    sim = _sim()
+    assert [sim.next_auid() for _ in range(3)] == [_auid(1), _auid(2), _auid(3)]
+    assert _auid(1).hex() == "34f5eb0f9ebb39e9b6aa7b5e9b8ced0c76d88c74ed1ac6f6b3e8d6bd13c37396"
+    # auid_counter counts the AUIDs generated before the first draw
+    assert _sim(auid_counter=4).next_auid() == _auid(5)
+
+
+def test_next_bytes():
+    sim = _sim()
+    assert sim.next_bytes() == _next_bytes(_auid(1))
+    assert sim.next_bytes() == _next_bytes(_auid(2))
+    assert _sim().next_bytes().hex() == "bcb9d0c9321bfd7a70fde494fe2cc4a5d2ccb1bb138a7bd5ccf344e5eea7fdfa"
+    assert _sim(script_hash=b"\x07" * 32).next_bytes() == _next_bytes(_auid(1), b"\x07" * 32)
+
+
+def test_integer_generators_read_little_endian():
+    block = _next_bytes(_auid(1))
+    assert _sim().u8_integer() == block[0]
+    assert _sim().u16_integer() == block[0] | block[1] << 8
+    assert _sim().u64_integer() == bytes_to_u64(block)
+    assert _sim().u256_integer() == bytes_to_u256(block)
+    assert _sim().u64_words(3) == [bytes_to_u64(_next_bytes(_auid(n))) for n in (1, 2, 3)]
+
+
+def test_counter_mode_bytes():
+    seed = _next_bytes(_auid(1))
+    blocks = seed + _sha3(seed + _le_u64(1)) + _sha3(seed + _le_u64(2))
+    assert _sim().bytes(96) == blocks
+    assert _sim().bytes(70) == blocks[:70]
+    assert _sim().bytes(40).hex() == (
+        "bcb9d0c9321bfd7a70fde494fe2cc4a5d2ccb1bb138a7bd5ccf344e5eea7fdfa7c53f51b18ec4433")
+    assert _sim().bytes(0) == b""
+
+    # test_bytes_blocks_differ: block 1 is sha3_256(seed || bcs(1u64))
+    out = _sim().bytes(64)
+    assert _sha3(out[:32] + _le_u64(1)) == out[32:]
+
+    # One draw per call, however long the output
+    sim = _sim()
+    sim.bytes(4096)
+    assert sim.next_bytes() == _next_bytes(_auid(2))
+
+
+def test_legacy_paths():
+    sim = _sim()
+    assert sim.legacy_bytes(70) == b"".join(_next_bytes(_auid(n)) for n in (1, 2, 3))[:70]
+    # Both versions of bytes(n) agree up to one block
+    assert _sim().legacy_bytes(20) == _sim().bytes(20)
+
+    # The original module mixed in the incremented global RandomnessCounter
+    sim = _sim(legacy_counter=41)
+    assert sim.next_bytes() == _next_bytes(_le_u64(42))
+    assert sim.next_bytes() == _next_bytes(_le_u64(43))
+    assert _sim(legacy_counter=41).next_bytes().hex() == (
+        "367cd86bbda9d6b7f51bb35f51303c71eb14b3c2078ba366b17fc816fd318470")
+
+
+def test_permutation():
+    words = [bytes_to_u64(_next_bytes(_auid(n))) for n in range(1, 10)]
+    expected = list(range(10))
+    for i, word in zip(range(9, 0, -1), words):
+        j = word % (i + 1)
+        expected[i], expected[j] = expected[j], expected[i]
+    assert _sim().permutation(10) == expected == [5, 6, 8, 2, 9, 3, 1, 7, 0, 4]
+    assert _sim().permutation(1) == [0]
+    with pytest.raises(MoveAbort):
+        _sim().permutation(0)
+
+
+def test_weighted_choice():
+    weights = [50, 30, 20]
+    sim = _sim()
+    for n in range(1, 11):
+        value = bytes_to_u64(_next_bytes(_auid(n))) % 100
+        assert sim.weighted_choice(weights) == (0 if value < 50 else 1 if value < 80 else 2)
+    assert _sim().weighted_choice([0, 0, 5]) == 2
+    with pytest.raises(MoveAbort) as e:
+        _sim().weighted_choice([0, 0])
+    assert e.value.code == 1
+    with pytest.raises(MoveAbort) as e:
+        _sim().weighted_choice([])
+    assert e.value.code == 3
@@ -0,0 +1,61 @@
+import time
+
+import pytest
+
+from conftest import counter
+
+
+def test_speculative_result_is_reused(node, make_provider):
+    provider = make_provider()
+    try:
+        pending = provider.speculate("dice_roll", 6)
+        roll = pending.result(timeout=10)
+        assert roll.source == "chain" and 1 <= roll <= 6
+        # Collecting the result again is free: the roll was made once, on chain.
+        assert pending.result() is roll
+        assert len(node._transactions) == 1
+        assert counter("inferenco_speculative_total", method="dice_roll") == 1
+    finally:
+        provider.close()
+
+
+def test_announced_once_the_status_line_is_out(node, make_provider, capsys):
+    node.commit_latency = 1.0
+    provider = make_provider()
+    try:
+        pending = provider.speculate("dice_roll", 6)
+        assert pending.announced.wait(timeout=5) and not pending.done()
+        assert "Requesting on-chain random roll" in capsys.readouterr().out
+        pending.result(timeout=10)
+    finally:
+        provider.close()
+
+
+def test_speculate_rejects_private_and_unknown_methods(make_provider):
+    provider = make_provider()
+    for method in ("_execute", "no_such_method", "LOOT_FUNC"):
+        with pytest.raises(ValueError):
+            provider.speculate(method)
+
+
+def test_close_cancels_pending_speculations(node, make_provider):
+    node.commit_latency = 1.0
+    provider = make_provider()
+    # Four run at once; the rest wait for a worker.
+    futures = [provider.speculate("dice_roll", 6) for _ in range(7)]
+    while not all(f.running() for f in futures[:4]):
+        time.sleep(0.01)
+
+    started = time.monotonic()
+    provider.close()
+    assert time.monotonic() - started < 0.5  # doesn't wait for the running ones
+    assert [f.cancelled() for f in futures] == [False] * 4 + [True] * 3
+    assert all(f.announced.is_set() for f in futures[4:])
+
+    # The running rolls still finish, and only they reached the node.
+    assert all(f.result(timeout=10).source == "chain" for f in futures[:4])
+    assert len(node._transactions) == 4
+
+    # A later speculation starts a fresh executor.
+    assert 1 <= provider.speculate("dice_roll", 6).result(timeout=10) <= 6
+    provider.close()
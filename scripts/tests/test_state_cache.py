@@ -0,0 +1,52 @@
+from shared.rest_client import RestClient
+from shared.state_cache import StateCache
+
+
+def test_pinned_reads_are_cached_and_latest_reads_are_not(node, make_provider):
+    provider = make_provider()
+    first = provider.dice_roll(6)
+    second = provider.dice_roll(6)
+    address = provider.scheduler.addresses[0]
+    version = provider._version_of(first.tx_hash)
+
+    cache = StateCache(RestClient(node.url))
+    before = node.requests
+    pinned = [cache.resource(address, provider.DICE_RESOURCE, version) for _ in range(3)]
+    assert [int(data["last_roll"]) for data in pinned] == [int(first)] * 3
+    assert (cache.misses, cache.hits, node.requests - before) == (1, 2, 1)
+
+    latest = cache.resource(address, provider.DICE_RESOURCE)
+    assert int(latest["last_roll"]) == int(second)
+    cache.resource(address, provider.DICE_RESOURCE)
+    assert node.requests - before == 3 and cache.hits == 2
+
+
+def test_views_and_missing_resources_are_cached(node, make_provider):
+    provider = make_provider()
+    provider.dice_roll(6)
+    address = provider.scheduler.addresses[0]
+    cache = StateCache(RestClient(node.url))
+    assert cache.resource(address, provider.CARD_RESOURCE, 1) is None
+    assert cache.resource(address, provider.CARD_RESOURCE, 1) is None
+    view = "0x1::account::get_sequence_number"
+    assert cache.view(view, [address], ledger_version=1) == cache.view(view, [address], ledger_version=1)
+    assert (cache.misses, cache.hits) == (2, 2)
+
+
+def test_least_recently_used_entries_are_evicted():
+    class Rest:
+        calls = 0
+
+        def get_account_resource(self, address, resource_type, ledger_version=None):
+            self.calls += 1
+            return {"data": {"version": ledger_version}}
+
+    rest = Rest()
+    cache = StateCache(rest, max_entries=2)
+    for version in (1, 2, 1, 3, 1, 2):
+        assert cache.resource("0xA", "R", version) == {"version": version}
+    # 1 stays hot; 2 was evicted by 3 and fetched again.
+    assert rest.calls == 4
+    cache.clear()
+    cache.resource("0xa", "R", 1)
+    assert rest.calls == 5
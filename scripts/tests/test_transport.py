@@ -0,0 +1,52 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from shared.random_provider import RandomProvider
+from shared.rest_client import RestClient
+from shared.transport import Cassette, RecordingRestClient, ReplayRestClient, _http_key
+
+
+def _concurrent_rolls(provider, n):
+    with ThreadPoolExecutor(n) as pool:
+        return sorted((roll.tx_hash, int(roll), roll.source) for roll in pool.map(provider.dice_roll, [6] * n))
+
+
+def test_replay_hands_each_signer_its_own_submission(node, make_provider, tmp_path):
+    path = str(tmp_path / "session.cassette")
+    recorder = make_provider(signers=["player", "player2"], max_in_flight=1, record=path)
+    recorded = _concurrent_rolls(recorder, 4)
+    recorder.cassette.close()
+    assert {source for _, _, source in recorded} == {"chain"}
+    assert len(node._by_sender) == 2
+
+    # Original timing keeps the recorded overlap, so each signer sends the same sequence numbers.
+    replayer = RandomProvider(replay=path, replay_timing="original", max_in_flight=1)
+    try:
+        assert _concurrent_rolls(replayer, 4) == recorded
+    finally:
+        replayer.scheduler.shutdown(wait=False)
+
+
+def test_submission_key_ignores_signature_and_expiration(make_provider):
+    provider = make_provider(signers=["player", "player2"])
+    first, second = (signer.submitter for signer in provider.scheduler._signers)
+    body = first.build(provider.DICE_FUNC, ["u64:6"], 3)
+    assert _http_key("POST", "/transactions", None, body) == _http_key(
+        "POST", "/transactions", None, first.build(provider.DICE_FUNC, ["u64:6"], 3))
+    assert _http_key("POST", "/transactions", None, body) != _http_key(
+        "POST", "/transactions", None, second.build(provider.DICE_FUNC, ["u64:6"], 3))
+    assert _http_key("POST", "/transactions", None, body) != _http_key(
+        "POST", "/transactions", None, first.build(provider.DICE_FUNC, ["u64:20"], 3))
+
+
+def test_transport_errors_are_recorded_and_replayed(dead_url, tmp_path):
+    path = str(tmp_path / "errors.cassette")
+    recorder = RecordingRestClient(RestClient(dead_url, timeout=1), Cassette(path, "record"))
+    with pytest.raises(ConnectionRefusedError):
+        recorder.request("GET", "/")
+    recorder.close()
+
+    replayer = ReplayRestClient(Cassette(path, "replay"))
+    with pytest.raises(ConnectionRefusedError):
+        replayer.request("GET", "/")
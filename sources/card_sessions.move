@@ -0,0 +1,168 @@
+/// Card sessions: shuffle once on chain, draw many times off chain
+///
+/// `start_session` shuffles a 52-card deck with `randomness::permutation(52)`
+/// and stores it under the player together with a commitment,
+/// `sha3_256(bcs(deck))`, which is also emitted in `SessionStarted`. Clients
+/// read the deck once (resource or `deck` view), check it against the
+/// committed hash from the event and then deal any number of cards locally,
+/// so a whole hand costs one transaction. `cards` serves slices of the deck
+/// to clients that prefer not to cache it.
+///
+/// The deck is public state: like the rest of this package this is for
+/// testnet and low-stakes games, the commitment guards the client's cache,
+/// it doesn't hide the cards.
+module inferenco::card_sessions {
+    use std::bcs;
+    use std::hash;
+    use std::signer;
+    use std::vector;
+    use cedra_framework::event;
+    use inferenco::randomness;
+
+    /// Errors
+    const E_NO_SESSION: u64 = 1;
+    const E_OUT_OF_RANGE: u64 = 2;
+
+    const DECK_SIZE: u64 = 52;
+
+    struct CardSession has key {
+        session_id: u64,
+        deck: vector<u64>,
+        commitment: vector<u8>,
+    }
+
+    #[event]
+    struct SessionStarted has drop, store {
+        player: address,
+        session_id: u64,
+        commitment: vector<u8>,
+    }
+
+    /// Shuffle a fresh deck for the caller, replacing any previous session
+    public entry fun start_session(player: &signer) acquires CardSession {
+        let addr = signer::address_of(player);
+        let deck = randomness::permutation(DECK_SIZE);
+        let commitment = hash::sha3_256(bcs::to_bytes(&deck));
+
+        let session_id = if (exists<CardSession>(addr)) {
+            let session = borrow_global_mut<CardSession>(addr);
+            session.session_id = session.session_id + 1;
+            session.deck = deck;
+            session.commitment = commitment;
+            session.session_id
+        } else {
+            move_to(player, CardSession { session_id: 0, deck, commitment });
+            0
+        };
+
+        event::emit(SessionStarted { player: addr, session_id, commitment });
+    }
+
+    #[view]
+    public fun has_session(player: address): bool {
+        exists<CardSession>(player)
+    }
+
+    #[view]
+    /// `(session_id, commitment)` of the player's current deck
+    public fun session(player: address): (u64, vector<u8>) acquires CardSession {
+        assert!(exists<CardSession>(player), E_NO_SESSION);
+        let session = borrow_global<CardSession>(player);
+        (session.session_id, session.commitment)
+    }
+
+    #[view]
+    /// The whole shuffled deck, for clients that deal from a local copy
+    public fun deck(player: address): vector<u64> acquires CardSession {
+        assert!(exists<CardSession>(player), E_NO_SESSION);
+        borrow_global<CardSession>(player).deck
+    }
+
+    #[view]
+    /// `count` cards starting at position `from` of the deck
+    public fun cards(player: address, from: u64, count: u64): vector<u64> acquires CardSession {
+        assert!(exists<CardSession>(player), E_NO_SESSION);
+        assert!(from + count <= DECK_SIZE, E_OUT_OF_RANGE);
+        let deck = &borrow_global<CardSession>(player).deck;
+        let result = vector::empty<u64>();
+        let i = from;
+        while (i < from + count) {
+            vector::push_back(&mut result, *vector::borrow(deck, i));
+            i = i + 1;
+        };
+        result
+    }
+
+    // ========================================================================
+    // TESTS
+    // ========================================================================
+
+    #[test_only]
+    use cedra_framework::timestamp;
+
+    #[test_only]
+    fun setup(account: &signer, framework: &signer) {
+        timestamp::set_time_has_started_for_testing(framework);
+        randomness::initialize(account);
+    }
+
+    #[test(account = @inferenco, framework = @0x1)]
+    fun test_start_session(account: &signer, framework: &signer) acquires CardSession {
+        setup(account, framework);
+
+        start_session(account);
+
+        let deck = deck(@inferenco);
+        assert!(vector::length(&deck) == DECK_SIZE, 0);
+        let i = 0;
+        while (i < DECK_SIZE) {
+            assert!(vector::contains(&deck, &i), 1);
+            i = i + 1;
+        };
+
+        let (session_id, commitment) = session(@inferenco);
+        assert!(session_id == 0, 2);
+        assert!(commitment == hash::sha3_256(bcs::to_bytes(&deck)), 3);
+
+        let events = event::emitted_events<SessionStarted>();
+        assert!(vector::length(&events) == 1, 4);
+        assert!(vector::borrow(&events, 0).commitment == commitment, 5);
+    }
+
+    #[test(account = @inferenco, framework = @0x1)]
+    fun test_cards_slice(account: &signer, framework: &signer) acquires CardSession {
+        setup(account, framework);
+        start_session(account);
+
+        let deck = deck(@inferenco);
+        let hand = cards(@inferenco, 4, 3);
+        assert!(hand == vector[*vector::borrow(&deck, 4), *vector::borrow(&deck, 5), *vector::borrow(&deck, 6)], 0);
+        assert!(vector::length(&cards(@inferenco, 0, DECK_SIZE)) == DECK_SIZE, 1);
+    }
+
+    #[test(account = @inferenco, framework = @0x1)]
+    fun test_new_session_replaces_deck(account: &signer, framework: &signer) acquires CardSession {
+        setup(account, framework);
+        start_session(account);
+        start_session(account);
+
+        let (session_id, commitment) = session(@inferenco);
+        assert!(session_id == 1, 0);
+        assert!(commitment == hash::sha3_256(bcs::to_bytes(&deck(@inferenco))), 1);
+    }
+
+    #[test(account = @inferenco, framework = @0x1)]
+    #[expected_failure(abort_code = E_OUT_OF_RANGE)]
+    fun test_cards_past_end(account: &signer, framework: &signer) acquires CardSession {
+        setup(account, framework);
+        start_session(account);
+
+        cards(@inferenco, 50, 3);
+    }
+
+    #[test]
+    #[expected_failure(abort_code = E_NO_SESSION)]
+    fun test_no_session() acquires CardSession {
+        deck(@0xcafe);
+    }
+}
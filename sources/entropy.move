@@ -0,0 +1,63 @@
+/// Bulk entropy for off-chain consumers
+///
+/// Emits a block of `randomness::bytes(n)` in a single transaction so a client
+/// can buffer it and serve many small draws (coin flips, d6 rolls) locally,
+/// auditing every draw back to the transaction hash that produced it.
+module inferenco::entropy {
+    use std::signer;
+    use cedra_framework::event;
+    use inferenco::randomness;
+
+    /// Errors
+    const E_INVALID_LENGTH: u64 = 1;
+
+    /// Upper bound on one block, keeps the event (and gas) bounded
+    const MAX_BLOCK_BYTES: u64 = 4096;
+
+    #[event]
+    struct EntropyBlock has drop, store {
+        requester: address,
+        bytes: vector<u8>,
+    }
+
+    /// Emit `n` random bytes (1..=4096) as an `EntropyBlock` event
+    public entry fun request_bytes(requester: &signer, n: u64) {
+        assert!(n > 0 && n <= MAX_BLOCK_BYTES, E_INVALID_LENGTH);
+        event::emit(EntropyBlock {
+            requester: signer::address_of(requester),
+            bytes: randomness::bytes(n),
+        });
+    }
+
+    // ========================================================================
+    // TESTS
+    // ========================================================================
+
+    #[test_only]
+    use std::vector;
+    #[test_only]
+    use cedra_framework::timestamp;
+
+    #[test(account = @inferenco, framework = @0x1)]
+    fun test_request_bytes(account: &signer, framework: &signer) {
+        timestamp::set_time_has_started_for_testing(framework);
+        randomness::initialize(account);
+
+        request_bytes(account, 1000);
+
+        let events = event::emitted_events<EntropyBlock>();
+        assert!(vector::length(&events) == 1, 0);
+        let block = vector::borrow(&events, 0);
+        assert!(vector::length(&block.bytes) == 1000, 1);
+        assert!(block.requester == @inferenco, 2);
+    }
+
+    #[test(account = @inferenco, framework = @0x1)]
+    #[expected_failure(abort_code = E_INVALID_LENGTH)]
+    fun test_request_too_many_bytes(account: &signer, framework: &signer) {
+        timestamp::set_time_has_started_for_testing(framework);
+        randomness::initialize(account);
+
+        request_bytes(account, MAX_BLOCK_BYTES + 1);
+    }
+}
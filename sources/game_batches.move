@@ -0,0 +1,230 @@
+/// Batched game actions
+///
+/// Each entry function produces many outcomes in one transaction and writes
+/// them into a single event, spreading gas and confirmation latency across
+/// the whole batch. Outcome rules mirror the single-shot demo games:
+/// - dice: `randomness::dice_roll(sides)` per roll
+/// - attacks: one d10000 seed per attack, split into crit (seed % 100) and
+///   damage luck ((seed / 100) % 100), crits deal double damage
+/// - loot: rarity weights [50, 30, 15, 4, 1], item_id in [1000, 9999],
+///   power in [10, 100]
+module inferenco::game_batches {
+    use std::signer;
+    use std::vector;
+    use cedra_framework::event;
+    use inferenco::randomness;
+
+    /// Errors
+    const E_INVALID_BATCH: u64 = 1;
+    const E_INVALID_RANGE: u64 = 2;
+
+    /// Upper bound on outcomes per transaction, keeps events (and gas) bounded
+    const MAX_BATCH: u64 = 256;
+
+    struct AttackOutcome has copy, drop, store {
+        damage: u64,
+        is_crit: bool,
+    }
+
+    struct LootItem has copy, drop, store {
+        box_index: u64,
+        item_id: u64,
+        rarity: u64,
+        power: u64,
+    }
+
+    #[event]
+    struct DiceBatchRolled has drop, store {
+        player: address,
+        sides: u64,
+        rolls: vector<u64>,
+    }
+
+    #[event]
+    struct AttackBatchResolved has drop, store {
+        player: address,
+        outcomes: vector<AttackOutcome>,
+    }
+
+    #[event]
+    struct LootBoxesOpened has drop, store {
+        player: address,
+        items: vector<LootItem>,
+    }
+
+    /// Roll `count` dice with `sides` sides each
+    public entry fun roll_dice_batch(player: &signer, count: u64, sides: u64) {
+        assert!(count > 0 && count <= MAX_BATCH, E_INVALID_BATCH);
+        assert!(sides > 0, E_INVALID_RANGE);
+
+        let rolls = vector::empty<u64>();
+        let i = 0;
+        while (i < count) {
+            vector::push_back(&mut rolls, randomness::dice_roll(sides));
+            i = i + 1;
+        };
+
+        event::emit(DiceBatchRolled { player: signer::address_of(player), sides, rolls });
+    }
+
+    /// Resolve `count` attacks dealing `min_dmg`..`max_dmg` with `crit_chance` percent crits
+    public entry fun attack_batch(
+        player: &signer,
+        count: u64,
+        min_dmg: u64,
+        max_dmg: u64,
+        crit_chance: u64,
+    ) {
+        assert!(count > 0 && count <= MAX_BATCH, E_INVALID_BATCH);
+        assert!(max_dmg >= min_dmg && crit_chance <= 100, E_INVALID_RANGE);
+
+        let outcomes = vector::empty<AttackOutcome>();
+        let i = 0;
+        while (i < count) {
+            vector::push_back(&mut outcomes, attack_from_seed(randomness::dice_roll(10000), min_dmg, max_dmg, crit_chance));
+            i = i + 1;
+        };
+
+        event::emit(AttackBatchResolved { player: signer::address_of(player), outcomes });
+    }
+
+    /// Open `boxes` loot boxes with `items_per_box` items each
+    public entry fun open_loot_boxes(player: &signer, boxes: u64, items_per_box: u64) {
+        // Cap each factor first, so the product below can't overflow u64
+        assert!(boxes > 0 && boxes <= MAX_BATCH, E_INVALID_BATCH);
+        assert!(items_per_box > 0 && items_per_box <= MAX_BATCH, E_INVALID_BATCH);
+        assert!(boxes * items_per_box <= MAX_BATCH, E_INVALID_BATCH);
+
+        let weights = vector[50, 30, 15, 4, 1];
+        let items = vector::empty<LootItem>();
+        let box_index = 0;
+        while (box_index < boxes) {
+            let i = 0;
+            while (i < items_per_box) {
+                let rarity = randomness::weighted_choice(&weights);
+                vector::push_back(&mut items, LootItem {
+                    box_index,
+                    item_id: randomness::u64_range(1000, 10000),
+                    rarity,
+                    power: randomness::u64_range(10, 101),
+                });
+                i = i + 1;
+            };
+            box_index = box_index + 1;
+        };
+
+        event::emit(LootBoxesOpened { player: signer::address_of(player), items });
+    }
+
+    /// Split one d10000 roll into damage luck and a crit check
+    fun attack_from_seed(seed: u64, min_dmg: u64, max_dmg: u64, crit_chance: u64): AttackOutcome {
+        let crit_roll = seed % 100;
+        let luck_roll = (seed / 100) % 100;
+
+        let damage = min_dmg + luck_roll * (max_dmg - min_dmg) / 100;
+        let is_crit = crit_roll < crit_chance;
+        if (is_crit) {
+            damage = damage * 2;
+        };
+
+        AttackOutcome { damage, is_crit }
+    }
+
+    // ========================================================================
+    // TESTS
+    // ========================================================================
+
+    #[test_only]
+    use cedra_framework::timestamp;
+
+    #[test_only]
+    fun setup(account: &signer, framework: &signer) {
+        timestamp::set_time_has_started_for_testing(framework);
+        randomness::initialize(account);
+    }
+
+    #[test(account = @inferenco, framework = @0x1)]
+    fun test_roll_dice_batch(account: &signer, framework: &signer) {
+        setup(account, framework);
+
+        roll_dice_batch(account, 100, 6);
+
+        let events = event::emitted_events<DiceBatchRolled>();
+        assert!(vector::length(&events) == 1, 0);
+        let rolls = &vector::borrow(&events, 0).rolls;
+        assert!(vector::length(rolls) == 100, 1);
+        let i = 0;
+        while (i < 100) {
+            let r = *vector::borrow(rolls, i);
+            assert!(r >= 1 && r <= 6, 2);
+            i = i + 1;
+        };
+    }
+
+    #[test(account = @inferenco, framework = @0x1)]
+    fun test_attack_batch(account: &signer, framework: &signer) {
+        setup(account, framework);
+
+        attack_batch(account, 50, 1, 20, 10);
+
+        let events = event::emitted_events<AttackBatchResolved>();
+        let outcomes = &vector::borrow(&events, 0).outcomes;
+        assert!(vector::length(outcomes) == 50, 0);
+        let i = 0;
+        while (i < 50) {
+            let outcome = vector::borrow(outcomes, i);
+            let max = if (outcome.is_crit) { 40 } else { 20 };
+            assert!(outcome.damage >= 1 && outcome.damage <= max, 1);
+            i = i + 1;
+        };
+    }
+
+    #[test]
+    fun test_attack_from_seed() {
+        // seed 1234: crit roll 34, luck roll 12
+        let outcome = attack_from_seed(1234, 10, 110, 35);
+        assert!(outcome.is_crit, 0);
+        assert!(outcome.damage == (10 + 12) * 2, 1);
+
+        let outcome = attack_from_seed(1234, 10, 110, 34);
+        assert!(!outcome.is_crit, 2);
+        assert!(outcome.damage == 22, 3);
+    }
+
+    #[test(account = @inferenco, framework = @0x1)]
+    fun test_open_loot_boxes(account: &signer, framework: &signer) {
+        setup(account, framework);
+
+        open_loot_boxes(account, 4, 3);
+
+        let events = event::emitted_events<LootBoxesOpened>();
+        let items = &vector::borrow(&events, 0).items;
+        assert!(vector::length(items) == 12, 0);
+        let i = 0;
+        while (i < 12) {
+            let item = vector::borrow(items, i);
+            assert!(item.box_index == i / 3, 1);
+            assert!(item.rarity <= 4, 2);
+            assert!(item.item_id >= 1000 && item.item_id <= 9999, 3);
+            assert!(item.power >= 10 && item.power <= 100, 4);
+            i = i + 1;
+        };
+    }
+
+    #[test(account = @inferenco, framework = @0x1)]
+    #[expected_failure(abort_code = E_INVALID_BATCH)]
+    fun test_batch_too_large(account: &signer, framework: &signer) {
+        setup(account, framework);
+
+        open_loot_boxes(account, 100, 3);
+    }
+
+    #[test(account = @inferenco, framework = @0x1)]
+    #[expected_failure(abort_code = E_INVALID_BATCH)]
+    fun test_batch_product_overflow(account: &signer, framework: &signer) {
+        setup(account, framework);
+
+        // 2^32 * 2^32 overflows u64; must abort with E_INVALID_BATCH, not an arithmetic error
+        open_loot_boxes(account, 4294967296, 4294967296);
+    }
+}
@@ -10,14 +10,16 @@
 /// - For high-value games, use external VRF or wait for native randomness
 ///
 /// USAGE:
-/// - Call initialize() once at deployment to set up the module
-/// - All functions read/write counter at @inferenco (module address)
+/// - No global state is read or written when generating randomness, so
+///   transactions using this module don't conflict and can execute in parallel
+/// - initialize() is kept for compatibility with existing deployments
 /// - API matches native randomness: bytes(n), u64_integer(), etc.
 module inferenco::randomness {
     use std::bcs;
     use std::hash;
     use std::signer;
     use std::vector;
+    use cedra_std::from_bcs;
     use cedra_framework::timestamp;
     use cedra_framework::transaction_context;
 
@@ -27,12 +29,13 @@ module inferenco::randomness {
     const E_EMPTY_VECTOR: u64 = 3;
     const E_NOT_AUTHORIZED: u64 = 4;
 
-    /// Global counter for entropy - stored at @inferenco
+    /// Legacy global counter - stored at @inferenco
+    /// No longer advanced: per-call uniqueness now comes from a transaction-local AUID
     struct RandomnessCounter has key {
         counter: u64,
     }
 
-    /// Initialize the randomness module (call once at deployment)
+    /// Initialize the randomness module (optional, kept for compatibility)
     /// Must be called by the module deployer (@inferenco)
     public entry fun initialize(account: &signer) {
         let addr = signer::address_of(account);
@@ -47,12 +50,11 @@ module inferenco::randomness {
 
     /// Internal function to generate raw random bytes
     /// Combines multiple entropy sources for better randomness
-    fun next_bytes(): vector<u8> acquires RandomnessCounter {
-        assert!(exists<RandomnessCounter>(@inferenco), E_NOT_INITIALIZED);
-
-        let counter_ref = borrow_global_mut<RandomnessCounter>(@inferenco);
-        counter_ref.counter = counter_ref.counter + 1;
-
+    ///
+    /// Never touches global storage: a shared counter resource would make every
+    /// transaction using this module write the same location, forcing Block-STM
+    /// to execute them one after another.
+    fun next_bytes(): vector<u8> {
         // Build entropy from multiple sources
         let entropy = vector::empty<u8>();
 
@@ -69,9 +71,11 @@ module inferenco::randomness {
         let addr_bytes = bcs::to_bytes(&@inferenco);
         vector::append(&mut entropy, addr_bytes);
 
-        // 4. Counter (unique per call within transaction)
-        let counter_bytes = bcs::to_bytes(&counter_ref.counter);
-        vector::append(&mut entropy, counter_bytes);
+        // 4. AUID (unique per call within and across transactions)
+        // Derived natively from the tx hash and a transaction-local counter.
+        let auid = transaction_context::generate_auid_address();
+        let auid_bytes = bcs::to_bytes(&auid);
+        vector::append(&mut entropy, auid_bytes);
 
         // 5. Script hash (if available)
         let script_hash = transaction_context::get_script_hash();
@@ -81,51 +85,27 @@ module inferenco::randomness {
         hash::sha3_256(entropy)
     }
 
-    /// Convert bytes to u64
+    /// Convert bytes to u64 (little-endian, as BCS encodes it)
+    /// Reads from offset 0 if fewer than 8 bytes follow `offset`
     fun bytes_to_u64(bytes: &vector<u8>, offset: u64): u64 {
-        let len = vector::length(bytes);
-        if (offset + 8 > len) {
+        if (offset + 8 > vector::length(bytes)) {
             offset = 0;
         };
-        
-        let result: u64 = 0;
-        let i = 0;
-        while (i < 8 && offset + i < len) {
-            let byte = (*vector::borrow(bytes, offset + i) as u64);
-            result = result | (byte << ((i * 8) as u8));
-            i = i + 1;
-        };
-        result
+        from_bcs::to_u64(vector::slice(bytes, offset, offset + 8))
     }
 
-    /// Convert bytes to u128
+    /// Convert bytes to u128 (little-endian, as BCS encodes it)
+    /// Reads from offset 0 if fewer than 16 bytes follow `offset`
     fun bytes_to_u128(bytes: &vector<u8>, offset: u64): u128 {
-        let len = vector::length(bytes);
-        if (offset + 16 > len) {
+        if (offset + 16 > vector::length(bytes)) {
             offset = 0;
         };
-        
-        let result: u128 = 0;
-        let i = 0;
-        while (i < 16 && offset + i < len) {
-            let byte = (*vector::borrow(bytes, offset + i) as u128);
-            result = result | (byte << ((i * 8) as u8));
-            i = i + 1;
-        };
-        result
+        from_bcs::to_u128(vector::slice(bytes, offset, offset + 16))
     }
 
-    /// Convert bytes to u256
+    /// Convert the first 32 bytes to u256 (little-endian, as BCS encodes it)
     fun bytes_to_u256(bytes: &vector<u8>): u256 {
-        let len = vector::length(bytes);
-        let result: u256 = 0;
-        let i = 0;
-        while (i < 32 && i < len) {
-            let byte = (*vector::borrow(bytes, i) as u256);
-            result = result | (byte << ((i * 8) as u8));
-            i = i + 1;
-        };
-        result
+        from_bcs::to_u256(vector::slice(bytes, 0, 32))
     }
 
     // ========================================================================
@@ -133,13 +113,13 @@ module inferenco::randomness {
     // ========================================================================
 
     /// Generate random u8
-    public fun u8_integer(): u8 acquires RandomnessCounter {
+    public fun u8_integer(): u8 {
         let bytes = next_bytes();
         (*vector::borrow(&bytes, 0) as u8)
     }
 
     /// Generate random u16
-    public fun u16_integer(): u16 acquires RandomnessCounter {
+    public fun u16_integer(): u16 {
         let bytes = next_bytes();
         let b0 = (*vector::borrow(&bytes, 0) as u16);
         let b1 = (*vector::borrow(&bytes, 1) as u16);
@@ -147,7 +127,7 @@ module inferenco::randomness {
     }
 
     /// Generate random u32
-    public fun u32_integer(): u32 acquires RandomnessCounter {
+    public fun u32_integer(): u32 {
         let bytes = next_bytes();
         let b0 = (*vector::borrow(&bytes, 0) as u32);
         let b1 = (*vector::borrow(&bytes, 1) as u32);
@@ -157,19 +137,19 @@ module inferenco::randomness {
     }
 
     /// Generate random u64
-    public fun u64_integer(): u64 acquires RandomnessCounter {
+    public fun u64_integer(): u64 {
         let bytes = next_bytes();
         bytes_to_u64(&bytes, 0)
     }
 
     /// Generate random u128
-    public fun u128_integer(): u128 acquires RandomnessCounter {
+    public fun u128_integer(): u128 {
         let bytes = next_bytes();
         bytes_to_u128(&bytes, 0)
     }
 
     /// Generate random u256
-    public fun u256_integer(): u256 acquires RandomnessCounter {
+    public fun u256_integer(): u256 {
         let bytes = next_bytes();
         bytes_to_u256(&bytes)
     }
@@ -179,7 +159,7 @@ module inferenco::randomness {
     // ========================================================================
 
     /// Generate random u8 in range [min, max)
-    public fun u8_range(min: u8, max: u8): u8 acquires RandomnessCounter {
+    public fun u8_range(min: u8, max: u8): u8 {
         assert!(max > min, E_INVALID_RANGE);
         let range = max - min;
         let random = u8_integer();
@@ -187,7 +167,7 @@ module inferenco::randomness {
     }
 
     /// Generate random u16 in range [min, max)
-    public fun u16_range(min: u16, max: u16): u16 acquires RandomnessCounter {
+    public fun u16_range(min: u16, max: u16): u16 {
         assert!(max > min, E_INVALID_RANGE);
         let range = max - min;
         let random = u16_integer();
@@ -195,7 +175,7 @@ module inferenco::randomness {
     }
 
     /// Generate random u32 in range [min, max)
-    public fun u32_range(min: u32, max: u32): u32 acquires RandomnessCounter {
+    public fun u32_range(min: u32, max: u32): u32 {
         assert!(max > min, E_INVALID_RANGE);
         let range = max - min;
         let random = u32_integer();
@@ -203,7 +183,7 @@ module inferenco::randomness {
     }
 
     /// Generate random u64 in range [min, max)
-    public fun u64_range(min: u64, max: u64): u64 acquires RandomnessCounter {
+    public fun u64_range(min: u64, max: u64): u64 {
         assert!(max > min, E_INVALID_RANGE);
         let range = max - min;
         let random = u64_integer();
@@ -211,7 +191,7 @@ module inferenco::randomness {
     }
 
     /// Generate random u128 in range [min, max)
-    public fun u128_range(min: u128, max: u128): u128 acquires RandomnessCounter {
+    public fun u128_range(min: u128, max: u128): u128 {
         assert!(max > min, E_INVALID_RANGE);
         let range = max - min;
         let random = u128_integer();
@@ -219,7 +199,7 @@ module inferenco::randomness {
     }
 
     /// Generate random u256 in range [min, max)
-    public fun u256_range(min: u256, max: u256): u256 acquires RandomnessCounter {
+    public fun u256_range(min: u256, max: u256): u256 {
         assert!(max > min, E_INVALID_RANGE);
         let range = max - min;
         let random = u256_integer();
@@ -231,26 +211,36 @@ module inferenco::randomness {
     // ========================================================================
 
     /// Generate n random bytes
-    public fun bytes(n: u64): vector<u8> acquires RandomnessCounter {
-        let result = vector::empty<u8>();
-        let i = 0;
+    ///
+    /// Counter mode: one next_bytes() call gives a 32-byte seed, which is
+    /// also the first block; block i > 0 is sha3_256(seed || bcs(i as u64)).
+    /// Blocks are appended whole and the tail trimmed to n, so large
+    /// requests cost one hash per 32 bytes and no per-byte copying.
+    /// bytes(n) for n <= 32 is unchanged from the per-block version.
+    public fun bytes(n: u64): vector<u8> {
+        if (n == 0) {
+            return vector::empty()
+        };
 
-        while (i < n) {
-            let chunk = next_bytes();
-            let j = 0;
-            while (j < vector::length(&chunk) && i < n) {
-                vector::push_back(&mut result, *vector::borrow(&chunk, j));
-                i = i + 1;
-                j = j + 1;
-            };
+        let seed = next_bytes();
+        let result = copy seed;
+        let counter = 1u64;
+        while (vector::length(&result) < n) {
+            let block = copy seed;
+            vector::append(&mut block, bcs::to_bytes(&counter));
+            vector::append(&mut result, hash::sha3_256(block));
+            counter = counter + 1;
         };
 
+        if (vector::length(&result) > n) {
+            vector::trim(&mut result, n);
+        };
         result
     }
 
     /// Generate random permutation of [0, n)
     /// Uses Fisher-Yates shuffle algorithm
-    public fun permutation(n: u64): vector<u64> acquires RandomnessCounter {
+    public fun permutation(n: u64): vector<u64> {
         let result = vector::empty<u64>();
 
         // Initialize array [0, 1, 2, ..., n-1]
@@ -277,7 +267,7 @@ module inferenco::randomness {
     }
 
     /// Shuffle a vector in place
-    public fun shuffle<T: drop>(vec: &mut vector<T>) acquires RandomnessCounter {
+    public fun shuffle<T: drop>(vec: &mut vector<T>) {
         let n = vector::length(vec);
         if (n <= 1) return;
 
@@ -293,7 +283,7 @@ module inferenco::randomness {
     }
 
     /// Pick a random element from a vector
-    public fun pick<T: copy>(vec: &vector<T>): T acquires RandomnessCounter {
+    public fun pick<T: copy>(vec: &vector<T>): T {
         let len = vector::length(vec);
         assert!(len > 0, E_EMPTY_VECTOR);
 
@@ -303,7 +293,7 @@ module inferenco::randomness {
 
     /// Weighted random selection
     /// weights must sum to > 0
-    public fun weighted_choice(weights: &vector<u64>): u64 acquires RandomnessCounter {
+    public fun weighted_choice(weights: &vector<u64>): u64 {
         let len = vector::length(weights);
         assert!(len > 0, E_EMPTY_VECTOR);
 
@@ -337,7 +327,7 @@ module inferenco::randomness {
 
     /// Boolean random with given probability (0-100)
     /// probability = 0 means always false, 100 means always true
-    public fun boolean(probability: u8): bool acquires RandomnessCounter {
+    public fun boolean(probability: u8): bool {
         assert!(probability <= 100, E_INVALID_RANGE);
         let random = u8_range(0, 100);
         random < probability
@@ -348,12 +338,12 @@ module inferenco::randomness {
     // ========================================================================
 
     /// Roll a die with n sides (1 to n inclusive)
-    public fun dice_roll(sides: u64): u64 acquires RandomnessCounter {
+    public fun dice_roll(sides: u64): u64 {
         u64_range(1, sides + 1)
     }
 
     /// Roll multiple dice and sum the results
-    public fun dice_roll_sum(num_dice: u64, sides: u64): u64 acquires RandomnessCounter {
+    public fun dice_roll_sum(num_dice: u64, sides: u64): u64 {
         let sum = 0;
         let i = 0;
         while (i < num_dice) {
@@ -364,12 +354,12 @@ module inferenco::randomness {
     }
 
     /// Flip a coin (returns true for heads, false for tails)
-    public fun coin_flip(): bool acquires RandomnessCounter {
+    public fun coin_flip(): bool {
         u64_range(0, 2) == 0
     }
 
     /// Critical hit check with percentage chance
-    public fun critical_hit(crit_chance_percent: u8): bool acquires RandomnessCounter {
+    public fun critical_hit(crit_chance_percent: u8): bool {
         boolean(crit_chance_percent)
     }
 
@@ -383,6 +373,7 @@ module inferenco::randomness {
     }
 
     #[view]
+    /// Legacy counter value; stays at 0 now that randomness doesn't advance it
     public fun get_counter(): u64 acquires RandomnessCounter {
         assert!(exists<RandomnessCounter>(@inferenco), E_NOT_INITIALIZED);
         borrow_global<RandomnessCounter>(@inferenco).counter
@@ -400,7 +391,7 @@ module inferenco::randomness {
     }
 
     #[test(account = @inferenco, framework = @0x1)]
-    fun test_u64_integer(account: &signer, framework: &signer) acquires RandomnessCounter {
+    fun test_u64_integer(account: &signer, framework: &signer) {
         timestamp::set_time_has_started_for_testing(framework);
         initialize(account);
 
@@ -412,7 +403,7 @@ module inferenco::randomness {
     }
 
     #[test(account = @inferenco, framework = @0x1)]
-    fun test_u64_range(account: &signer, framework: &signer) acquires RandomnessCounter {
+    fun test_u64_range(account: &signer, framework: &signer) {
         timestamp::set_time_has_started_for_testing(framework);
         initialize(account);
 
@@ -425,7 +416,7 @@ module inferenco::randomness {
     }
 
     #[test(account = @inferenco, framework = @0x1)]
-    fun test_permutation(account: &signer, framework: &signer) acquires RandomnessCounter {
+    fun test_permutation(account: &signer, framework: &signer) {
         timestamp::set_time_has_started_for_testing(framework);
         initialize(account);
 
@@ -441,7 +432,7 @@ module inferenco::randomness {
     }
 
     #[test(account = @inferenco, framework = @0x1)]
-    fun test_dice_roll(account: &signer, framework: &signer) acquires RandomnessCounter {
+    fun test_dice_roll(account: &signer, framework: &signer) {
         timestamp::set_time_has_started_for_testing(framework);
         initialize(account);
 
@@ -453,8 +444,157 @@ module inferenco::randomness {
         };
     }
 
+    #[test(framework = @0x1)]
+    fun test_works_without_initialize(framework: &signer) {
+        // No RandomnessCounter exists, so any global access would abort.
+        timestamp::set_time_has_started_for_testing(framework);
+        assert!(!is_initialized(), 0);
+
+        let r1 = u64_integer();
+        let r2 = u64_integer();
+        assert!(r1 != r2, 1);
+        let perm = permutation(52);
+        assert!(vector::length(&perm) == 52, 2);
+    }
+
+    #[test(account = @inferenco, framework = @0x1)]
+    fun test_no_shared_counter_writes(account: &signer, framework: &signer) acquires RandomnessCounter {
+        timestamp::set_time_has_started_for_testing(framework);
+        initialize(account);
+
+        let _ = bytes(256);
+        let _ = permutation(10);
+        let _ = dice_roll_sum(5, 6);
+        assert!(get_counter() == 0, 0);
+    }
+
+    #[test(framework = @0x1)]
+    fun test_unique_within_transaction(framework: &signer) {
+        timestamp::set_time_has_started_for_testing(framework);
+
+        let seen = vector::empty<u256>();
+        let i = 0;
+        while (i < 64) {
+            let r = u256_integer();
+            assert!(!vector::contains(&seen, &r), 0);
+            vector::push_back(&mut seen, r);
+            i = i + 1;
+        };
+    }
+
+    #[test_only]
+    /// The original bytes(n): one next_bytes() call per 32 bytes, copied byte by byte.
+    /// Kept to benchmark against (see the bench_* tests).
+    public fun legacy_bytes(n: u64): vector<u8> {
+        let result = vector::empty<u8>();
+        let i = 0;
+
+        while (i < n) {
+            let chunk = next_bytes();
+            let j = 0;
+            while (j < vector::length(&chunk) && i < n) {
+                vector::push_back(&mut result, *vector::borrow(&chunk, j));
+                i = i + 1;
+                j = j + 1;
+            };
+        };
+
+        result
+    }
+
+    #[test(framework = @0x1)]
+    fun test_bytes_lengths(framework: &signer) {
+        timestamp::set_time_has_started_for_testing(framework);
+
+        let sizes = vector[0, 1, 31, 32, 33, 64, 100, 4096];
+        let i = 0;
+        while (i < vector::length(&sizes)) {
+            let n = *vector::borrow(&sizes, i);
+            assert!(vector::length(&bytes(n)) == n, i);
+            i = i + 1;
+        };
+    }
+
+    #[test(framework = @0x1)]
+    fun test_bytes_blocks_differ(framework: &signer) {
+        timestamp::set_time_has_started_for_testing(framework);
+
+        let out = bytes(96);
+        let first = vector::slice(&out, 0, 32);
+        let second = vector::slice(&out, 32, 64);
+        let third = vector::slice(&out, 64, 96);
+        assert!(first != second && second != third && first != third, 0);
+
+        // Block 1 is sha3_256(seed || bcs(1u64)), where the seed is block 0
+        let block = copy first;
+        vector::append(&mut block, bcs::to_bytes(&1u64));
+        assert!(hash::sha3_256(block) == second, 1);
+    }
+
+    #[test]
+    fun test_converters() {
+        let bytes = x"0102030405060708090a0b0c0d0e0f101112131415161718191a1b1c1d1e1f20";
+        assert!(bytes_to_u64(&bytes, 0) == 0x0807060504030201, 0);
+        assert!(bytes_to_u64(&bytes, 8) == 0x100f0e0d0c0b0a09, 1);
+        // Not enough bytes after the offset: read from the start instead
+        assert!(bytes_to_u64(&bytes, 30) == 0x0807060504030201, 2);
+        assert!(bytes_to_u128(&bytes, 16) == 0x201f1e1d1c1b1a191817161514131211, 3);
+        assert!(bytes_to_u256(&bytes) == 0x201f1e1d1c1b1a191817161514131211100f0e0d0c0b0a090807060504030201, 4);
+    }
+
+    // Gas benchmarks: the same sizes through the counter-mode and the original
+    // path. Compare them with `python3 scripts/bench/move_gas.py`.
+
+    #[test(framework = @0x1)]
+    fun bench_bytes_32(framework: &signer) {
+        timestamp::set_time_has_started_for_testing(framework);
+        assert!(vector::length(&bytes(32)) == 32, 0);
+    }
+
+    #[test(framework = @0x1)]
+    fun bench_legacy_bytes_32(framework: &signer) {
+        timestamp::set_time_has_started_for_testing(framework);
+        assert!(vector::length(&legacy_bytes(32)) == 32, 0);
+    }
+
+    #[test(framework = @0x1)]
+    fun bench_bytes_256(framework: &signer) {
+        timestamp::set_time_has_started_for_testing(framework);
+        assert!(vector::length(&bytes(256)) == 256, 0);
+    }
+
+    #[test(framework = @0x1)]
+    fun bench_legacy_bytes_256(framework: &signer) {
+        timestamp::set_time_has_started_for_testing(framework);
+        assert!(vector::length(&legacy_bytes(256)) == 256, 0);
+    }
+
+    #[test(framework = @0x1)]
+    fun bench_bytes_1024(framework: &signer) {
+        timestamp::set_time_has_started_for_testing(framework);
+        assert!(vector::length(&bytes(1024)) == 1024, 0);
+    }
+
+    #[test(framework = @0x1)]
+    fun bench_legacy_bytes_1024(framework: &signer) {
+        timestamp::set_time_has_started_for_testing(framework);
+        assert!(vector::length(&legacy_bytes(1024)) == 1024, 0);
+    }
+
+    #[test(framework = @0x1)]
+    fun bench_bytes_4096(framework: &signer) {
+        timestamp::set_time_has_started_for_testing(framework);
+        assert!(vector::length(&bytes(4096)) == 4096, 0);
+    }
+
+    #[test(framework = @0x1)]
+    fun bench_legacy_bytes_4096(framework: &signer) {
+        timestamp::set_time_has_started_for_testing(framework);
+        assert!(vector::length(&legacy_bytes(4096)) == 4096, 0);
+    }
+
     #[test(account = @inferenco, framework = @0x1)]
-    fun test_weighted_choice(account: &signer, framework: &signer) acquires RandomnessCounter {
+    fun test_weighted_choice(account: &signer, framework: &signer) {
         timestamp::set_time_has_started_for_testing(framework);
         initialize(account);
 
@@ -0,0 +1,269 @@
+/// Precomputed loot tables
+///
+/// `randomness::weighted_choice` sums the weights and scans them linearly on
+/// every call. A registered table stores the prefix sums of its weights once,
+/// when it is registered or updated, and each draw is one
+/// `randomness::u64_range(0, total)` followed by a binary search: O(log n)
+/// per item instead of two O(n) passes.
+///
+/// For the same entropy a draw returns exactly the index
+/// `randomness::weighted_choice(&weights)` would (the first entry whose
+/// running total exceeds the drawn value, zero-weight entries are never
+/// chosen), so existing tables can move over without changing any odds.
+module inferenco::loot_tables {
+    use std::signer;
+    use std::vector;
+    use cedra_framework::event;
+    use inferenco::randomness;
+
+    /// Errors
+    const E_EMPTY_TABLE: u64 = 1;
+    const E_ZERO_WEIGHT: u64 = 2;
+    const E_NO_TABLE: u64 = 3;
+    const E_INVALID_COUNT: u64 = 4;
+
+    /// Upper bound on draws per transaction, keeps events (and gas) bounded
+    const MAX_DRAWS: u64 = 256;
+
+    struct LootTable has store, drop {
+        /// prefix[i] = weights[0] + ... + weights[i]
+        prefix: vector<u64>,
+    }
+
+    /// All tables registered by one account, addressed by their index
+    struct LootTables has key {
+        tables: vector<LootTable>,
+    }
+
+    #[event]
+    struct TableRegistered has drop, store {
+        owner: address,
+        table_id: u64,
+        entries: u64,
+        total_weight: u64,
+    }
+
+    #[event]
+    struct LootDrawn has drop, store {
+        player: address,
+        owner: address,
+        table_id: u64,
+        indices: vector<u64>,
+    }
+
+    /// Running totals of `weights`; aborts if it's empty or sums to zero
+    public fun prefix_sums(weights: &vector<u64>): vector<u64> {
+        let len = vector::length(weights);
+        assert!(len > 0, E_EMPTY_TABLE);
+
+        let prefix = vector::empty<u64>();
+        let total = 0u64;
+        let i = 0;
+        while (i < len) {
+            total = total + *vector::borrow(weights, i);
+            vector::push_back(&mut prefix, total);
+            i = i + 1;
+        };
+
+        assert!(total > 0, E_ZERO_WEIGHT);
+        prefix
+    }
+
+    /// First index whose running total is greater than `value` (`value` < total)
+    public fun sample_index(prefix: &vector<u64>, value: u64): u64 {
+        let lo = 0;
+        let hi = vector::length(prefix);
+        while (lo < hi) {
+            let mid = (lo + hi) / 2;
+            if (*vector::borrow(prefix, mid) > value) {
+                hi = mid
+            } else {
+                lo = mid + 1
+            };
+        };
+        lo
+    }
+
+    /// `weighted_choice` over precomputed prefix sums
+    public fun choose_prefix(prefix: &vector<u64>): u64 {
+        let total = *vector::borrow(prefix, vector::length(prefix) - 1);
+        sample_index(prefix, randomness::u64_range(0, total))
+    }
+
+    /// Register a table with the given weights; its id is the number of tables registered before it
+    public entry fun register_table(owner: &signer, weights: vector<u64>) acquires LootTables {
+        let addr = signer::address_of(owner);
+        if (!exists<LootTables>(addr)) {
+            move_to(owner, LootTables { tables: vector::empty() });
+        };
+        let tables = &mut borrow_global_mut<LootTables>(addr).tables;
+        let prefix = prefix_sums(&weights);
+        let table_id = vector::length(tables);
+        emit_registered(addr, table_id, &prefix);
+        vector::push_back(tables, LootTable { prefix });
+    }
+
+    /// Replace the weights of an existing table
+    public entry fun update_table(owner: &signer, table_id: u64, weights: vector<u64>) acquires LootTables {
+        let addr = signer::address_of(owner);
+        let table = borrow_table_mut(addr, table_id);
+        table.prefix = prefix_sums(&weights);
+        emit_registered(addr, table_id, &table.prefix);
+    }
+
+    /// Draw `count` entries from `owner`'s table `table_id`, emitted as `LootDrawn`
+    public entry fun draw(player: &signer, owner: address, table_id: u64, count: u64) acquires LootTables {
+        assert!(count > 0 && count <= MAX_DRAWS, E_INVALID_COUNT);
+        let indices = choose_many(owner, table_id, count);
+        event::emit(LootDrawn { player: signer::address_of(player), owner, table_id, indices });
+    }
+
+    /// One weighted draw from a registered table
+    public fun choose(owner: address, table_id: u64): u64 acquires LootTables {
+        choose_prefix(&borrow_table(owner, table_id).prefix)
+    }
+
+    /// `count` weighted draws from a registered table
+    public fun choose_many(owner: address, table_id: u64, count: u64): vector<u64> acquires LootTables {
+        let prefix = &borrow_table(owner, table_id).prefix;
+        let indices = vector::empty<u64>();
+        let i = 0;
+        while (i < count) {
+            vector::push_back(&mut indices, choose_prefix(prefix));
+            i = i + 1;
+        };
+        indices
+    }
+
+    #[view]
+    /// Prefix sums of a registered table
+    public fun table(owner: address, table_id: u64): vector<u64> acquires LootTables {
+        borrow_table(owner, table_id).prefix
+    }
+
+    #[view]
+    public fun table_count(owner: address): u64 acquires LootTables {
+        if (!exists<LootTables>(owner)) {
+            return 0
+        };
+        vector::length(&borrow_global<LootTables>(owner).tables)
+    }
+
+    fun borrow_table(owner: address, table_id: u64): &LootTable acquires LootTables {
+        assert!(exists<LootTables>(owner), E_NO_TABLE);
+        let tables = &borrow_global<LootTables>(owner).tables;
+        assert!(table_id < vector::length(tables), E_NO_TABLE);
+        vector::borrow(tables, table_id)
+    }
+
+    fun borrow_table_mut(owner: address, table_id: u64): &mut LootTable acquires LootTables {
+        assert!(exists<LootTables>(owner), E_NO_TABLE);
+        let tables = &mut borrow_global_mut<LootTables>(owner).tables;
+        assert!(table_id < vector::length(tables), E_NO_TABLE);
+        vector::borrow_mut(tables, table_id)
+    }
+
+    fun emit_registered(owner: address, table_id: u64, prefix: &vector<u64>) {
+        let entries = vector::length(prefix);
+        event::emit(TableRegistered {
+            owner,
+            table_id,
+            entries,
+            total_weight: *vector::borrow(prefix, entries - 1),
+        });
+    }
+
+    // ========================================================================
+    // TESTS
+    // ========================================================================
+
+    #[test_only]
+    use cedra_framework::timestamp;
+
+    #[test_only]
+    fun setup(account: &signer, framework: &signer) {
+        timestamp::set_time_has_started_for_testing(framework);
+        randomness::initialize(account);
+    }
+
+    #[test_only]
+    /// The linear scan `randomness::weighted_choice` does for a drawn value
+    fun linear_index(weights: &vector<u64>, value: u64): u64 {
+        let cumulative = 0;
+        let i = 0;
+        while (i < vector::length(weights)) {
+            cumulative = cumulative + *vector::borrow(weights, i);
+            if (value < cumulative) {
+                return i
+            };
+            i = i + 1;
+        };
+        vector::length(weights) - 1
+    }
+
+    #[test]
+    fun test_sample_index_matches_linear_scan() {
+        let weights = vector[0, 3, 0, 0, 5, 1, 0, 2];
+        let prefix = prefix_sums(&weights);
+        assert!(prefix == vector[0, 3, 3, 3, 8, 9, 9, 11], 0);
+
+        let value = 0;
+        while (value < 11) {
+            assert!(sample_index(&prefix, value) == linear_index(&weights, value), value);
+            value = value + 1;
+        };
+    }
+
+    #[test(account = @inferenco, framework = @0x1)]
+    fun test_register_and_draw(account: &signer, framework: &signer) acquires LootTables {
+        setup(account, framework);
+
+        register_table(account, vector[50, 30, 15, 4, 1]);
+        register_table(account, vector[1, 0, 1]);
+        assert!(table_count(@inferenco) == 2, 0);
+        assert!(table(@inferenco, 0) == vector[50, 80, 95, 99, 100], 1);
+
+        draw(account, @inferenco, 1, 100);
+        let events = event::emitted_events<LootDrawn>();
+        let indices = &vector::borrow(&events, 0).indices;
+        assert!(vector::length(indices) == 100, 2);
+        let i = 0;
+        while (i < 100) {
+            // The zero-weight entry is never drawn
+            let index = *vector::borrow(indices, i);
+            assert!(index == 0 || index == 2, 3);
+            i = i + 1;
+        };
+    }
+
+    #[test(account = @inferenco, framework = @0x1)]
+    fun test_update_table(account: &signer, framework: &signer) acquires LootTables {
+        setup(account, framework);
+
+        register_table(account, vector[1, 1]);
+        update_table(account, 0, vector[0, 0, 7]);
+        assert!(table(@inferenco, 0) == vector[0, 0, 7], 0);
+        assert!(choose(@inferenco, 0) == 2, 1);
+
+        let events = event::emitted_events<TableRegistered>();
+        assert!(vector::length(&events) == 2, 2);
+        assert!(vector::borrow(&events, 1).total_weight == 7, 3);
+    }
+
+    #[test(account = @inferenco, framework = @0x1)]
+    #[expected_failure(abort_code = E_ZERO_WEIGHT)]
+    fun test_zero_total(account: &signer, framework: &signer) acquires LootTables {
+        setup(account, framework);
+
+        register_table(account, vector[0, 0]);
+    }
+
+    #[test(account = @inferenco, framework = @0x1)]
+    #[expected_failure(abort_code = E_NO_TABLE)]
+    fun test_unknown_table(account: &signer, framework: &signer) acquires LootTables {
+        setup(account, framework);
+
+        register_table(account, vector[1]);
+        choose(@inferenco, 1);
+    }
+}